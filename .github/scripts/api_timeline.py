@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""Persistent index of when each workflow/action input, secret and output changed.
+
+Usage:
+    python scripts/api_timeline.py KEY [NAME] [--kind workflow|action] [--db PATH]
+
+The index is an SQLite database (.cache/api-timeline.sqlite by default)
+filled by generate_changelog.py: for every release it stores the inputs,
+secrets and outputs that were added, modified or removed relative to the
+release it is diffed against.  The CLI prints that history for one
+workflow or action (optionally a single input/secret/output).  The docs
+generator reads :meth:`ApiTimeline.since` to annotate each table row with
+the release it first appeared in.  Renamed workflows and actions are
+recorded too, so their history carries over to the new name.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+ROOT_DIR = SCRIPT_DIR.parent  # .github/ (inner)
+
+TIMELINE_PATH = ROOT_DIR / ".cache" / "api-timeline.sqlite"
+
+# (section, name, change, details) — section is "input", "secret" or "output",
+# change is "added", "removed" or "modified".
+Event = tuple[str, str, str, str]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS releases (
+    name TEXT PRIMARY KEY,
+    rank INTEGER NOT NULL,      -- semver order
+    previous TEXT,              -- release this one was diffed against
+    key TEXT NOT NULL           -- old@sha..new@sha, as in the changelog cache
+);
+CREATE TABLE IF NOT EXISTS events (
+    release TEXT NOT NULL REFERENCES releases(name) ON DELETE CASCADE,
+    kind TEXT NOT NULL,         -- "workflow" or "action"
+    key TEXT NOT NULL,          -- workflow/action identifier
+    section TEXT NOT NULL,
+    name TEXT NOT NULL,
+    change TEXT NOT NULL,
+    details TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS events_by_item ON events (kind, key);
+CREATE TABLE IF NOT EXISTS renames (
+    release TEXT NOT NULL REFERENCES releases(name) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,          -- identifier at this release
+    old_key TEXT NOT NULL       -- identifier at the previous release
+);
+"""
+
+
+class ApiTimeline:
+    """SQLite-backed API timeline; see the module docstring.
+
+    The whole index is tied to *stamp* (the changelog generator's), so a
+    change to the diff engine discards it.  Releases whose key still
+    matches are kept as-is, which makes an update cost proportional to
+    the number of new or moved tags.
+    """
+
+    def __init__(self, path: Path | str, stamp: str = "") -> None:
+        import sqlite3  # not needed by importers that only want TIMELINE_PATH
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.executescript(_SCHEMA)
+        if stamp:
+            row = self._db.execute("SELECT value FROM meta WHERE key = 'stamp'").fetchone()
+            if row is None or row[0] != stamp:
+                self._db.execute("DELETE FROM releases")
+                self._db.execute("INSERT OR REPLACE INTO meta VALUES ('stamp', ?)", (stamp,))
+        self._previous: dict[str, str | None] | None = None
+        self._renames: dict[tuple[str, str, str], str] | None = None
+        self._renamed_away: set[tuple[str, str, str]] = set()
+
+    @classmethod
+    def open_existing(cls, path: Path | str = TIMELINE_PATH) -> ApiTimeline | None:
+        """Open the index at *path* for reading, or return None if there is none."""
+        if not Path(path).exists():
+            return None
+        return cls(path)
+
+    def close(self) -> None:
+        self._db.close()
+
+    # --- writing ----------------------------------------------------------
+
+    def release_key(self, release: str) -> str | None:
+        """Return the key *release* was indexed under, if it is indexed."""
+        row = self._db.execute(
+            "SELECT key FROM releases WHERE name = ?", (release,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def put_release(
+        self,
+        release: str,
+        rank: int,
+        previous: str | None,
+        key: str,
+        events: dict[tuple[str, str], list[Event]],
+        renames: dict[tuple[str, str], str] | None = None,
+    ) -> None:
+        """Replace *release*'s events; *events* maps ``(kind, key)`` to its changes.
+
+        *renames* maps the ``(kind, key)`` of files renamed since *previous*
+        to their old key.
+        """
+        self._db.execute("DELETE FROM releases WHERE name = ?", (release,))
+        self._db.execute(
+            "INSERT INTO releases VALUES (?, ?, ?, ?)", (release, rank, previous, key)
+        )
+        self._db.executemany(
+            "INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (release, kind, item, *event)
+                for (kind, item), item_events in events.items()
+                for event in item_events
+            ],
+        )
+        self._db.executemany(
+            "INSERT INTO renames VALUES (?, ?, ?, ?)",
+            [(release, kind, item, old_key) for (kind, item), old_key in (renames or {}).items()],
+        )
+        self._previous = None
+        self._renames = None
+
+    def set_rank(self, release: str, rank: int) -> None:
+        self._db.execute("UPDATE releases SET rank = ? WHERE name = ?", (rank, release))
+
+    def retain(self, releases: list[str]) -> None:
+        """Drop every indexed release not in *releases* (deleted tags)."""
+        keep = set(releases)
+        stale = [
+            (name,) for (name,) in self._db.execute("SELECT name FROM releases")
+            if name not in keep
+        ]
+        self._db.executemany("DELETE FROM releases WHERE name = ?", stale)
+        self._previous = None
+        self._renames = None
+
+    def commit(self) -> None:
+        self._db.commit()
+
+    # --- reading ----------------------------------------------------------
+
+    def _chain(self, release: str) -> list[str]:
+        """Return *release* and the releases it descends from, newest first."""
+        if self._previous is None:
+            self._previous = dict(self._db.execute("SELECT name, previous FROM releases"))
+        chain: list[str] = []
+        current: str | None = release
+        while current is not None and current in self._previous and current not in chain:
+            chain.append(current)
+            current = self._previous[current]
+        return chain
+
+    def _keys(self, chain: list[str], kind: str, key: str) -> dict[str, str]:
+        """Return the identifier *key* had at each release of *chain*, following renames.
+
+        Releases before *key* was renamed away (to another file) are left
+        out: a later file reusing the name doesn't inherit that history.
+        """
+        if self._renames is None:
+            self._renames = {}
+            self._renamed_away = set()
+            for rel, k, new, old in self._db.execute("SELECT * FROM renames"):
+                self._renames[(rel, k, new)] = old
+                self._renamed_away.add((rel, k, old))
+        keys: dict[str, str] = {}
+        for rel in chain:
+            if (rel, kind, key) in self._renamed_away:
+                break
+            keys[rel] = key
+            key = self._renames.get((rel, kind, key), key)
+        return keys
+
+    def since(self, kind: str, key: str, release: str) -> dict[tuple[str, str], str]:
+        """Return ``{(section, name): version}`` for everything *key* has at *release*.
+
+        The version is the release each input/secret/output was (last)
+        added in along *release*'s ancestry, under the names *key* had
+        there.  One query per workflow or action; each table row is then a
+        dict lookup.
+        """
+        chain = self._chain(release)
+        if not chain:
+            return {}
+        keys = self._keys(chain, kind, key)
+        names = sorted(set(keys.values()))
+        by_release: dict[str, list[tuple[str, str, str]]] = {}
+        for rel, item, section, name, change in self._db.execute(
+            "SELECT release, key, section, name, change FROM events "
+            f"WHERE kind = ? AND key IN ({', '.join('?' * len(names))})",
+            (kind, *names),
+        ):
+            if keys.get(rel) == item:
+                by_release.setdefault(rel, []).append((section, name, change))
+
+        since: dict[tuple[str, str], str] = {}
+        decided: set[tuple[str, str]] = set()
+        for rel in chain:
+            for section, name, change in by_release.get(rel, ()):
+                item = (section, name)
+                if item in decided or change == "modified":
+                    continue
+                decided.add(item)
+                if change == "added":
+                    since[item] = rel
+        return since
+
+    def _former_keys(self, key: str) -> list[tuple[str, str, int | None]]:
+        """Return ``(kind, key, before)`` for *key* and every name it was renamed from.
+
+        Changes recorded under a former name only count in releases ranked
+        below *before* (the rename), so a later file that reuses the name
+        isn't mixed in.  *before* is None for *key* itself.
+        """
+        names: list[tuple[str, str, int | None]] = [
+            ("workflow", key, None),
+            ("action", key, None),
+        ]
+        for kind, current, before in names:
+            for old_key, rank in self._db.execute(
+                "SELECT n.old_key, r.rank FROM renames n JOIN releases r ON r.name = n.release "
+                "WHERE n.kind = ? AND n.key = ?",
+                (kind, current),
+            ):
+                if before is not None and rank >= before:
+                    continue  # a rename of the later file under this name
+                if not any((k, n) == (kind, old_key) for k, n, _ in names):
+                    names.append((kind, old_key, rank))
+        return names
+
+    def history(
+        self, key: str, name: str | None = None, kind: str | None = None
+    ) -> list[tuple[str, str, str, str, str, str]]:
+        """Return ``(release, kind, section, name, change, details)`` rows for *key*.
+
+        Changes recorded under the names *key* had before a rename are included.
+        """
+        clauses: list[str] = []
+        params: list = []
+        for item_kind, item, before in self._former_keys(key):
+            if before is None:
+                clauses.append("(e.kind = ? AND e.key = ?)")
+                params += [item_kind, item]
+            else:
+                clauses.append("(e.kind = ? AND e.key = ? AND r.rank < ?)")
+                params += [item_kind, item, before]
+        query = (
+            "SELECT e.release, e.kind, e.section, e.name, e.change, e.details "
+            "FROM events e JOIN releases r ON r.name = e.release "
+            f"WHERE ({' OR '.join(clauses)})"
+        )
+        if name is not None:
+            query += " AND e.name = ?"
+            params.append(name)
+        if kind is not None:
+            query += " AND e.kind = ?"
+            params.append(kind)
+        query += " ORDER BY r.rank, e.kind, e.section, e.name"
+        return self._db.execute(query, params).fetchall()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Show when a workflow/action's inputs, secrets and outputs changed",
+    )
+    parser.add_argument("key", help="Workflow or action identifier (e.g. ios-selfhosted-test)")
+    parser.add_argument("name", nargs="?", help="Only show this input, secret or output")
+    parser.add_argument("--kind", choices=["workflow", "action"], help="Restrict to one kind")
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=TIMELINE_PATH,
+        help=f"Timeline index (default: {TIMELINE_PATH.relative_to(ROOT_DIR)}; "
+             "built by generate_changelog.py)",
+    )
+    args = parser.parse_args()
+
+    timeline = ApiTimeline.open_existing(args.db)
+    if timeline is None:
+        print(f"No timeline index at {args.db}; run generate_changelog.py first.",
+              file=sys.stderr)
+        sys.exit(1)
+    rows = timeline.history(args.key, args.name, args.kind)
+    timeline.close()
+    if not rows:
+        print(f"No recorded changes for {args.key}" + (f" / {args.name}" if args.name else ""),
+              file=sys.stderr)
+        sys.exit(1)
+
+    width = max(len(row[0]) for row in rows)
+    for release, kind, section, name, change, details in rows:
+        line = f"{release:<{width}}  {kind} {section} `{name}` {change}"
+        if details:
+            line += f" ({details})"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Benchmark the changelog diff engine on a synthetic in-memory repository.
+
+Usage:
+    python scripts/benchmarks/changelog.py [--tags N] [--workflows N] [--seed N]
+                                           [--jobs N] [--profile PATH]
+
+Builds a MemoryBackend with N release tags over a registry of M workflows
+(plus M/4 actions), then renders every version through build_versions().
+No git process is involved, so timings reflect the diff engine and YAML
+parsing alone and are reproducible for a given seed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import pstats
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+ROOT_DIR = SCRIPT_DIR.parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from scripts import generate_changelog as changelog
+from scripts.git_backends.memory_backend import MemoryBackend
+
+AUTHORS = ["ssestak", "Šimon Šesták", "Ondrej Kalman", "xmadera", "Jan Novák"]
+
+
+def _render_yaml(name: str, inputs: dict[str, dict], secrets: dict[str, bool],
+                 is_action: bool, revision: int) -> str:
+    """Render a workflow or action YAML with the given API surface."""
+    lines = [f"name: {name}", ""]
+    indent = ""
+    if not is_action:
+        lines += ["on:", "  workflow_call:"]
+        indent = "    "
+    if inputs:
+        lines.append(f"{indent}inputs:")
+        for key, spec in inputs.items():
+            lines += [
+                f"{indent}  {key}:",
+                f"{indent}    description: 'Synthetic input {key}'",
+                f"{indent}    type: {spec['type']}",
+                f"{indent}    required: {str(spec['required']).lower()}",
+                f"{indent}    default: '{spec['default']}'",
+            ]
+    if secrets and not is_action:
+        lines.append(f"{indent}secrets:")
+        for key, required in secrets.items():
+            lines += [f"{indent}  {key}:", f"{indent}    required: {str(required).lower()}"]
+    lines.append("")
+    if is_action:
+        lines += ["runs:", "  using: composite", "  steps:"]
+        step_indent = "    "
+    else:
+        lines += ["jobs:", "  build:", "    runs-on: ubuntu-latest", "    steps:"]
+        step_indent = "      "
+    for step in range(8):
+        lines += [
+            f"{step_indent}- name: Step {step}",
+            f"{step_indent}  shell: bash",
+            f"{step_indent}  run: |",
+            f"{step_indent}    echo 'revision {revision} step {step}'",
+            f"{step_indent}    ./scripts/run.sh --flag-{step}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def build_synthetic_repo(n_tags: int, n_workflows: int, seed: int = 0) -> MemoryBackend:
+    """Return a repository with *n_tags* releases, each merged from a PR branch."""
+    rng = random.Random(seed)
+    repo = MemoryBackend()
+    start = date(2020, 1, 1)
+
+    files: dict[str, dict] = {}
+    for i in range(n_workflows):
+        files[f".github/workflows/synthetic-{i:04d}.yml"] = {"action": False}
+    for i in range(max(1, n_workflows // 4)):
+        files[f".github/actions/synthetic-{i:04d}/action.yml"] = {"action": True}
+    for path, state in files.items():
+        state.update(
+            name=Path(path).stem if not state["action"] else Path(path).parent.name,
+            inputs={
+                f"input_{k}": {"type": "string", "required": False, "default": "x"}
+                for k in range(rng.randint(1, 6))
+            },
+            secrets={f"SECRET_{k}": False for k in range(rng.randint(0, 3))},
+            revision=0,
+        )
+
+    def render(path: str) -> str:
+        s = files[path]
+        return _render_yaml(s["name"], s["inputs"], s["secrets"], s["action"], s["revision"])
+
+    repo.commit({path: render(path) for path in files}, "Initial commit",
+                author=rng.choice(AUTHORS), date=start.isoformat())
+    repo.tag("1.0.0")
+
+    paths = sorted(files)
+    for n in range(1, n_tags):
+        day = (start + timedelta(days=n)).isoformat()
+        base = repo.resolve_commit("HEAD")
+        changed: dict[str, str] = {}
+        for path in rng.sample(paths, k=min(len(paths), rng.randint(1, 6))):
+            state = files[path]
+            state["revision"] += 1
+            roll = rng.random()
+            if roll < 0.25:
+                state["inputs"][f"input_r{state['revision']}"] = {
+                    "type": "boolean", "required": False, "default": "false",
+                }
+            elif roll < 0.35 and len(state["inputs"]) > 1:
+                state["inputs"].pop(rng.choice(sorted(state["inputs"])))
+            elif roll < 0.55 and state["inputs"]:
+                key = rng.choice(sorted(state["inputs"]))
+                state["inputs"][key]["default"] = f"v{state['revision']}"
+            elif roll < 0.6 and not state["action"]:
+                state["secrets"][f"SECRET_R{state['revision']}"] = True
+            # Otherwise only the step bodies change (an internal change).
+            changed[path] = render(path)
+        feature = repo.commit(changed, f"Change {len(changed)} files",
+                              author=rng.choice(AUTHORS), date=day, parents=[base])
+        repo.commit(changed, f"Merge pull request #{n} from synthetic/change-{n}",
+                    author=rng.choice(AUTHORS), date=day, parents=[base, feature])
+        repo.tag(f"{1 + n // 100}.{(n // 10) % 10}.{n % 10}")
+    return repo
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark changelog generation")
+    parser.add_argument("--tags", type=int, default=500, help="Number of release tags")
+    parser.add_argument("--workflows", type=int, default=200, help="Number of workflows")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes")
+    parser.add_argument(
+        "--profile",
+        type=str,
+        default=None,
+        help="Write cProfile stats to PATH and print the top entries",
+    )
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    repo = build_synthetic_repo(args.tags, args.workflows, args.seed)
+    changelog.set_backend(repo)
+    t1 = time.perf_counter()
+    print(f"Built synthetic repo: {args.tags} tags x {args.workflows} workflows "
+          f"in {t1 - t0:.2f}s")
+
+    tags = changelog.get_sorted_tags()
+    pairs = [(tag, tags[i - 1] if i else None) for i, tag in enumerate(tags)]
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler:
+        profiler.enable()
+    t2 = time.perf_counter()
+    results = changelog.build_versions(pairs, args.jobs)
+    t3 = time.perf_counter()
+    if profiler:
+        profiler.disable()
+        profiler.dump_stats(args.profile)
+
+    total_diffs = sum(len(diffs) for _entry, diffs in results)
+    print(f"Rendered {len(results)} versions ({total_diffs} file diffs) "
+          f"in {t3 - t2:.2f}s ({(t3 - t2) / len(results) * 1000:.1f} ms/version)")
+
+    if profiler:
+        print(f"\nProfile written to {args.profile}\n")
+        pstats.Stats(args.profile).sort_stats("cumulative").print_stats(20)
+
+
+if __name__ == "__main__":
+    main()
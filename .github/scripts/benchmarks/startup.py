@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Cold-start benchmark: import cost of the docs generators, with a budget.
+
+Usage:
+    python scripts/benchmarks/startup.py [--rounds N] [--top N] [--budget-ms MS]
+
+Runs ``generate-docs.py --help`` and ``generate_changelog.py --help`` in a
+fresh interpreter under ``python -X importtime`` and reports the total
+import time plus the most expensive modules.  Modules the interpreter
+loads on its own (``python -c pass``) aren't counted.  The best of
+--rounds runs is kept.
+
+The exit status is 1 if any script goes over its budget (BUDGETS_MS, or
+--budget-ms for all of them) or imports one of the DEFERRED modules:
+those are only loaded once the phase that needs them starts, so seeing
+one here means a new module-level import crept in.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = SCRIPT_DIR.parent
+
+# Import-time budget per script, in milliseconds of ``-X importtime`` total
+# (which inflates real import time somewhat).  What's left is mostly the
+# standard library; with PyYAML, Jinja2 and friends loaded eagerly the two
+# measured about 180 and 120 ms.
+BUDGETS_MS: dict[str, float] = {
+    "generate-docs.py": 120.0,
+    "generate_changelog.py": 100.0,
+}
+
+# Heavy dependencies that --help must not import.
+DEFERRED: tuple[str, ...] = (
+    "yaml",
+    "jinja2",
+    "sqlite3",
+    "tracemalloc",
+    "concurrent.futures.process",
+)
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    depth: int
+    self_us: int
+    cumulative_us: int
+
+
+def _importtime(args: list[str]) -> tuple[list[ImportTiming], float]:
+    """Run ``python -X importtime *args*``; return its imports and wall time in ms."""
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True, text=True, check=True,
+    )
+    wall_ms = (time.perf_counter() - t0) * 1000
+
+    timings = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # header row
+        module = name.lstrip()
+        timings.append(ImportTiming(
+            module=module,
+            depth=(len(name) - len(module) - 1) // 2,
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+        ))
+    return timings, wall_ms
+
+
+def _total_us(timings: list[ImportTiming]) -> int:
+    """Total import time: the sum over top-level imports (they include their children)."""
+    return sum(t.cumulative_us for t in timings if t.depth == 0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark generator start-up imports")
+    parser.add_argument("--rounds", type=int, default=5, help="Runs per script (best is kept)")
+    parser.add_argument("--top", type=int, default=10, help="Modules to list per script")
+    parser.add_argument(
+        "--budget-ms", type=float, default=None,
+        help="Import-time budget for every script (default: BUDGETS_MS)",
+    )
+    args = parser.parse_args()
+
+    startup, _wall = _importtime(["-c", "pass"])
+    interpreter = {t.module for t in startup}
+
+    failures = []
+    for script, default_budget in BUDGETS_MS.items():
+        budget = args.budget_ms if args.budget_ms is not None else default_budget
+        best: list[ImportTiming] | None = None
+        best_wall = float("inf")
+        for _ in range(args.rounds):
+            timings, wall_ms = _importtime([str(SCRIPTS_DIR / script), "--help"])
+            timings = [t for t in timings if t.module not in interpreter]
+            if best is None or _total_us(timings) < _total_us(best):
+                best = timings
+            best_wall = min(best_wall, wall_ms)
+
+        total_ms = _total_us(best) / 1000
+        verdict = "ok" if total_ms <= budget else "OVER BUDGET"
+        deferred = sorted({t.module for t in best} & set(DEFERRED))
+        print(f"{script}: {total_ms:.1f} ms imports / {budget:.0f} ms budget ({verdict}), "
+              f"{len(best)} modules, {best_wall:.0f} ms wall for --help")
+        for t in sorted(best, key=lambda t: -t.cumulative_us)[:args.top]:
+            print(f"  {t.cumulative_us / 1000:7.1f} ms  {t.self_us / 1000:6.1f} ms self  "
+                  f"{'  ' * t.depth}{t.module}")
+        if deferred:
+            print(f"  Imported at start-up (should be deferred): {', '.join(deferred)}")
+        print()
+        if total_ms > budget or deferred:
+            failures.append(script)
+
+    if failures:
+        print(f"Start-up budget exceeded: {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
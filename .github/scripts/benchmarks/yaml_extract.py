@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark the event-based YAML extractor on the repo's real workflow files.
+
+Usage:
+    python scripts/benchmarks/yaml_extract.py [--rounds N]
+
+Loads every workflows/*.yml and actions/*/action.yml under .github/ with
+the pure-Python ``yaml.safe_load``, a full load through the libyaml C
+loader, and :func:`extract` with each fields spec the generators use, and
+checks that every extraction matches the corresponding full load.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import yaml
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+ROOT_DIR = SCRIPT_DIR.parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from scripts.parsers.yaml_extract import (
+    ACTION_FIELDS,
+    NAME_FIELDS,
+    WORKFLOW_API_FIELDS,
+    WORKFLOW_FIELDS,
+    Loader,
+    extract,
+)
+
+
+def _prune(value: Any, fields: Any) -> Any:
+    """Cut a fully loaded document down to *fields*, as extract() does."""
+    if isinstance(fields, dict) and isinstance(value, dict):
+        wildcard = fields.get("*")
+        return {
+            k: _prune(v, fields.get(k, wildcard))
+            for k, v in value.items()
+            if fields.get(k, wildcard) is not None
+        }
+    if isinstance(fields, list) and isinstance(value, list):
+        return [_prune(v, fields[0]) for v in value]
+    return value
+
+
+def _time(texts: list[str], load: Callable[[str], Any], rounds: int) -> float:
+    """Return the best per-round time in ms for loading every text."""
+    best = float("inf")
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        for text in texts:
+            load(text)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark YAML API extraction")
+    parser.add_argument("--rounds", type=int, default=5, help="Timing rounds (best is kept)")
+    args = parser.parse_args()
+
+    workflows = [p.read_text() for p in sorted((ROOT_DIR / "workflows").glob("*.yml"))]
+    actions = [p.read_text() for p in sorted((ROOT_DIR / "actions").glob("*/action.yml"))]
+    texts = workflows + actions
+    size = sum(len(t) for t in texts)
+    print(f"{len(workflows)} workflows + {len(actions)} actions ({size / 1024:.0f} KiB), "
+          f"C loader: {'yes' if Loader is not yaml.SafeLoader else 'no'}")
+
+    for group, fields in (
+        (workflows, WORKFLOW_FIELDS),
+        (workflows, WORKFLOW_API_FIELDS),
+        (actions, ACTION_FIELDS),
+        (texts, NAME_FIELDS),
+    ):
+        for text in group:
+            if extract(text, fields) != _prune(yaml.safe_load(text), fields):
+                sys.exit("extract() disagrees with yaml.safe_load")
+
+    cases = [
+        ("yaml.safe_load", texts, yaml.safe_load),
+        ("C loader, full", texts, lambda t: yaml.load(t, Loader=Loader)),
+        ("extract WORKFLOW_FIELDS", workflows, lambda t: extract(t, WORKFLOW_FIELDS)),
+        ("extract WORKFLOW_API_FIELDS", workflows, lambda t: extract(t, WORKFLOW_API_FIELDS)),
+        ("extract ACTION_FIELDS", actions, lambda t: extract(t, ACTION_FIELDS)),
+        ("extract NAME_FIELDS", texts, lambda t: extract(t, NAME_FIELDS)),
+    ]
+    baselines: dict[int, float] = {}
+    print(f"\n{'':30} {'files':>5} {'ms':>8} {'vs safe_load':>13}")
+    for label, group, load in cases:
+        if id(group) not in baselines:
+            baselines[id(group)] = _time(group, yaml.safe_load, args.rounds)
+        ms = _time(group, load, args.rounds)
+        print(f"{label:30} {len(group):5} {ms:8.1f} {baselines[id(group)] / ms:12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
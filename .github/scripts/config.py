@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterator, Mapping
 
-import yaml
+from scripts.parsers.documents import Document, load_document
+from scripts.profiling import phase
+
+if TYPE_CHECKING:
+    from scripts.registry_snapshot import RegistrySnapshot
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 
@@ -115,7 +120,7 @@ def _match_category(key: str, fallback: str) -> tuple[str, str]:
     return fallback, key
 
 
-def _derive_runner(key: str, yaml_text: str) -> str:
+def _derive_runner(key: str, doc: Document) -> str:
     """Derive the runner label from filename convention, falling back to YAML."""
     if "-combined-" in key:
         return "Self-hosted + ubuntu-latest"
@@ -124,37 +129,43 @@ def _derive_runner(key: str, yaml_text: str) -> str:
     if "-cloud-" in key:
         return "ubuntu-latest"
 
-    # Fallback: parse first runs-on value from YAML.
-    for line in yaml_text.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("runs-on:"):
-            value = stripped.split(":", 1)[1].strip()
-            # Normalise common variations.
-            if "self-hosted" in value.lower():
-                return "Self-hosted"
-            return value
-    return "ubuntu-latest"
+    # Fallback: first runs-on value from YAML.
+    value = doc.runs_on
+    if value is None:
+        return "ubuntu-latest"
+    # Normalise common variations.
+    if "self-hosted" in value.lower():
+        return "Self-hosted"
+    return value
 
 
-def _parse_yaml_name(path: Path) -> str:
-    """Return the top-level ``name`` field from a YAML file."""
-    with open(path) as f:
-        data = yaml.safe_load(f)
-    if data and isinstance(data, dict):
-        return data.get("name", path.stem)
-    return path.stem
+# ---------------------------------------------------------------------------
+# Auto-discovery
+# ---------------------------------------------------------------------------
 
+# Warm-start snapshot consulted by discovery; see set_registry_snapshot().
+_snapshot: RegistrySnapshot | None = None
 
-def _has_workflow_call(path: Path) -> bool:
-    """Return True if the workflow declares a ``workflow_call`` trigger."""
-    with open(path) as f:
-        text = f.read()
-    return "workflow_call" in text
 
+def workflow_fields(path: Path) -> dict:
+    """Entry fields read from the workflow file itself."""
+    doc = load_document(path, "workflow")
+    fields: dict = {"title": doc.name, "runner": _derive_runner(path.stem, doc)}
+    if not doc.reusable:
+        fields["not_reusable"] = True
+    return fields
 
-# ---------------------------------------------------------------------------
-# Auto-discovery
-# ---------------------------------------------------------------------------
+
+def action_fields(path: Path) -> dict:
+    """Entry fields read from the action file itself."""
+    return {"title": load_document(path, "action").name}
+
+
+def _read_fields(path: Path, read: Callable[[Path], dict]) -> dict:
+    """Return ``read(path)``, from the snapshot if *path* hasn't changed."""
+    if _snapshot is None:
+        return read(path)
+    return _snapshot.entry(path, lambda: read(path))
 
 
 def discover_workflows(root: Path) -> dict[str, dict]:
@@ -170,23 +181,14 @@ def discover_workflows(root: Path) -> dict[str, dict]:
             continue
 
         category, slug = _match_category(key, "universal")
-        title = _parse_yaml_name(path)
-
-        with open(path) as f:
-            yaml_text = f.read()
-        runner = _derive_runner(key, yaml_text)
 
         entry: dict = {
             "source": f"workflows/{path.name}",
             "category": category,
-            "title": title,
             "output": f"docs/workflows/{category}/{slug}.md",
-            "runner": runner,
+            **_read_fields(path, workflow_fields),
         }
 
-        if not _has_workflow_call(path):
-            entry["not_reusable"] = True
-
         readme = path.with_suffix(".md")
         if readme.exists():
             entry["readme"] = f"workflows/{readme.name}"
@@ -210,13 +212,12 @@ def discover_actions(root: Path) -> dict[str, dict]:
     for path in sorted(actions_dir.glob("*/action.yml")):
         key = path.parent.name
         category, slug = _match_category(key, "utility")
-        title = _parse_yaml_name(path)
 
         entry: dict = {
             "source": f"actions/{key}/action.yml",
             "category": category,
-            "title": title,
             "output": f"docs/actions/{category}/{slug}.md",
+            **_read_fields(path, action_fields),
         }
 
         readme = path.parent / "README.md"
@@ -236,5 +237,64 @@ def discover_actions(root: Path) -> dict[str, dict]:
 # Exported registries (same interface as before)
 # ---------------------------------------------------------------------------
 
-WORKFLOWS: dict[str, dict] = discover_workflows(ROOT_DIR)
-ACTIONS: dict[str, dict] = discover_actions(ROOT_DIR)
+
+class Registry(Mapping[str, dict]):
+    """Read-only ``{key: config entry}`` mapping, discovered on first access.
+
+    Importing this module doesn't touch the filesystem; the scan runs the
+    first time an entry is looked up or the registry is iterated, and is
+    then kept until :meth:`refresh`.
+    """
+
+    def __init__(
+        self, name: str, discover: Callable[[Path], dict[str, dict]], root: Path
+    ) -> None:
+        self.name = name
+        self._discover = discover
+        self._root = root
+        self._entries: dict[str, dict] | None = None
+
+    def _load(self) -> dict[str, dict]:
+        if self._entries is None:
+            with phase("discover"):
+                if _snapshot is None:
+                    self._entries = self._discover(self._root)
+                else:
+                    self._entries = _snapshot.registry(
+                        self.name, lambda: self._discover(self._root)
+                    )
+        return self._entries
+
+    def refresh(self) -> None:
+        """Forget the scan; the next access discovers the files again."""
+        self._entries = None
+
+    def __getitem__(self, key: str) -> dict:
+        return self._load()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __repr__(self) -> str:
+        state = "not loaded" if self._entries is None else f"{len(self._entries)} entries"
+        return f"<Registry {self.name} ({state})>"
+
+
+WORKFLOWS = Registry("workflows", discover_workflows, ROOT_DIR)
+ACTIONS = Registry("actions", discover_actions, ROOT_DIR)
+
+
+def get_registry_snapshot() -> RegistrySnapshot | None:
+    """Return the snapshot discovery is served from, if any."""
+    return _snapshot
+
+
+def set_registry_snapshot(snapshot: RegistrySnapshot | None) -> None:
+    """Serve discovery from *snapshot* where it's still current (None: always scan)."""
+    global _snapshot
+    _snapshot = snapshot
+    WORKFLOWS.refresh()
+    ACTIONS.refresh()
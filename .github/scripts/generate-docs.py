@@ -2,7 +2,8 @@
 """Generate documentation markdown files from workflow and action YAML specs.
 
 Usage:
-    python scripts/generate-docs.py [--enrich] [--ai-config PATH]
+    python scripts/generate-docs.py [--enrich] [--ai-config PATH] [--jobs N]
+                                    [--no-cache] [--profile PATH] [--watch]
 
 Pipeline:
     1. Load config registry
@@ -11,43 +12,83 @@ Pipeline:
     4. Render markdown via Jinja2 templates
     5. Write generated .md files to docs/
     6. Generate category index pages
+
+With --jobs N, reading the YAML files (registry discovery and spec
+parsing, steps 1-2, in one task per file) and then enrichment and page
+rendering (steps 3-5) run on a process pool; results are collected in
+registry order, so the console output and the written files are
+identical to a serial run.
+
+Builds are incremental: .cache/docs-manifest.json fingerprints each
+page's inputs (source YAML, README, template, registry entry, --ref,
+"Since" data, linked entries), and only pages whose fingerprint changed
+are rendered again.  Every file, mkdocs.yml included, is only rewritten
+when its bytes change, so mtimes stay put for unchanged pages.
+Templates are compiled once per process and cached in .cache/jinja
+(keyed by template content).  The discovered registries and parsed specs
+are kept in .cache/registry-snapshot.json, so only workflows and actions
+whose file stats changed are parsed again (see registry_snapshot.py).
+--no-cache renders and parses everything and keeps compiled templates in
+memory.
+
+--watch keeps running after the build: edits to workflows, actions, their
+READMEs or the templates rebuild just the affected pages, the indexes and
+the nav (see _Watcher).
+
+--profile PATH writes per-phase wall time, call counts and peak memory
+plus git subprocess counts to PATH as JSON, and a Chrome trace next to it
+(see scripts/profiling.py).  Pages handled by --jobs workers aren't included.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import os
 import sys
+import time
 from collections import defaultdict
+from dataclasses import asdict
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
 
 # Ensure the scripts package is importable
 SCRIPT_DIR = Path(__file__).resolve().parent
 ROOT_DIR = SCRIPT_DIR.parent
 sys.path.insert(0, str(ROOT_DIR))
 
-from scripts.config import ACTIONS, CATEGORY_LABELS, WORKFLOWS
+from scripts.api_timeline import TIMELINE_PATH, ApiTimeline
+from scripts.config import (
+    ACTIONS,
+    CATEGORY_LABELS,
+    WORKFLOWS,
+    action_fields,
+    get_registry_snapshot,
+    set_registry_snapshot,
+    workflow_fields,
+)
 from scripts.nav_generator import build_nav, inject_nav, render_nav_yaml
 from scripts.enrichers.ai_enricher import AIEnricher
 from scripts.enrichers.base import BaseEnricher, EnrichmentResult
 from scripts.enrichers.readme_enricher import ReadmeEnricher
 from scripts.parsers.action_parser import parse_action
 from scripts.parsers.workflow_parser import parse_workflow
-from scripts.generate_changelog import (
-    FileDiff,
-    get_head_diff,
-    get_sorted_tags,
-    get_version_diff,
-    render_input_table,
-    render_secret_table,
-)
+from scripts.profiling import phase, profiler
+from scripts.registry_snapshot import SNAPSHOT_PATH, RegistrySnapshot
 from scripts.renderers.markdown_renderer import (
+    TEMPLATE_CACHE_DIR,
     render_action,
     render_home,
+    internal_links,
     render_index,
     render_workflow,
+    set_template_cache,
 )
 
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
 
 def _build_docs_link_map() -> dict[str, str]:
     """Build a mapping from workflow/action key to its docs path relative to index.md."""
@@ -62,15 +103,50 @@ def _build_docs_link_map() -> dict[str, str]:
 
 def _is_tag(ref: str) -> bool:
     """Check if ref matches an existing git tag."""
-    from scripts.generate_changelog import get_sorted_tags
-    return ref in get_sorted_tags()
+    from scripts.generate_changelog import get_tag_snapshot
+
+    return ref in get_tag_snapshot()
+
+
+def _since_release(ref: str) -> str | None:
+    """Return the release "Since" columns are anchored at for *ref*.
+
+    That is *ref* itself if it's a release, else the release HEAD descends
+    from; None when there is no API timeline index to read.
+    """
+    if not TIMELINE_PATH.exists():
+        return None
+    from scripts.generate_changelog import get_nearest_release
+
+    return ref if _is_tag(ref) else get_nearest_release("HEAD")
+
+
+def _since_lookup(release: str | None) -> Callable[[str, str], dict[tuple[str, str], str]]:
+    """Return a ``(kind, key) -> {(section, name): version}`` lookup at *release*.
+
+    Answered from the API timeline index built by generate_changelog.py.
+    Without an index (or a release) every lookup is empty.
+    """
+    timeline = ApiTimeline.open_existing() if release else None
+    if timeline is None:
+        return lambda kind, key: {}
+    return lambda kind, key: timeline.since(kind, key, release)
 
 
 def _build_whats_new_context(ref: str) -> dict | None:
     """Build template context for the home page What's New section."""
+    from scripts.generate_changelog import (
+        get_head_diff,
+        get_version_diff,
+        render_input_table,
+        render_secret_table,
+        save_changelog_cache,
+    )
+
     if _is_tag(ref):
         # Tag build: show that tag's changes (None for first tag / re-tags)
         result = get_version_diff(ref)
+        save_changelog_cache()
         if not result:
             return None
         _old_tag, diffs = result
@@ -99,24 +175,15 @@ def _build_whats_new_context(ref: str) -> dict | None:
 
     added = [{"key": d.key, "kind": d.kind, "link": link_map.get(d.key)} for d in diffs if d.status == "added"]
     removed = [{"key": d.key, "kind": d.kind} for d in diffs if d.status == "removed"]
+    renamed = [
+        {"key": d.key, "old_key": d.old_key, "kind": d.kind, "link": link_map.get(d.key)}
+        for d in diffs if d.status == "renamed"
+    ]
 
+    # Breaking items are "changed" too, so this covers their tables as well.
     input_changes = []
     for d in diffs:
-        if d.status in ("changed",) and d.has_api_changes:
-            table_lines = []
-            if d.input_changes:
-                table_lines.extend(render_input_table(d.input_changes))
-            if d.secret_changes:
-                table_lines.extend(render_secret_table(d.secret_changes))
-            if table_lines:
-                input_changes.append({
-                    "key": d.key,
-                    "link": link_map.get(d.key),
-                    "input_table": "\n".join(table_lines),
-                })
-    # Also include input tables from breaking-change items
-    for d in diffs:
-        if d.has_breaking_changes and d.has_api_changes:
+        if d.status in ("changed", "renamed") and d.has_api_changes:
             table_lines = []
             if d.input_changes:
                 table_lines.extend(render_input_table(d.input_changes))
@@ -129,7 +196,7 @@ def _build_whats_new_context(ref: str) -> dict | None:
                     "input_table": "\n".join(table_lines),
                 })
 
-    if not breaking and not added and not removed and not input_changes:
+    if not breaking and not added and not removed and not renamed and not input_changes:
         return None
 
     return {
@@ -137,6 +204,7 @@ def _build_whats_new_context(ref: str) -> dict | None:
         "breaking": breaking,
         "added": added,
         "removed": removed,
+        "renamed": renamed,
         "input_changes": input_changes,
     }
 
@@ -155,6 +223,234 @@ def _run_enrichers(
     return results
 
 
+# ---------------------------------------------------------------------------
+# Incremental builds
+# ---------------------------------------------------------------------------
+
+MANIFEST_PATH = ROOT_DIR / ".cache" / "docs-manifest.json"
+
+
+def _docs_stamp() -> str:
+    """Return a version stamp that changes whenever the page generator does."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    for package in ("parsers", "enrichers", "renderers"):
+        for path in sorted((SCRIPT_DIR / package).glob("*.py")):
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class DocsManifest:
+    """On-disk fingerprints of the workflow/action pages the last run rendered.
+
+    A page is rendered again only when its fingerprint (see
+    :func:`_page_fingerprint`) differs from the stored one or its output
+    file is gone.  The whole manifest is tied to the generator stamp, so a
+    change to the parsers, enrichers or renderer re-renders everything;
+    the page files themselves are still only rewritten if their bytes
+    change.
+    """
+
+    def __init__(self, path: Path | None) -> None:
+        self._path = path
+        self._stamp = _docs_stamp()
+        self._stored: dict[str, str] = {}
+        self._current: dict[str, str] = {}
+        if path is None or not path.exists():
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("stamp") == self._stamp:
+            self._stored = data.get("pages", {})
+
+    def get(self, page: str) -> str | None:
+        return self._stored.get(page)
+
+    def put(self, page: str, fingerprint: str) -> None:
+        self._current[page] = fingerprint
+
+    def save(self) -> None:
+        """Write the fingerprints of this run's pages (dropping deleted ones).
+
+        They also become the stored ones, for the next rebuild in --watch.
+        """
+        self._stored, self._current = self._current, {}
+        if self._path is None:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"stamp": self._stamp, "pages": self._stored}
+        self._path.write_text(json.dumps(data, indent=1, sort_keys=True), encoding="utf-8")
+
+
+def _mtime(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _status(path: Path, mtime_before: int | None) -> str:
+    """Return "Written" or "Unchanged" for a page that was just (re)generated."""
+    return "Written" if _mtime(path) != mtime_before else "Unchanged"
+
+
+def _file_digest(path: Path | None) -> str:
+    if path is None or not path.exists():
+        return ""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _page_fingerprint(
+    kind: str, cfg: dict, spec: object, since: dict[tuple[str, str], str]
+) -> str:
+    """Hash everything one workflow/action page is rendered from.
+
+    That is its source YAML, companion README and template, its registry
+    entry (OVERRIDES included), the ``--ref``/enricher options, its
+    "Since" column and the entries it links to.
+    """
+    links = internal_links(spec, cfg) if kind == "workflow" else []
+    parts = [
+        _page_options,
+        cfg,
+        sorted([section, name, version] for (section, name), version in since.items()),
+        links,
+        _file_digest(ROOT_DIR / cfg["source"]),
+        _file_digest(ROOT_DIR / cfg["readme"] if "readme" in cfg else None),
+        _file_digest(SCRIPT_DIR / "templates" / f"{kind}.md.j2"),
+    ]
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Page workers
+# ---------------------------------------------------------------------------
+
+# Per-process page rendering state, set up by _init_pages — in the main
+# process for a serial run, in every pool worker otherwise.
+_enrichers: list[BaseEnricher] = []
+_since: Callable[[str, str], dict[tuple[str, str], str]] = lambda kind, key: {}
+_ref = "main"
+_page_options: list = []
+
+
+def _init_pages(
+    enrich: bool,
+    ai_config: str | None,
+    ref: str,
+    release: str | None,
+    template_cache: Path | None,
+    snapshot: RegistrySnapshot,
+) -> None:
+    """Build the enrichers, "Since" lookup and renderer pages are rendered with."""
+    global _enrichers, _since, _ref, _page_options
+    if get_registry_snapshot() is not snapshot:
+        # A worker that wasn't forked: serve the registries from the
+        # parent's snapshot instead of discovering them again.
+        set_registry_snapshot(snapshot)
+    set_template_cache(template_cache)
+    _enrichers = [
+        ReadmeEnricher(ROOT_DIR),
+        AIEnricher(enabled=enrich, config_path=ai_config),
+    ]
+    _since = _since_lookup(release)
+    _ref = ref
+    _page_options = [ref, enrich, _file_digest(Path(ai_config) if ai_config else None)]
+
+
+def _read_source(kind: str, path: Path) -> tuple[dict, dict]:
+    """Read one workflow/action file: its registry entry fields and its spec.
+
+    The spec comes back in its ``dataclasses.asdict`` form, which is what
+    the snapshot stores and pickles smaller than the dataclasses.
+    """
+    if kind == "workflow":
+        return workflow_fields(path), asdict(parse_workflow(path))
+    return action_fields(path), asdict(parse_action(path))
+
+
+def _parse_page(kind: str, key: str) -> tuple[object | None, str]:
+    """Parse the spec for one registry entry; return ``(spec, log line)``."""
+    cfg = (WORKFLOWS if kind == "workflow" else ACTIONS)[key]
+    source = ROOT_DIR / cfg["source"]
+    if not source.exists():
+        return None, f"  WARNING: {source} not found, skipping {key}"
+    spec = parse_workflow(source) if kind == "workflow" else parse_action(source)
+    return spec, f"  Parsed: {key} ({spec.name})"
+
+
+def _render_page(
+    kind: str, key: str, spec: object, stored: str | None
+) -> tuple[str, Path, str]:
+    """Enrich and render one workflow/action page unless it's up to date.
+
+    *stored* is the page's fingerprint from the last run.  Returns
+    ``(status, output path, fingerprint)``, status being "Written",
+    "Unchanged" (rendered to the same bytes) or "Up to date" (skipped).
+    """
+    cfg = (WORKFLOWS if kind == "workflow" else ACTIONS)[key]
+    since = _since(kind, key)
+    fingerprint = _page_fingerprint(kind, cfg, spec, since)
+    output = ROOT_DIR / cfg["output"]
+    mtime = _mtime(output)
+    if fingerprint == stored and mtime is not None:
+        return "Up to date", output, fingerprint
+
+    render = render_workflow if kind == "workflow" else render_action
+    with phase("enrich"):
+        enrichments = _run_enrichers(_enrichers, spec, cfg)
+    with phase("render"):
+        path = render(
+            spec, cfg, enrichments, SCRIPT_DIR / "templates", ROOT_DIR,
+            ref=_ref, since=since,
+        )
+    return _status(path, mtime), path, fingerprint
+
+
+class _PageMap:
+    """Ordered ``map`` over page tasks, serial or on a process pool.
+
+    On the pool, tasks are submitted as soon as :meth:`map` is called;
+    either way results come back in submission order, so the caller can
+    queue several batches and then print each one's results in turn.
+    *initializer* (if any) runs in every worker, or here for a serial map.
+    Workers are forked where the platform supports it (Python 3.14 no
+    longer does so by default), so they start with the parent's state.
+    """
+
+    def __init__(
+        self, jobs: int, initializer: Callable | None = None, initargs: tuple = ()
+    ) -> None:
+        self._jobs = jobs
+        self._pool: ProcessPoolExecutor | None = None
+        if jobs > 1:
+            import concurrent.futures
+            import multiprocessing
+
+            methods = multiprocessing.get_all_start_methods()
+            self._pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=jobs,
+                mp_context=multiprocessing.get_context("fork") if "fork" in methods else None,
+                initializer=initializer,
+                initargs=initargs,
+            )
+        elif initializer is not None:
+            initializer(*initargs)
+
+    def map(self, fn: Callable, *iterables: Iterable) -> Iterator:
+        if self._pool is None:
+            return map(fn, *iterables)
+        args = [list(it) for it in iterables]
+        # A few chunks per worker keeps IPC overhead low and the load even.
+        chunksize = max(1, len(args[0]) // (self._jobs * 4)) if args else 1
+        return self._pool.map(fn, *args, chunksize=chunksize)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+
+
 def _build_workflow_index_items(
     category: str,
     configs: list[tuple[str, dict]],
@@ -196,91 +492,11 @@ def _build_action_index_items(
     return items
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Generate documentation site")
-    parser.add_argument(
-        "--enrich",
-        action="store_true",
-        help="Enable AI enricher (requires AI_DOCS_API_KEY env var)",
-    )
-    parser.add_argument(
-        "--ai-config",
-        type=str,
-        default=None,
-        help="Path to AI enricher configuration JSON",
-    )
-    parser.add_argument(
-        "--ref",
-        type=str,
-        default="main",
-        help="Git ref for usage snippets (e.g. 'main' or '2.1.0')",
-    )
-    args = parser.parse_args()
-
-    templates_dir = SCRIPT_DIR / "templates"
-
-    # Initialize enrichers
-    enrichers: list[BaseEnricher] = [
-        ReadmeEnricher(ROOT_DIR),
-        AIEnricher(enabled=args.enrich, config_path=args.ai_config),
-    ]
-
-    # -------------------------------------------------------------------
-    # Parse all workflow YAML files
-    # -------------------------------------------------------------------
-    print("Parsing workflows...")
-    workflow_specs = {}
-    for key, cfg in WORKFLOWS.items():
-        source = ROOT_DIR / cfg["source"]
-        if not source.exists():
-            print(f"  WARNING: {source} not found, skipping {key}")
-            continue
-        spec = parse_workflow(source)
-        workflow_specs[key] = spec
-        print(f"  Parsed: {key} ({spec.name})")
-
-    # -------------------------------------------------------------------
-    # Parse all action YAML files
-    # -------------------------------------------------------------------
-    print("\nParsing actions...")
-    action_specs = {}
-    for key, cfg in ACTIONS.items():
-        source = ROOT_DIR / cfg["source"]
-        if not source.exists():
-            print(f"  WARNING: {source} not found, skipping {key}")
-            continue
-        spec = parse_action(source)
-        action_specs[key] = spec
-        print(f"  Parsed: {key} ({spec.name})")
-
-    # -------------------------------------------------------------------
-    # Render workflow pages
-    # -------------------------------------------------------------------
-    print("\nRendering workflow pages...")
-    for key, cfg in WORKFLOWS.items():
-        spec = workflow_specs.get(key)
-        if not spec:
-            continue
-        enrichments = _run_enrichers(enrichers, spec, cfg)
-        path = render_workflow(spec, cfg, enrichments, templates_dir, ROOT_DIR, ref=args.ref)
-        print(f"  Written: {path.relative_to(ROOT_DIR)}")
-
-    # -------------------------------------------------------------------
-    # Render action pages
-    # -------------------------------------------------------------------
-    print("\nRendering action pages...")
-    for key, cfg in ACTIONS.items():
-        spec = action_specs.get(key)
-        if not spec:
-            continue
-        enrichments = _run_enrichers(enrichers, spec, cfg)
-        path = render_action(spec, cfg, enrichments, templates_dir, ROOT_DIR, ref=args.ref)
-        print(f"  Written: {path.relative_to(ROOT_DIR)}")
-
-    # -------------------------------------------------------------------
-    # Generate category index pages
-    # -------------------------------------------------------------------
-    print("\nGenerating index pages...")
+def _render_indexes(
+    workflow_specs: dict, action_specs: dict, templates_dir: Path
+) -> list[tuple[str, Path]]:
+    """Render the category and top-level index pages; return ``(status, path)`` pairs."""
+    written: list[tuple[str, Path]] = []
 
     # Group workflows by category
     wf_by_category: dict[str, list[tuple[str, dict]]] = defaultdict(list)
@@ -297,6 +513,7 @@ def main() -> None:
         label = CATEGORY_LABELS.get(category, category.title())
         items = _build_workflow_index_items(category, entries, workflow_specs)
         index_path = ROOT_DIR / "docs" / "workflows" / category / "index.md"
+        mtime = _mtime(index_path)
         render_index(
             title=f"{label} Workflows",
             description=f"Reusable GitHub Actions workflows for {label} projects.",
@@ -304,13 +521,14 @@ def main() -> None:
             templates_dir=templates_dir,
             output_path=index_path,
         )
-        print(f"  Written: {index_path.relative_to(ROOT_DIR)}")
+        written.append((_status(index_path, mtime), index_path))
 
     # Action category index pages
     for category, entries in act_by_category.items():
         label = CATEGORY_LABELS.get(category, category.title())
         items = _build_action_index_items(category, entries, action_specs)
         index_path = ROOT_DIR / "docs" / "actions" / category / "index.md"
+        mtime = _mtime(index_path)
         render_index(
             title=f"{label} Actions",
             description=f"Composite GitHub Actions for {label} projects.",
@@ -318,7 +536,7 @@ def main() -> None:
             templates_dir=templates_dir,
             output_path=index_path,
         )
-        print(f"  Written: {index_path.relative_to(ROOT_DIR)}")
+        written.append((_status(index_path, mtime), index_path))
 
     # Top-level workflow index
     all_wf_items = []
@@ -332,14 +550,16 @@ def main() -> None:
                 "description": f"{len(wf_by_category[category])} workflow(s)",
             }
         )
+    index_path = ROOT_DIR / "docs" / "workflows" / "index.md"
+    mtime = _mtime(index_path)
     render_index(
         title="Workflows",
         description="All reusable GitHub Actions workflows organized by platform.",
         items=all_wf_items,
         templates_dir=templates_dir,
-        output_path=ROOT_DIR / "docs" / "workflows" / "index.md",
+        output_path=index_path,
     )
-    print(f"  Written: docs/workflows/index.md")
+    written.append((_status(index_path, mtime), index_path))
 
     # Top-level action index
     all_act_items = []
@@ -353,20 +573,316 @@ def main() -> None:
                 "description": f"{len(act_by_category[category])} action(s)",
             }
         )
+    index_path = ROOT_DIR / "docs" / "actions" / "index.md"
+    mtime = _mtime(index_path)
     render_index(
         title="Actions",
         description="All composite GitHub Actions organized by platform.",
         items=all_act_items,
         templates_dir=templates_dir,
-        output_path=ROOT_DIR / "docs" / "actions" / "index.md",
+        output_path=index_path,
+    )
+    written.append((_status(index_path, mtime), index_path))
+    return written
+
+
+def _render_home_page(whats_new: dict | None, templates_dir: Path) -> tuple[str, Path]:
+    mtime = _mtime(ROOT_DIR / "docs" / "index.md")
+    home_path = render_home(whats_new, templates_dir, ROOT_DIR)
+    return _status(home_path, mtime), home_path
+
+
+def _render_nav() -> tuple[str, Path]:
+    """Regenerate the nav in mkdocs.yml; return ``(status, path)``."""
+    from scripts.generate_changelog import list_changelog_archives
+
+    nav = build_nav(
+        WORKFLOWS, ACTIONS, CATEGORY_LABELS,
+        changelog_archives=list_changelog_archives(ROOT_DIR / "docs"),
+    )
+    mkdocs_path = ROOT_DIR / "mkdocs.yml"
+    updated = inject_nav(mkdocs_path, render_nav_yaml(nav))
+    return ("Updated" if updated else "Unchanged"), mkdocs_path
+
+
+def _print_status(status: str, path: Path) -> None:
+    print(f"  {status}: {path.relative_to(ROOT_DIR)}")
+
+
+# ---------------------------------------------------------------------------
+# Watch mode
+# ---------------------------------------------------------------------------
+
+
+class _Watcher:
+    """Polls the docs inputs and rebuilds what an edit affects.
+
+    Parsed specs and compiled templates stay in memory between rebuilds.
+    A rebuild re-parses only the changed YAML files, re-renders the pages
+    whose fingerprint changed (which covers pages linking to an edited
+    entry, since resolved links are part of the fingerprint) and
+    regenerates the index pages, home page and nav, each written only if
+    its bytes changed.  Polling ``stat`` keeps this dependency-free; the
+    watched tree is a few hundred files at most.
+    """
+
+    INTERVAL = 0.2  # seconds between polls
+
+    def __init__(
+        self,
+        manifest: DocsManifest,
+        snapshot: RegistrySnapshot,
+        specs: dict[str, dict],
+        whats_new: dict | None,
+        templates_dir: Path,
+        template_cache: Path | None,
+    ) -> None:
+        self._manifest = manifest
+        self._snapshot = snapshot
+        self._whats_new = whats_new
+        self._templates_dir = templates_dir
+        self._template_cache = template_cache
+        self._files = self._scan()
+        # (kind, key) -> (source file signature, spec)
+        self._parsed: dict[tuple[str, str], tuple[tuple[int, int] | None, object]] = {}
+        for kind, registry in (("workflow", WORKFLOWS), ("action", ACTIONS)):
+            for key, cfg in registry.items():
+                if key in specs[kind]:
+                    signature = self._files.get(ROOT_DIR / cfg["source"])
+                    self._parsed[(kind, key)] = (signature, specs[kind][key])
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        """Return ``{path: (mtime_ns, size)}`` for every watched file."""
+        paths = [
+            *(ROOT_DIR / "workflows").glob("*.yml"),
+            *(ROOT_DIR / "workflows").glob("*.md"),
+            *(ROOT_DIR / "actions").glob("*/action.yml"),
+            *(ROOT_DIR / "actions").glob("*/README.md"),
+            *self._templates_dir.glob("*.j2"),
+            *(
+                ROOT_DIR / cfg["readme"]
+                for cfg in (*WORKFLOWS.values(), *ACTIONS.values())
+                if "readme" in cfg
+            ),
+        ]
+        files = {}
+        for path in paths:
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            files[path] = (st.st_mtime_ns, st.st_size)
+        return files
+
+    def _changes(self) -> set[Path]:
+        files = self._scan()
+        changed = {p for p in files.keys() | self._files.keys() if files.get(p) != self._files.get(p)}
+        self._files = files
+        return changed
+
+    def rebuild(self, changed: set[Path]) -> None:
+        started = time.perf_counter()
+        if any(p.parent == self._templates_dir for p in changed):
+            # Drop compiled templates; the bytecode cache is keyed by content.
+            set_template_cache(self._template_cache)
+        if any(p.parent != self._templates_dir for p in changed):
+            # Titles, categories and readme links come from the files themselves.
+            WORKFLOWS.refresh()
+            ACTIONS.refresh()
+
+        specs: dict[str, dict] = {"workflow": {}, "action": {}}
+        report: list[tuple[str, Path]] = []
+        for kind, registry in (("workflow", WORKFLOWS), ("action", ACTIONS)):
+            for key, cfg in registry.items():
+                signature = self._files.get(ROOT_DIR / cfg["source"])
+                cached = self._parsed.get((kind, key))
+                if cached is not None and cached[0] == signature:
+                    spec = cached[1]
+                else:
+                    spec, line = _parse_page(kind, key)
+                    if spec is None:
+                        print(line)
+                        continue
+                    self._parsed[(kind, key)] = (signature, spec)
+                    self._snapshot.put_spec(ROOT_DIR / cfg["source"], spec)
+                specs[kind][key] = spec
+                status, path, fingerprint = _render_page(
+                    kind, key, spec, self._manifest.get(f"{kind}:{key}"),
+                )
+                self._manifest.put(f"{kind}:{key}", fingerprint)
+                report.append((status, path))
+        self._manifest.save()
+        self._snapshot.save()
+
+        report += _render_indexes(specs["workflow"], specs["action"], self._templates_dir)
+        report.append(_render_home_page(self._whats_new, self._templates_dir))
+        report.append(_render_nav())
+
+        for status, path in report:
+            if status in ("Written", "Updated"):
+                _print_status(status, path)
+        elapsed = (time.perf_counter() - started) * 1000
+        rebuilt = sum(status in ("Written", "Updated") for status, _path in report)
+        print(f"Rebuilt in {elapsed:.0f} ms ({rebuilt} file(s) changed)")
+
+    def run(self) -> None:
+        print(f"\nWatching {len(self._files)} files for changes (Ctrl+C to stop)...")
+        try:
+            while True:
+                time.sleep(self.INTERVAL)
+                changed = self._changes()
+                if not changed:
+                    continue
+                names = ", ".join(sorted(str(p.relative_to(ROOT_DIR)) for p in changed))
+                print(f"\nChanged: {names}")
+                try:
+                    self.rebuild(changed)
+                except Exception as e:  # a half-saved edit; wait for the next one
+                    print(f"  ERROR: {type(e).__name__}: {e}")
+        except KeyboardInterrupt:
+            print("\nStopped watching.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate documentation site")
+    parser.add_argument(
+        "--enrich",
+        action="store_true",
+        help="Enable AI enricher (requires AI_DOCS_API_KEY env var)",
+    )
+    parser.add_argument(
+        "--ai-config",
+        type=str,
+        default=None,
+        help="Path to AI enricher configuration JSON",
+    )
+    parser.add_argument(
+        "--ref",
+        type=str,
+        default="main",
+        help="Git ref for usage snippets (e.g. 'main' or '2.1.0')",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for parsing and rendering pages (0 = all CPUs)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse and render every page and compile templates in memory, without "
+             f"reading or writing {MANIFEST_PATH.relative_to(ROOT_DIR)}, "
+             f"{SNAPSHOT_PATH.relative_to(ROOT_DIR)} or "
+             f"{TEMPLATE_CACHE_DIR.relative_to(ROOT_DIR)}",
     )
-    print(f"  Written: docs/actions/index.md")
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Write a JSON phase/git profile to PATH and a Chrome trace next to it",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="After the build, keep watching workflows, actions, READMEs and "
+             "templates and rebuild the affected pages on every change",
+    )
+    args = parser.parse_args()
+    if args.profile:
+        profiler.track_memory()
+
+    snapshot = RegistrySnapshot(None if args.no_cache else SNAPSHOT_PATH)
+    set_registry_snapshot(snapshot)
+
+    templates_dir = SCRIPT_DIR / "templates"
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    template_cache = None if args.no_cache else TEMPLATE_CACHE_DIR
+    set_template_cache(template_cache)
+    page_args = (
+        args.enrich, args.ai_config, args.ref, _since_release(args.ref), template_cache, snapshot,
+    )
+
+    # -------------------------------------------------------------------
+    # Read all workflow + action YAML files and discover the registries
+    # -------------------------------------------------------------------
+    with phase("parse"):
+        # Files the snapshot doesn't have are read in one pass (registry
+        # entry fields and spec together), on a pool of their own: the page
+        # workers start after the registries are loaded below, and get them
+        # from the snapshot (inherited when forked, pickled otherwise).
+        stale = snapshot.stale_sources()
+        sources = _PageMap(min(jobs, max(1, len(stale))))
+        kinds, paths = [kind for kind, _ in stale], [path for _, path in stale]
+        for path, (fields, spec) in zip(paths, sources.map(_read_source, kinds, paths)):
+            snapshot.put_source(path, fields, spec)
+        sources.close()
+        fresh = set(paths)
+
+        workflow_specs: dict[str, object] = {}
+        action_specs: dict[str, object] = {}
+        for kind, registry, specs, heading in (
+            ("workflow", WORKFLOWS, workflow_specs, "Parsing workflows..."),
+            ("action", ACTIONS, action_specs, "\nParsing actions..."),
+        ):
+            print(heading)
+            for key, cfg in registry.items():
+                source = ROOT_DIR / cfg["source"]
+                spec = snapshot.spec(kind, source)
+                if spec is None:
+                    # Missing source, or a spec the snapshot can't hold.
+                    spec, line = _parse_page(kind, key)
+                    print(line)
+                    if spec is None:
+                        continue
+                    snapshot.put_spec(source, spec)
+                else:
+                    print(f"  {'Parsed' if source in fresh else 'Cached'}: {key} ({spec.name})")
+                specs[key] = spec
+        snapshot.save()
+
+    pages = _PageMap(jobs, _init_pages, page_args)
+
+    # -------------------------------------------------------------------
+    # Render workflow + action pages
+    # -------------------------------------------------------------------
+    manifest = DocsManifest(None if args.no_cache else MANIFEST_PATH)
+    rendered_pages = {}
+    for kind, specs in (("workflow", workflow_specs), ("action", action_specs)):
+        rendered_pages[kind] = pages.map(
+            _render_page,
+            [kind] * len(specs),
+            specs,
+            specs.values(),
+            [manifest.get(f"{kind}:{key}") for key in specs],
+        )
+
+    up_to_date = 0
+    for kind, specs in (("workflow", workflow_specs), ("action", action_specs)):
+        print(f"\nRendering {kind} pages...")
+        for key, (status, path, fingerprint) in zip(specs, rendered_pages[kind]):
+            manifest.put(f"{kind}:{key}", fingerprint)
+            _print_status(status, path)
+            up_to_date += status == "Up to date"
+    pages.close()
+    manifest.save()
+
+    # -------------------------------------------------------------------
+    # Generate category index pages
+    # -------------------------------------------------------------------
+    print("\nGenerating index pages...")
+
+    with phase("index"):
+        for status, path in _render_indexes(workflow_specs, action_specs, templates_dir):
+            _print_status(status, path)
 
     # -------------------------------------------------------------------
     # Generate home page with What's New section
     # -------------------------------------------------------------------
     print("\nGenerating home page...")
-    whats_new = _build_whats_new_context(args.ref)
+    with phase("changelog"):
+        whats_new = _build_whats_new_context(args.ref)
     if whats_new:
         print(f"  {whats_new['title']} "
               f"({len(whats_new['breaking'])} breaking, "
@@ -374,25 +890,33 @@ def main() -> None:
               f"{len(whats_new['input_changes'])} changed)")
     else:
         print("  No API changes to highlight")
-    home_path = render_home(whats_new, templates_dir, ROOT_DIR)
-    print(f"  Written: {home_path.relative_to(ROOT_DIR)}")
+    with phase("render"):
+        _print_status(*_render_home_page(whats_new, templates_dir))
 
     # -------------------------------------------------------------------
     # Generate nav in mkdocs.yml
     # -------------------------------------------------------------------
     print("\nGenerating nav...")
-    nav = build_nav(WORKFLOWS, ACTIONS, CATEGORY_LABELS)
-    nav_yaml = render_nav_yaml(nav)
-    mkdocs_path = ROOT_DIR / "mkdocs.yml"
-    inject_nav(mkdocs_path, nav_yaml)
-    print(f"  Updated: {mkdocs_path.relative_to(ROOT_DIR)}")
+    with phase("nav"):
+        _print_status(*_render_nav())
 
     # -------------------------------------------------------------------
     # Summary
     # -------------------------------------------------------------------
     total_wf = len(workflow_specs)
     total_act = len(action_specs)
-    print(f"\nDone! Generated {total_wf} workflow pages + {total_act} action pages.")
+    print(f"\nDone! Generated {total_wf} workflow pages + {total_act} action pages"
+          + (f" ({up_to_date} up to date)." if up_to_date else "."))
+    if args.profile:
+        summary_path, trace_path = profiler.write(args.profile)
+        print(f"Profile: {summary_path} (trace: {trace_path})")
+
+    if args.watch:
+        if jobs > 1:
+            # Rebuilds are small; render them in this process.
+            _init_pages(*page_args)
+        specs = {"workflow": workflow_specs, "action": action_specs}
+        _Watcher(manifest, snapshot, specs, whats_new, templates_dir, template_cache).run()
 
 
 if __name__ == "__main__":
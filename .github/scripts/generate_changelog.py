@@ -2,26 +2,65 @@
 """Generate changelog by diffing workflow/action YAML API surfaces between tags.
 
 Usage:
-    python scripts/generate-changelog.py
+    python scripts/generate-changelog.py [--no-batch] [--cache PATH | --no-cache]
+                                         [--jobs N] [--split N] [--snapshots DIR]
+                                         [--timeline PATH | --no-timeline]
+                                         [--profile PATH]
 
 Outputs docs/changelog.md with structured entries for each version tag,
 grouped by: breaking changes, new/removed workflows & actions, input changes,
 and internal changes.
+
+Rendered entries are cached per tag pair in .cache/changelog.jsonl, so a run
+only diffs versions that are new or whose tags moved.  Entries are streamed
+to disk newest-first; with --split N only the latest N versions stay on
+changelog.md and older ones are archived under docs/changelog/<major>.x.md.
+
+With --snapshots DIR, each release's parsed API surface and changelog
+metadata are stored in DIR; releases found there are rendered from the
+snapshot, so a shallow clone plus the store is enough for the full changelog.
+
+Every run also updates the API timeline index (.cache/api-timeline.sqlite,
+see api_timeline.py), which records the release each input, secret and
+output was added, modified or removed in.
+
+--profile PATH writes per-phase wall time, call counts and peak memory
+plus git subprocess counts to PATH as JSON, and a Chrome trace next to it
+(see profiling.py).  Versions diffed in --jobs workers aren't included.
 """
 
 from __future__ import annotations
 
-import subprocess
+import argparse
+import atexit
+import hashlib
+import json
+import os
+import re
 import sys
-from dataclasses import dataclass, field
+import unicodedata
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from pathlib import Path
-
-import yaml
+from typing import Iterable, Iterator
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 ROOT_DIR = SCRIPT_DIR.parent  # .github/ (inner) — docs live here
 REPO_ROOT = ROOT_DIR.parent   # repo root — git commands run here
 
+# Ensure the scripts package is importable when run as a script
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from scripts.api_timeline import TIMELINE_PATH, ApiTimeline, Event
+from scripts.git_backends.base import CommitInfo, GitBackend, PathChange, TagInfo, diff_trees
+from scripts.git_backends.batch_backend import BatchBackend
+from scripts.git_backends.subprocess_backend import SubprocessBackend
+from scripts.profiling import phase, profiler
+
+CACHE_PATH = ROOT_DIR / ".cache" / "changelog.jsonl"
+DOCS_DIR = ROOT_DIR / "docs"
+
 WORKFLOW_PREFIX = ".github/workflows/"
 ACTION_PREFIX = ".github/actions/"
 
@@ -47,97 +86,441 @@ AUTHOR_EXCLUDE: set[str] = {"github-actions[bot]"}
 # ---------------------------------------------------------------------------
 
 
-def _git(*args: str) -> str:
-    result = subprocess.run(
-        ["git", *args],
-        capture_output=True,
-        text=True,
-        cwd=REPO_ROOT,
-    )
-    if result.returncode != 0:
-        return ""
-    return result.stdout.strip()
+_backend: GitBackend | None = None
+
+
+def get_backend() -> GitBackend:
+    """Return the active git backend (a :class:`BatchBackend` by default)."""
+    global _backend
+    if _backend is None:
+        _backend = BatchBackend(REPO_ROOT)
+        atexit.register(_backend.close)
+    return _backend
+
+
+def set_backend(backend: GitBackend) -> None:
+    """Route all git access through *backend* and drop per-repo state."""
+    global _backend, _tag_snapshot, _history, _merge_index, _release_graph, _contributor_index
+    _backend = backend
+    _tag_snapshot = None
+    _history = None
+    _merge_index = None
+    _release_graph = None
+    _contributor_index = None
+
+
+class TagSnapshot:
+    """Metadata for every tag, loaded by a single backend call.
+
+    Tags are kept in semver order (``v:refname``, like ``git tag --sort``).
+    Use :func:`get_tag_snapshot` for the process-wide shared instance.
+    """
+
+    def __init__(self, tags: list[TagInfo]) -> None:
+        self.tags = tags
+        self._by_name = {t.name: t for t in tags}
+
+    @classmethod
+    def load(cls) -> TagSnapshot:
+        return cls(get_backend().tags())
+
+    @property
+    def names(self) -> list[str]:
+        return [t.name for t in self.tags]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def get(self, name: str) -> TagInfo | None:
+        return self._by_name.get(name)
+
+
+_tag_snapshot: TagSnapshot | None = None
+
+
+def get_tag_snapshot() -> TagSnapshot:
+    """Return the shared :class:`TagSnapshot`, loading it on first use."""
+    global _tag_snapshot
+    if _tag_snapshot is None:
+        _tag_snapshot = TagSnapshot.load()
+    return _tag_snapshot
+
+
+def commit_sha(ref: str) -> str:
+    """Return the commit SHA *ref* points to (tags come from the snapshot)."""
+    info = get_tag_snapshot().get(ref)
+    if info is not None:
+        return info.sha
+    return get_backend().resolve_commit(ref)
 
 
 def get_sorted_tags() -> list[str]:
     """Return version tags sorted by semver (ascending)."""
-    raw = _git("tag", "--sort=v:refname")
-    if not raw:
-        return []
-    return raw.splitlines()
+    return get_tag_snapshot().names
 
 
 def get_tag_date(tag: str) -> str:
     """Return the tag date as YYYY-MM-DD."""
-    return _git("log", "-1", "--format=%ai", tag).split(" ")[0]
+    info = get_tag_snapshot().get(tag)
+    if info is not None:
+        return info.date
+    return get_backend().commit_date(tag)
+
+
+def list_blobs_at_tag(tag: str, prefix: str, suffix: str = "") -> dict[str, str]:
+    """Return ``{path: blob_oid}`` for files under *prefix* at *tag*.
+
+    Optionally filtered by *suffix*.  Equal OIDs mean byte-identical
+    content, so callers can skip unchanged files without reading them.
+    """
+    return {
+        path: oid
+        for path, oid in get_backend().list_tree(tag, prefix)
+        if path.endswith(suffix)
+    }
 
 
 def list_files_at_tag(tag: str, prefix: str, suffix: str = "") -> list[str]:
     """List files under *prefix* at *tag*, optionally filtered by *suffix*."""
-    raw = _git("ls-tree", "-r", "--name-only", tag, prefix)
-    if not raw:
-        return []
-    paths = raw.splitlines()
-    if suffix:
-        paths = [p for p in paths if p.endswith(suffix)]
-    return paths
+    return list(list_blobs_at_tag(tag, prefix, suffix))
 
 
 def read_file_at_tag(tag: str, path: str) -> str:
     """Return file content at *tag*, or empty string if missing."""
-    return _git("show", f"{tag}:{path}")
+    return get_backend().read_file(tag, path)
 
 
-def _normalize_key(name: str) -> str:
-    """Produce an ASCII-ish lowercase key for dedup (strip diacritics)."""
-    import unicodedata
-    nfkd = unicodedata.normalize("NFKD", name)
-    return "".join(c for c in nfkd if not unicodedata.combining(c)).lower().strip()
+def read_blob(oid: str) -> str:
+    """Return the content of the blob *oid*, or empty string if missing."""
+    return get_backend().read_blob(oid)
 
 
-def get_contributors(old_tag: str | None, new_tag: str) -> list[str]:
-    """Return deduplicated, normalized author names between two tags."""
-    if old_tag:
-        raw = _git("log", "--format=%aN", f"{old_tag}..{new_tag}")
-    else:
-        raw = _git("log", "--format=%aN", new_tag)
-    if not raw:
-        return []
+_history: list[CommitInfo] | None = None
+
+
+def get_history() -> list[CommitInfo]:
+    """Return every commit reachable from the tags and HEAD, walked once."""
+    global _history
+    if _history is None:
+        _history = list(get_backend().history([*get_sorted_tags(), "HEAD"]))
+    return _history
+
+
+class MergeIndex:
+    """File -> merge-commit index built from a single pass over the history.
+
+    One history walk (a single ``git log`` for the git backends) yields
+    every commit's parents plus, for merge commits, the files changed
+    against the first parent (what the PR brought in).  Tag ranges are
+    then resolved in memory: the merges in ``old..new`` are those on
+    *new*'s first-parent chain that *old* can't reach.
+    """
+
+    def __init__(self, commits: Iterable[CommitInfo]) -> None:
+        self._parents: dict[str, list[str]] = {}
+        self._merges: dict[str, tuple[str, list[str]]] = {}
+        self._ancestor_sets: dict[str, set[str]] = {}
+        self._ranges: dict[tuple[str, str], list[str]] = {}
+        for commit in commits:
+            self._parents[commit.sha] = commit.parents
+            if len(commit.parents) > 1:
+                self._merges[commit.sha] = (commit.subject, commit.files)
+
+    def _ancestors(self, sha: str) -> set[str]:
+        """Return every commit reachable from *sha* (inclusive)."""
+        if sha not in self._ancestor_sets:
+            seen: set[str] = set()
+            stack = [sha]
+            while stack:
+                commit = stack.pop()
+                if commit in seen:
+                    continue
+                seen.add(commit)
+                stack.extend(self._parents.get(commit, []))
+            self._ancestor_sets[sha] = seen
+        return self._ancestor_sets[sha]
+
+    def range_merges(self, old_sha: str, new_sha: str) -> list[str]:
+        """Return first-parent merge commits in ``old..new``, newest first."""
+        key = (old_sha, new_sha)
+        if key not in self._ranges:
+            excluded = self._ancestors(old_sha)
+            merges: list[str] = []
+            sha = new_sha
+            # Once the chain reaches something old can see, so can the rest.
+            while sha in self._parents and sha not in excluded:
+                parents = self._parents[sha]
+                if len(parents) > 1:
+                    merges.append(sha)
+                sha = parents[0] if parents else ""
+            self._ranges[key] = merges
+        return self._ranges[key]
+
+    def summaries(self, old_sha: str, new_sha: str) -> dict[str, list[str]]:
+        """Return ``{file_path: [subject, ...]}`` for merges in ``old..new``."""
+        result: dict[str, list[str]] = {}
+        for sha in self.range_merges(old_sha, new_sha):
+            subject, files = self._merges[sha]
+            for fpath in files:
+                result.setdefault(fpath, []).append(subject)
+        return result
+
+
+_merge_index: MergeIndex | None = None
+
+
+def get_merge_index() -> MergeIndex:
+    """Return the shared merge index over all tags and HEAD, building it once."""
+    global _merge_index
+    if _merge_index is None:
+        _merge_index = MergeIndex(get_history())
+    return _merge_index
+
+
+def get_merge_pr_summaries(old_tag: str, new_tag: str) -> dict[str, list[str]]:
+    """Return {file_path: [summary, ...]} for merge commits touching each file.
+
+    Uses first-parent merge commit subjects (typically PR titles), answered
+    from *new_tag*'s stored snapshot or the shared :class:`MergeIndex`.
+    """
+    stored = get_snapshot(new_tag)
+    if stored is not None and stored.previous == old_tag:
+        return stored.pr_summaries
+    return get_merge_index().summaries(
+        commit_sha(old_tag),
+        commit_sha(new_tag),
+    )
+
+
+class ReleaseGraph:
+    """Nearest ancestor release of every commit, from the shared history walk.
+
+    The semver predecessor of a tag is the wrong baseline for hotfixes cut
+    from an older branch, so each tag is diffed against the releases its
+    commit actually descends from.  Commits are visited parents-first; each
+    one carries the frontier of its closest tagged ancestors, so every
+    lookup afterwards is answered in memory.
+    """
+
+    def __init__(self, commits: Iterable[CommitInfo], tags: list[TagInfo]) -> None:
+        self._parents = {commit.sha: commit.parents for commit in commits}
+        self._rank = {t.name: i for i, t in enumerate(tags)}
+        self._sha = {t.name: t.sha for t in tags}
+        self._tags_at: dict[str, list[str]] = {}
+        for t in tags:
+            self._tags_at.setdefault(t.sha, []).append(t.name)
+
+        # Closest tagged proper ancestors per commit, and every tagged
+        # ancestor of each tagged commit (used to prune frontiers at merges).
+        self._frontier: dict[str, frozenset[str]] = {}
+        self._reach: dict[str, frozenset[str]] = {}
+        for sha in self._topo_order():
+            found: set[str] = set()
+            for parent in self._parents[sha]:
+                if parent in self._tags_at:
+                    found.add(parent)
+                else:
+                    found.update(self._frontier.get(parent, ()))
+            if len(found) > 1:
+                covered = set().union(*(self._reach[f] for f in found))
+                found -= covered
+            frontier = frozenset(found)
+            self._frontier[sha] = frontier
+            if sha in self._tags_at:
+                self._reach[sha] = frontier.union(*(self._reach[f] for f in frontier))
+
+    def _topo_order(self) -> list[str]:
+        """Return every known commit, parents before children."""
+        order: list[str] = []
+        done: set[str] = set()
+        for root in self._parents:
+            stack = [(root, False)]
+            while stack:
+                sha, expanded = stack.pop()
+                if expanded:
+                    order.append(sha)
+                    continue
+                if sha in done:
+                    continue
+                done.add(sha)
+                stack.append((sha, True))
+                for parent in self._parents[sha]:
+                    if parent in self._parents and parent not in done:
+                        stack.append((parent, False))
+        return order
+
+    def __contains__(self, sha: str) -> bool:
+        return sha in self._parents
+
+    def _latest(self, shas: Iterable[str], below: str | None = None) -> str | None:
+        """Return the highest-versioned tag on *shas*, lower than *below*."""
+        limit = self._rank[below] if below is not None else len(self._rank)
+        names = [n for sha in shas for n in self._tags_at.get(sha, ()) if self._rank[n] < limit]
+        return max(names, key=self._rank.__getitem__, default=None)
+
+    def nearest(self, sha: str) -> str | None:
+        """Return the closest release at or behind commit *sha*."""
+        return self._latest([sha]) or self._latest(self._frontier[sha])
+
+    def previous(self, tag: str) -> str | None:
+        """Return the release *tag* should be diffed against (None if it has none).
+
+        An older tag on the same commit wins (a re-tag), then the closest
+        ancestor releases, then any older ancestor release.
+        """
+        sha = self._sha[tag]
+        return (
+            self._latest([sha], below=tag)
+            or self._latest(self._frontier[sha], below=tag)
+            or self._latest(self._reach[sha], below=tag)
+        )
 
+
+_release_graph: ReleaseGraph | None = None
+
+
+def get_release_graph() -> ReleaseGraph:
+    """Return the shared release graph over all tags and HEAD, building it once."""
+    global _release_graph
+    if _release_graph is None:
+        _release_graph = ReleaseGraph(get_history(), get_tag_snapshot().tags)
+    return _release_graph
+
+
+def get_nearest_release(ref: str) -> str | None:
+    """Return the closest release at or behind *ref*, or None if unknown."""
+    sha = commit_sha(ref)
+    graph = get_release_graph()
+    return graph.nearest(sha) if sha in graph else None
+
+
+def get_previous_tag(tag: str) -> str | None:
+    """Return the release *tag* is diffed against, or None for an initial release.
+
+    Taken from the release's stored snapshot if there is one, else resolved
+    from the :class:`ReleaseGraph`; tags whose commit isn't in the history
+    fall back to the semver predecessor.
+    """
+    stored = get_snapshot(tag)
+    if stored is not None:
+        return stored.previous
+    snapshot = get_tag_snapshot()
+    graph = get_release_graph()
+    if commit_sha(tag) in graph:
+        return graph.previous(tag)
+    tags = snapshot.names
+    idx = tags.index(tag)
+    return tags[idx - 1] if idx > 0 else None
+
+
+@lru_cache(maxsize=None)
+def _canonical_author(name: str) -> tuple[str, str] | None:
+    """Return ``(dedup_key, display_name)`` for a raw git author name.
+
+    Applies AUTHOR_ALIASES and strips diacritics for the key; returns None
+    for excluded authors.  Memoized, so each distinct raw name is
+    normalized once per run.
+    """
+    if name in AUTHOR_EXCLUDE:
+        return None
+    canonical = AUTHOR_ALIASES.get(name, name)
+    nfkd = unicodedata.normalize("NFKD", canonical)
+    key = "".join(c for c in nfkd if not unicodedata.combining(c)).lower().strip()
+    return key, canonical
+
+
+def _dedup_authors(names: Iterable[str]) -> list[str]:
+    """Return deduplicated, normalized display names, sorted."""
     seen: dict[str, str] = {}
-    for name in raw.splitlines():
-        if name in AUTHOR_EXCLUDE:
+    for name in names:
+        normalized = _canonical_author(name)
+        if normalized is None:
             continue
-        canonical = AUTHOR_ALIASES.get(name, name)
-        key = _normalize_key(canonical)
+        key, canonical = normalized
         # Keep the version with diacritics (longer NFKD form)
         if key not in seen or len(canonical) > len(seen[key]):
             seen[key] = canonical
     return sorted(seen.values())
 
 
-def get_merge_pr_summaries(old_tag: str, new_tag: str) -> dict[str, list[str]]:
-    """Return {file_path: [summary, ...]} for merge commits touching each file.
+class ContributorIndex:
+    """Commit -> author index built from the shared history walk.
 
-    Uses first-parent merge commit subjects (typically PR titles).
+    A version's contributors are the authors of ``old..new``: the commits
+    *new* reaches that *old* doesn't.  That is answered in memory for any
+    pair of known commits (not just semver neighbours, so hotfixes and
+    backports diffed against an older release are covered) and memoized
+    per pair.
     """
-    raw = _git(
-        "log", "--first-parent", "--merges", "--format=%H %s",
-        f"{old_tag}..{new_tag}",
-    )
-    if not raw:
-        return {}
 
-    result: dict[str, list[str]] = {}
-    for line in raw.splitlines():
-        parts = line.split(" ", 1)
-        if len(parts) < 2:
-            continue
-        sha, subject = parts
-        files_raw = _git("diff-tree", "--no-commit-id", "-r", "--name-only", sha)
-        for fpath in files_raw.splitlines():
-            result.setdefault(fpath, []).append(subject)
-    return result
+    def __init__(self, commits: Iterable[CommitInfo]) -> None:
+        self._parents: dict[str, list[str]] = {}
+        self._authors: dict[str, str] = {}
+        self._ancestor_sets: dict[str, set[str]] = {}
+        self._ranges: dict[tuple[str | None, str], list[str]] = {}
+        for commit in commits:
+            self._parents[commit.sha] = commit.parents
+            self._authors[commit.sha] = commit.author
+
+    def __contains__(self, sha: str) -> bool:
+        return sha in self._parents
+
+    def _walk(self, sha: str, excluded: set[str]) -> Iterator[str]:
+        """Yield every commit reachable from *sha* (inclusive) that isn't in *excluded*."""
+        seen: set[str] = set()
+        stack = [sha]
+        while stack:
+            commit = stack.pop()
+            if commit in seen or commit in excluded or commit not in self._parents:
+                continue
+            seen.add(commit)
+            yield commit
+            stack.extend(self._parents[commit])
+
+    def _ancestors(self, sha: str) -> set[str]:
+        """Return every commit reachable from *sha* (inclusive)."""
+        if sha not in self._ancestor_sets:
+            self._ancestor_sets[sha] = set(self._walk(sha, set()))
+        return self._ancestor_sets[sha]
+
+    def contributors(self, old_sha: str | None, new_sha: str) -> list[str]:
+        """Return the deduplicated authors of ``old..new`` (all of *new* if *old* is None)."""
+        key = (old_sha, new_sha)
+        if key not in self._ranges:
+            excluded = self._ancestors(old_sha) if old_sha else set()
+            self._ranges[key] = _dedup_authors(
+                self._authors[sha] for sha in self._walk(new_sha, excluded)
+            )
+        return self._ranges[key]
+
+
+_contributor_index: ContributorIndex | None = None
+
+
+def get_contributor_index() -> ContributorIndex:
+    """Return the shared contributor index over all tags and HEAD, building it once."""
+    global _contributor_index
+    if _contributor_index is None:
+        _contributor_index = ContributorIndex(get_history())
+    return _contributor_index
+
+
+def get_contributors(old_tag: str | None, new_tag: str) -> list[str]:
+    """Return deduplicated, normalized author names between two tags.
+
+    Versions with a stored snapshot use its list; ranges between commits
+    the :class:`ContributorIndex` knows are resolved from it; others fall
+    back to a ``git log`` walk.
+    """
+    stored = get_snapshot(new_tag)
+    if stored is not None and stored.previous == old_tag:
+        return stored.contributors
+    index = get_contributor_index()
+    new_sha = commit_sha(new_tag)
+    old_sha = commit_sha(old_tag) if old_tag else None
+    if new_sha in index and (old_sha is None or old_sha in index):
+        return index.contributors(old_sha, new_sha)
+    return _dedup_authors(get_backend().authors(old_tag, new_tag))
 
 
 # ---------------------------------------------------------------------------
@@ -178,8 +561,12 @@ class APISpec:
 
 def parse_workflow_api(yaml_text: str) -> APISpec | None:
     """Extract the public API surface from a workflow YAML string."""
+    import yaml  # loaded on first parse: --help and fully cached runs never need it
+
+    from scripts.parsers.yaml_extract import WORKFLOW_API_FIELDS, extract
+
     try:
-        data = yaml.safe_load(yaml_text)
+        data = extract(yaml_text, WORKFLOW_API_FIELDS)
     except yaml.YAMLError:
         return None
     if not data or not isinstance(data, dict):
@@ -222,8 +609,12 @@ def parse_workflow_api(yaml_text: str) -> APISpec | None:
 
 def parse_action_api(yaml_text: str) -> APISpec | None:
     """Extract the public API surface from an action YAML string."""
+    import yaml
+
+    from scripts.parsers.yaml_extract import ACTION_FIELDS, extract
+
     try:
-        data = yaml.safe_load(yaml_text)
+        data = extract(yaml_text, ACTION_FIELDS)
     except yaml.YAMLError:
         return None
     if not data or not isinstance(data, dict):
@@ -251,6 +642,21 @@ def parse_action_api(yaml_text: str) -> APISpec | None:
     return APISpec(name=name, inputs=inputs, outputs=outputs)
 
 
+# Parsed API specs keyed by (kind, blob OID).  Blob content is immutable, so
+# each distinct file version is read and parsed at most once per run no
+# matter how many tag pairs it appears in.
+_API_CACHE: dict[tuple[str, str], APISpec | None] = {}
+
+
+def load_api(kind: str, oid: str) -> APISpec | None:
+    """Return the parsed API of the *kind* ("workflow"/"action") blob *oid*."""
+    key = (kind, oid)
+    if key not in _API_CACHE:
+        parse = parse_workflow_api if kind == "workflow" else parse_action_api
+        _API_CACHE[key] = parse(read_blob(oid))
+    return _API_CACHE[key]
+
+
 # ---------------------------------------------------------------------------
 # Diff engine
 # ---------------------------------------------------------------------------
@@ -282,8 +688,9 @@ class FileDiff:
     """Changes to a single workflow or action file."""
     key: str  # workflow/action identifier (e.g. "ios-selfhosted-test")
     kind: str  # "workflow" or "action"
-    status: str  # "added", "removed", "changed", "internal"
+    status: str  # "added", "removed", "renamed", "changed", "internal"
     name: str = ""
+    old_key: str = ""  # previous identifier, for renames
     input_changes: list[InputChange] = field(default_factory=list)
     secret_changes: list[SecretChange] = field(default_factory=list)
     output_changes: list[OutputChange] = field(default_factory=list)
@@ -301,6 +708,15 @@ class FileDiff:
         )
 
 
+def file_diff_from_dict(data: dict) -> FileDiff:
+    """Rebuild a :class:`FileDiff` from its ``dataclasses.asdict`` form."""
+    data = dict(data)
+    data["input_changes"] = [InputChange(**c) for c in data["input_changes"]]
+    data["secret_changes"] = [SecretChange(**c) for c in data["secret_changes"]]
+    data["output_changes"] = [OutputChange(**c) for c in data["output_changes"]]
+    return FileDiff(**data)
+
+
 def _diff_inputs(
     old: dict[str, InputInfo], new: dict[str, InputInfo]
 ) -> list[InputChange]:
@@ -364,104 +780,263 @@ def _diff_outputs(
     return changes
 
 
-def diff_tags(old_tag: str, new_tag: str) -> list[FileDiff]:
-    """Compute all workflow/action API diffs between two tags."""
-    diffs: list[FileDiff] = []
-    pr_summaries = get_merge_pr_summaries(old_tag, new_tag)
+def _workflow_key(path: str) -> str | None:
+    """Return the workflow key for *path*, or None if it isn't a tracked workflow."""
+    if not path.startswith(WORKFLOW_PREFIX) or not path.endswith(".yml"):
+        return None
+    key = Path(path).stem
+    return None if key in ("deploy-docs",) else key
 
-    # --- Workflows ---
-    old_wfs = {
-        Path(p).stem: p
-        for p in list_files_at_tag(old_tag, WORKFLOW_PREFIX, ".yml")
-    }
-    new_wfs = {
-        Path(p).stem: p
-        for p in list_files_at_tag(new_tag, WORKFLOW_PREFIX, ".yml")
-    }
 
-    for key in sorted(set(old_wfs) | set(new_wfs)):
-        if key in ("deploy-docs",):
+def _action_key(path: str) -> str | None:
+    """Return the action key for *path*, or None if it isn't an action.yml."""
+    if not path.startswith(ACTION_PREFIX) or not path.endswith("action.yml"):
+        return None
+    return Path(path).parent.name
+
+
+def _diff_changes(
+    kind: str,
+    changes: list[PathChange],
+    key_of,
+    pr_summaries: dict[str, list[str]],
+) -> list[FileDiff]:
+    """Turn the changed paths of one *kind* into FileDiffs, sorted by key."""
+    diffs: dict[str, FileDiff] = {}
+    for change in changes:
+        old_key = key_of(change.old_path) if change.old_path else None
+        new_key = key_of(change.new_path) if change.new_path else None
+
+        if old_key is None and new_key is None:
             continue
-
-        if key not in old_wfs:
-            path = new_wfs[key]
-            api = parse_workflow_api(read_file_at_tag(new_tag, path))
-            diffs.append(FileDiff(
-                key=key, kind="workflow", status="added",
-                name=api.name if api else key,
-            ))
-        elif key not in new_wfs:
-            api = parse_workflow_api(read_file_at_tag(old_tag, old_wfs[key]))
-            diffs.append(FileDiff(
-                key=key, kind="workflow", status="removed",
-                name=api.name if api else key,
-            ))
+        if old_key is None:
+            api = load_api(kind, change.new_oid)
+            diffs[new_key] = FileDiff(
+                key=new_key, kind=kind, status="added",
+                name=api.name if api else new_key,
+            )
+        elif new_key is None:
+            api = load_api(kind, change.old_oid)
+            diffs[old_key] = FileDiff(
+                key=old_key, kind=kind, status="removed",
+                name=api.name if api else old_key,
+            )
         else:
-            old_text = read_file_at_tag(old_tag, old_wfs[key])
-            new_text = read_file_at_tag(new_tag, new_wfs[key])
-            if old_text == new_text:
+            renamed = old_key != new_key
+            if change.old_oid == change.new_oid and not renamed:
                 continue
-            old_api = parse_workflow_api(old_text)
-            new_api = parse_workflow_api(new_text)
+            old_api = load_api(kind, change.old_oid)
+            new_api = load_api(kind, change.new_oid)
             if not old_api or not new_api:
+                if renamed:
+                    diffs[new_key] = FileDiff(
+                        key=new_key, kind=kind, status="renamed",
+                        name=new_api.name if new_api else new_key, old_key=old_key,
+                    )
                 continue
 
             fd = FileDiff(
-                key=key, kind="workflow", status="changed",
+                key=new_key, kind=kind, status="changed",
                 name=new_api.name,
                 input_changes=_diff_inputs(old_api.inputs, new_api.inputs),
                 secret_changes=_diff_secrets(old_api.secrets, new_api.secrets),
                 output_changes=_diff_outputs(old_api.outputs, new_api.outputs),
-                pr_summaries=pr_summaries.get(new_wfs[key], []),
+                pr_summaries=pr_summaries.get(change.new_path, []),
             )
-            fd.status = "changed" if fd.has_api_changes else "internal"
-            diffs.append(fd)
+            if renamed:
+                fd.status = "renamed"
+                fd.old_key = old_key
+            else:
+                fd.status = "changed" if fd.has_api_changes else "internal"
+            diffs[new_key] = fd
+    return [diffs[key] for key in sorted(diffs)]
+
+
+def _tag_changes(old_tag: str, new_tag: str) -> list[PathChange]:
+    """Return the workflow/action paths that differ between two tags."""
+    if get_snapshot(old_tag) or get_snapshot(new_tag):
+        return diff_trees(tracked_blobs(old_tag), tracked_blobs(new_tag))
+    return get_backend().changed_paths(old_tag, new_tag, [WORKFLOW_PREFIX, ACTION_PREFIX])
+
+
+def tag_renames(old_tag: str, new_tag: str) -> dict[tuple[str, str], str]:
+    """Return ``{(kind, new_key): old_key}`` for workflows/actions renamed between two tags."""
+    renames: dict[tuple[str, str], str] = {}
+    for change in _tag_changes(old_tag, new_tag):
+        if change.status != "R":
+            continue
+        kind = _kind_of(change.new_path)
+        if kind is None or _kind_of(change.old_path) != kind:
+            continue
+        key_of = _workflow_key if kind == "workflow" else _action_key
+        old_key, new_key = key_of(change.old_path), key_of(change.new_path)
+        if old_key != new_key:
+            renames[(kind, new_key)] = old_key
+    return renames
 
-    # --- Actions ---
-    old_acts = {
-        Path(p).parent.name: p
-        for p in list_files_at_tag(old_tag, ACTION_PREFIX, "action.yml")
-    }
-    new_acts = {
-        Path(p).parent.name: p
-        for p in list_files_at_tag(new_tag, ACTION_PREFIX, "action.yml")
+
+def diff_tags(old_tag: str, new_tag: str) -> list[FileDiff]:
+    """Compute all workflow/action API diffs between two tags.
+
+    Only the paths git reports as changed between the two trees are read
+    and parsed; unchanged files never leave the object database.  A side
+    with a stored :class:`ReleaseSnapshot` is taken from the snapshot, so
+    its commit doesn't need to be present at all.
+    """
+    pr_summaries = get_merge_pr_summaries(old_tag, new_tag)
+    changes = _tag_changes(old_tag, new_tag)
+    return (
+        _diff_changes("workflow", changes, _workflow_key, pr_summaries)
+        + _diff_changes("action", changes, _action_key, pr_summaries)
+    )
+
+
+# ---------------------------------------------------------------------------
+# API snapshots
+# ---------------------------------------------------------------------------
+
+# Bump whenever APISpec or the parsers change, so older snapshots are ignored.
+SNAPSHOT_VERSION = 1
+
+
+def api_spec_from_dict(data: dict) -> APISpec:
+    """Rebuild an :class:`APISpec` from its ``dataclasses.asdict`` form."""
+    return APISpec(
+        name=data["name"],
+        inputs={k: InputInfo(**v) for k, v in data["inputs"].items()},
+        secrets={k: SecretInfo(**v) for k, v in data["secrets"].items()},
+        outputs={k: OutputInfo(**v) for k, v in data["outputs"].items()},
+    )
+
+
+@dataclass
+class ReleaseSnapshot:
+    """Everything the changelog needs to know about one release.
+
+    The parsed API of every workflow and action (with blob OIDs for change
+    detection), plus the release's previous tag and the contributors and
+    PR summaries of that range — enough to diff and render the release
+    without its git history.
+    """
+    tag: str
+    sha: str
+    date: str
+    previous: str | None
+    files: dict[str, str] = field(default_factory=dict)  # path -> blob OID
+    apis: dict[str, APISpec | None] = field(default_factory=dict)  # path -> API
+    contributors: list[str] = field(default_factory=list)
+    pr_summaries: dict[str, list[str]] = field(default_factory=dict)
+
+
+def release_snapshot_from_dict(data: dict) -> ReleaseSnapshot:
+    """Rebuild a :class:`ReleaseSnapshot` from its ``dataclasses.asdict`` form."""
+    data = dict(data)
+    data["apis"] = {
+        path: api_spec_from_dict(api) if api is not None else None
+        for path, api in data["apis"].items()
     }
+    return ReleaseSnapshot(**data)
 
-    for key in sorted(set(old_acts) | set(new_acts)):
-        if key not in old_acts:
-            path = new_acts[key]
-            api = parse_action_api(read_file_at_tag(new_tag, path))
-            diffs.append(FileDiff(
-                key=key, kind="action", status="added",
-                name=api.name if api else key,
-            ))
-        elif key not in new_acts:
-            api = parse_action_api(read_file_at_tag(old_tag, old_acts[key]))
-            diffs.append(FileDiff(
-                key=key, kind="action", status="removed",
-                name=api.name if api else key,
-            ))
-        else:
-            old_text = read_file_at_tag(old_tag, old_acts[key])
-            new_text = read_file_at_tag(new_tag, new_acts[key])
-            if old_text == new_text:
-                continue
-            old_api = parse_action_api(old_text)
-            new_api = parse_action_api(new_text)
-            if not old_api or not new_api:
-                continue
 
-            fd = FileDiff(
-                key=key, kind="action", status="changed",
-                name=new_api.name,
-                input_changes=_diff_inputs(old_api.inputs, new_api.inputs),
-                output_changes=_diff_outputs(old_api.outputs, new_api.outputs),
-                pr_summaries=pr_summaries.get(new_acts[key], []),
-            )
-            fd.status = "changed" if fd.has_api_changes else "internal"
-            diffs.append(fd)
+def _kind_of(path: str) -> str | None:
+    """Return ``"workflow"`` or ``"action"`` for a tracked path, else None."""
+    if _workflow_key(path) is not None:
+        return "workflow"
+    if _action_key(path) is not None:
+        return "action"
+    return None
+
+
+class SnapshotStore:
+    """Directory of release snapshots, one ``<tag>.json`` per release.
+
+    Small enough to commit or keep as a CI artifact; with it, a shallow
+    clone renders every stored release without fetching its history.
+    Snapshots of another :data:`SNAPSHOT_VERSION`, or of a tag that has
+    since moved, are ignored.  Loading one seeds the parsed-API cache, so
+    its blobs are never read from git.
+    """
 
-    return diffs
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._loaded: dict[str, ReleaseSnapshot | None] = {}
+
+    def _file(self, tag: str) -> Path:
+        return self.path / f"{tag}.json"
+
+    def _read(self, tag: str) -> ReleaseSnapshot | None:
+        try:
+            data = json.loads(self._file(tag).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != SNAPSHOT_VERSION:
+            return None
+        snapshot = release_snapshot_from_dict(data["release"])
+        for path, oid in snapshot.files.items():
+            _API_CACHE.setdefault((_kind_of(path), oid), snapshot.apis.get(path))
+        return snapshot
+
+    def get(self, tag: str, sha: str) -> ReleaseSnapshot | None:
+        """Return the snapshot of *tag* if one exists for commit *sha*."""
+        if tag not in self._loaded:
+            self._loaded[tag] = self._read(tag)
+        snapshot = self._loaded[tag]
+        return snapshot if snapshot is not None and snapshot.sha == sha else None
+
+    def put(self, snapshot: ReleaseSnapshot) -> Path:
+        """Write *snapshot* to the store and return its path."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        path = self._file(snapshot.tag)
+        data = {"version": SNAPSHOT_VERSION, "release": asdict(snapshot)}
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        self._loaded[snapshot.tag] = snapshot
+        return path
+
+
+_snapshot_store: SnapshotStore | None = None
+
+
+def set_snapshot_store(store: SnapshotStore | None) -> None:
+    """Consult *store* for release snapshots (None to read everything from git)."""
+    global _snapshot_store
+    _snapshot_store = store
+
+
+def get_snapshot(tag: str) -> ReleaseSnapshot | None:
+    """Return the stored snapshot of release *tag*, if there is a current one."""
+    if _snapshot_store is None or tag not in get_tag_snapshot():
+        return None
+    return _snapshot_store.get(tag, commit_sha(tag))
+
+
+def tracked_blobs(tag: str) -> dict[str, str]:
+    """Return ``{path: blob_oid}`` for every workflow and action at *tag*."""
+    stored = get_snapshot(tag)
+    if stored is not None:
+        return dict(stored.files)
+    return {
+        path: oid
+        for prefix in (WORKFLOW_PREFIX, ACTION_PREFIX)
+        for path, oid in get_backend().list_tree(tag, prefix)
+        if _kind_of(path) is not None
+    }
+
+
+def snapshot_release(tag: str) -> ReleaseSnapshot:
+    """Capture the API surface and changelog metadata of release *tag*."""
+    previous = get_previous_tag(tag)
+    files = tracked_blobs(tag)
+    pr_summaries = get_merge_pr_summaries(previous, tag) if previous else {}
+    return ReleaseSnapshot(
+        tag=tag,
+        sha=commit_sha(tag),
+        date=get_tag_date(tag),
+        previous=previous,
+        files=files,
+        apis={path: load_api(_kind_of(path), oid) for path, oid in files.items()},
+        contributors=get_contributors(previous, tag),
+        pr_summaries={p: s for p, s in pr_summaries.items() if p in files},
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -544,9 +1119,11 @@ def render_version(
     breaking = [d for d in file_diffs if d.has_breaking_changes]
     added = [d for d in file_diffs if d.status == "added"]
     removed = [d for d in file_diffs if d.status == "removed"]
+    renamed = [d for d in file_diffs if d.status == "renamed"]
     api_changed = [
         d for d in file_diffs
-        if d.status == "changed" and not d.has_breaking_changes
+        if d.status in ("changed", "renamed") and d.has_api_changes
+        and not d.has_breaking_changes
     ]
     internal = [d for d in file_diffs if d.status == "internal"]
 
@@ -591,6 +1168,14 @@ def render_version(
             lines.append(f"- Removed {d.kind} `{d.key}`")
         lines.append("")
 
+    # --- Renamed workflows & actions ---
+    if renamed:
+        lines.append("### Renamed workflows & actions")
+        lines.append("")
+        for d in renamed:
+            lines.append(f"- Renamed {d.kind} `{d.old_key}` to `{d.key}`")
+        lines.append("")
+
     # --- Input / secret / output changes (non-breaking) ---
     all_api_changed = api_changed + [
         d for d in breaking if d.has_api_changes
@@ -639,98 +1224,633 @@ def render_version(
 def get_version_diff(version: str) -> tuple[str, list[FileDiff]] | None:
     """Return (previous_tag, diffs) for the given version tag.
 
-    Returns None if version is not a tag, is the first tag, or is a
-    re-tag of the same commit as its predecessor.
+    The previous tag is the nearest ancestor release (see
+    :func:`get_previous_tag`).  Returns None if version is not a tag, has
+    no previous release, or is a re-tag of the same commit.
     """
-    tags = get_sorted_tags()
-    if version not in tags:
+    if version not in get_tag_snapshot():
         return None
-    idx = tags.index(version)
-    if idx == 0:
+    old_tag = get_previous_tag(version)
+    if old_tag is None:
         return None
-    old_tag = tags[idx - 1]
-    if _git("rev-parse", old_tag) == _git("rev-parse", version):
+    if commit_sha(old_tag) == commit_sha(version):
         return None
-    return (old_tag, diff_tags(old_tag, version))
+    _entry, diffs = cached_version(version, old_tag)
+    return (old_tag, diffs)
 
 
 def get_head_diff() -> tuple[str, str, list[FileDiff]] | None:
-    """Return (latest_tag, version_label, diffs) diffing HEAD against the latest tag.
+    """Return (latest_tag, version_label, diffs) diffing HEAD against the latest release.
 
     Used for branch builds (main, feature/*, etc.) to show unreleased
-    changes since the last release. Returns None if no tags exist or
-    no API changes found.
+    changes since the last release HEAD descends from. Returns None if no
+    tags exist or no API changes found.
     """
     tags = get_sorted_tags()
     if not tags:
         return None
-    latest = tags[-1]
-    diffs = diff_tags(latest, "HEAD")
+    latest = get_nearest_release("HEAD") or tags[-1]
+    # HEAD moves with every commit, so its diff isn't worth caching.
+    _entry, diffs = build_version("HEAD", latest)
     if not diffs:
         return None
     return (latest, "unreleased", diffs)
 
 
+def _archive_sort_key(label: str) -> tuple[int, int]:
+    major = label.split(".", 1)[0]
+    return (0, -int(major)) if major.isdigit() else (1, 0)
+
+
+def list_changelog_archives(docs_dir: Path = DOCS_DIR) -> list[str]:
+    """Return the archived changelog page labels (e.g. "1.x"), newest first."""
+    archive_dir = docs_dir / "changelog"
+    if not archive_dir.is_dir():
+        return []
+    return sorted((p.stem for p in archive_dir.glob("*.md")), key=_archive_sort_key)
+
+
 # ---------------------------------------------------------------------------
-# Main
+# Result cache
 # ---------------------------------------------------------------------------
 
 
-def main() -> None:
-    tags = get_sorted_tags()
-    if not tags:
-        print("No version tags found.", file=sys.stderr)
-        sys.exit(1)
+def _generator_stamp() -> str:
+    """Return a version stamp that changes whenever this generator does.
 
-    print(f"Found {len(tags)} tags: {', '.join(tags)}")
+    Covers every module that shapes a cached entry or timeline row: this
+    file, the API timeline, the YAML parsers and the git backends.
+    """
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update((SCRIPT_DIR / "api_timeline.py").read_bytes())
+    for package in ("parsers", "git_backends"):
+        for path in sorted((SCRIPT_DIR / package).glob("*.py")):
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class ChangelogCache:
+    """On-disk cache of rendered changelog entries, one per version.
+
+    Each entry is stored with the :class:`FileDiff` list it was rendered
+    from and keyed by the old/new commit SHAs of its tag pair.  The whole
+    file is tied to the generator stamp, so any change to the diff engine
+    or rendering invalidates it.  Released tags never move, which makes a
+    run cost proportional to the number of new versions only.
+
+    The file is JSON lines: a header with the stamp, then one line per
+    version.  Only each stored version's key and line offset are kept in
+    memory; entries are read when asked for, and the ones used or added
+    in a run are streamed to a new file that replaces the old one on
+    :meth:`save`, so memory doesn't grow with the number of versions.
+    """
 
-    entries: list[str] = []
+    def __init__(self, path: Path | None) -> None:
+        self._path = path
+        self._stamp = _generator_stamp()
+        self._stored: dict[str, tuple[str, int]] = {}  # tag -> (key, line offset)
+        self._source = None  # the stored file, open for reading
+        self._out = None  # the next version of the file, being written
+        self._written: set[str] = set()
+        self._added = False
+        self._load()
+
+    def _load(self) -> None:
+        if self._path is None:
+            return
+        try:
+            source = open(self._path, "rb")
+        except OSError:
+            return
+        try:
+            header = json.loads(source.readline())
+            if not isinstance(header, dict) or header.get("stamp") != self._stamp:
+                source.close()
+                return
+            offset = source.tell()
+            for line in source:
+                record = json.loads(line)
+                # A later line for the same tag wins.
+                self._stored[record["tag"]] = (record["key"], offset)
+                offset += len(line)
+        except (ValueError, KeyError, TypeError):
+            self._stored = {}
+            source.close()
+            return
+        self._source = source
+
+    def _line(self, tag: str) -> bytes:
+        self._source.seek(self._stored[tag][1])
+        return self._source.readline()
+
+    def _open_out(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._out = open(self._path.with_name(self._path.name + ".tmp"), "wb")
+        self._out.write(json.dumps({"stamp": self._stamp}).encode() + b"\n")
+
+    def _emit(self, tag: str, line: bytes) -> None:
+        """Append *tag*'s line to the file :meth:`save` puts in place."""
+        if self._path is None:
+            return
+        if self._out is None:
+            self._open_out()
+        self._out.write(line if line.endswith(b"\n") else line + b"\n")
+        self._written.add(tag)
+
+    @staticmethod
+    def key(old_tag: str | None, new_tag: str) -> str:
+        """Return the cache key for the ``old_tag..new_tag`` pair."""
+        old = f"{old_tag}@{commit_sha(old_tag)}" if old_tag else ""
+        return f"{old}..{new_tag}@{commit_sha(new_tag)}"
+
+    def get(self, tag: str, key: str) -> tuple[str, list[FileDiff]] | None:
+        """Return ``(entry, diffs)`` cached for *tag* under *key*, if any."""
+        if not self.has(tag, key):
+            return None
+        line = self._line(tag)
+        if tag not in self._written:
+            self._emit(tag, line)
+        cached = json.loads(line)
+        return cached["entry"], [file_diff_from_dict(d) for d in cached["diffs"]]
+
+    def has(self, tag: str, key: str) -> bool:
+        cached = self._stored.get(tag)
+        return cached is not None and cached[0] == key
+
+    def put(self, tag: str, key: str, entry: str, diffs: list[FileDiff]) -> None:
+        record = {"tag": tag, "key": key, "entry": entry, "diffs": [asdict(d) for d in diffs]}
+        self._emit(tag, json.dumps(record, ensure_ascii=False).encode())
+        self._added = True
+
+    def save(self, prune: bool = True) -> None:
+        """Put the entries used in this run in place of the stored file.
+
+        With *prune*, every other entry is dropped (a full changelog run
+        touches every live version); without it they are kept, and the file
+        is left alone if nothing was added.
+        """
+        if self._path is None:
+            return
+        if not prune and not self._added:
+            if self._out is not None:
+                self._out.close()
+                os.unlink(self._out.name)
+                self._out, self._written = None, set()
+            return
+        if not prune:
+            for tag in self._stored.keys() - self._written:
+                self._emit(tag, self._line(tag))
+        if self._out is None:
+            self._open_out()
+        self._out.close()
+        if self._source is not None:
+            self._source.close()
+        os.replace(self._out.name, self._path)
+        self._stored, self._source, self._out, self._written = {}, None, None, set()
+        self._added = False
+        self._load()
+
+
+_changelog_cache: ChangelogCache | None = None
+
+
+def get_changelog_cache() -> ChangelogCache:
+    """Return the shared result cache at CACHE_PATH, loading it on first use."""
+    global _changelog_cache
+    if _changelog_cache is None:
+        _changelog_cache = ChangelogCache(CACHE_PATH)
+    return _changelog_cache
+
+
+def cached_version(tag: str, old_tag: str | None) -> tuple[str, list[FileDiff]]:
+    """Return :func:`build_version` for the pair, through the shared result cache.
+
+    Lets generate-docs reuse what generate_changelog.py computed (and vice
+    versa), so each tag pair is diffed once per deploy.  New results are
+    written back by :func:`save_changelog_cache`.
+    """
+    cache = get_changelog_cache()
+    key = cache.key(old_tag, tag)
+    cached = cache.get(tag, key)
+    if cached is not None:
+        return cached
+    entry, diffs = build_version(tag, old_tag)
+    cache.put(tag, key, entry, diffs)
+    return entry, diffs
 
-    for i, tag in enumerate(tags):
-        date = get_tag_date(tag)
 
-        if i == 0:
-            # Initial release — list all workflows/actions as "added"
-            wf_files = list_files_at_tag(tag, WORKFLOW_PREFIX, ".yml")
-            diffs = []
-            for p in wf_files:
-                key = Path(p).stem
-                if key in ("deploy-docs",):
-                    continue
-                api = parse_workflow_api(read_file_at_tag(tag, p))
-                diffs.append(FileDiff(
-                    key=key, kind="workflow", status="added",
-                    name=api.name if api else key,
-                ))
-            contributors = get_contributors(None, tag)
-            entries.append(render_version(tag, date, diffs, contributors, is_initial=True))
+def save_changelog_cache() -> None:
+    """Write back what :func:`cached_version` added, keeping the other entries."""
+    if _changelog_cache is not None:
+        _changelog_cache.save(prune=False)
+
+
+# ---------------------------------------------------------------------------
+# API timeline
+# ---------------------------------------------------------------------------
+
+_EMPTY_API = APISpec(name="")
+
+
+def release_apis(tag: str) -> dict[tuple[str, str], APISpec | None]:
+    """Return ``{(kind, key): api}`` for every workflow and action at *tag*."""
+    apis: dict[tuple[str, str], APISpec | None] = {}
+    for path, oid in tracked_blobs(tag).items():
+        kind = _kind_of(path)
+        key = _workflow_key(path) if kind == "workflow" else _action_key(path)
+        apis[(kind, key)] = load_api(kind, oid)
+    return apis
+
+
+def api_events(
+    old: dict[tuple[str, str], APISpec | None],
+    new: dict[tuple[str, str], APISpec | None],
+    renames: dict[tuple[str, str], str] | None = None,
+) -> dict[tuple[str, str], list[Event]]:
+    """Return the input/secret/output changes between two :func:`release_apis` maps.
+
+    Files that appear or disappear count as all their items being added or
+    removed; files that fail to parse on either side are left out.  A file
+    in *renames* (see :func:`tag_renames`) is compared with its old key.
+    """
+    renames = renames or {}
+    moved = {(kind, old_key) for (kind, _key), old_key in renames.items()}
+    events: dict[tuple[str, str], list[Event]] = {}
+    for item in sorted(set(old) | set(new)):
+        if item in moved and item not in new:
+            continue  # reported under its new key
+        source = (item[0], renames[item]) if item in renames else item
+        if (source in old and old[source] is None) or (item in new and new[item] is None):
+            continue
+        o, n = old.get(source) or _EMPTY_API, new.get(item) or _EMPTY_API
+        changes = [
+            *(("input", c.name, c.change, c.details) for c in _diff_inputs(o.inputs, n.inputs)),
+            *(("secret", c.name, c.change, c.details) for c in _diff_secrets(o.secrets, n.secrets)),
+            *(("output", c.name, c.change, c.details) for c in _diff_outputs(o.outputs, n.outputs)),
+        ]
+        if changes:
+            events[item] = changes
+    return events
+
+
+def update_timeline(timeline: ApiTimeline, tags: list[str]) -> int:
+    """Index every release in *tags* that isn't indexed under its current key.
+
+    Each release is compared with its previous release (see
+    :func:`get_previous_tag`), following renamed files; returns the number
+    of releases (re)indexed.
+    """
+    surfaces: dict[str, dict[tuple[str, str], APISpec | None]] = {}
+
+    def surface(tag: str) -> dict[tuple[str, str], APISpec | None]:
+        if tag not in surfaces:
+            surfaces[tag] = release_apis(tag)
+        return surfaces[tag]
+
+    updated = 0
+    for rank, tag in enumerate(tags):
+        previous = get_previous_tag(tag)
+        key = ChangelogCache.key(previous, tag)
+        if timeline.release_key(tag) == key:
+            timeline.set_rank(tag, rank)
+            continue
+        old = surface(previous) if previous else {}
+        renames = tag_renames(previous, tag) if previous else {}
+        timeline.put_release(
+            tag, rank, previous, key, api_events(old, surface(tag), renames), renames,
+        )
+        updated += 1
+    timeline.retain(tags)
+    timeline.commit()
+    return updated
+
+
+# ---------------------------------------------------------------------------
+# Writer
+# ---------------------------------------------------------------------------
+
+CHANGELOG_HEADER = "# Changelog\n\nAll notable changes to Futured CI/CD Workflows.\n\n"
+
+
+def _major_label(tag: str) -> str:
+    """Return the archive page label for *tag*, e.g. "2.x" for "2.1.0"."""
+    match = re.match(r"v?(\d+)", tag)
+    return f"{match.group(1)}.x" if match else "other"
+
+
+class ChangelogWriter:
+    """Streams rendered versions to disk, newest first, as they finish.
+
+    Without *split* every version goes to ``changelog.md``.  With *split*
+    = N the latest N versions stay there and older ones are archived into
+    one ``changelog/<major>.x.md`` page per major version, linked from the
+    bottom of the main page.  Only the entry being written is held in
+    memory; :class:`ChangelogCache` streams its copy to disk as well.
+    """
+
+    def __init__(self, docs_dir: Path, newest_first: list[str], split: int = 0) -> None:
+        self._docs_dir = docs_dir
+        self._archive_of: dict[str, str] = {}
+        if split > 0:
+            for tag in newest_first[split:]:
+                self._archive_of[tag] = _major_label(tag)
+        self.archives = list(dict.fromkeys(self._archive_of.values()))
+        self.written: list[Path] = []
+        self._file = None
+        self._label: str | None = None
+        self._count = 0
+        self._open(docs_dir / "changelog.md", CHANGELOG_HEADER)
+
+    @staticmethod
+    def _tmp(path: Path) -> Path:
+        return path.with_name(path.name + ".tmp")
+
+    def _open(self, path: Path, header: str) -> None:
+        self._close_page()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path in self.written:
+            # Out-of-order major (unusual tag names) — keep appending.
+            self._file = open(self._tmp(path), "a", encoding="utf-8")
+            self._count = 1
         else:
-            old_tag = tags[i - 1]
-
-            # Skip if tags point to the same commit
-            old_sha = _git("rev-parse", old_tag)
-            new_sha = _git("rev-parse", tag)
-            if old_sha == new_sha:
-                entries.append(
-                    f"## {tag}\n\n_{date}_\n\n"
-                    f"Same as {old_tag} (re-tagged).\n"
-                )
+            self._file = open(self._tmp(path), "w", encoding="utf-8")
+            self._file.write(header)
+            self._count = 0
+            self.written.append(path)
+
+    def _close_page(self) -> None:
+        if self._file is None:
+            return
+        if self._label is None and self.archives:
+            links = "".join(f"- [{label}](changelog/{label}.md)\n" for label in self.archives)
+            self._file.write(f"\n---\n\n## Older releases\n\n{links}")
+        self._file.close()
+        self._file = None
+
+    def write(self, tag: str, entry: str) -> None:
+        label = self._archive_of.get(tag)
+        if label != self._label:
+            self._close_page()
+            self._label = label
+            self._open(
+                self._docs_dir / "changelog" / f"{label}.md",
+                f"# Changelog — {label}\n\n"
+                f"Archived {label} releases. See the [changelog](../changelog.md) "
+                f"for the latest versions.\n\n",
+            )
+        if self._count:
+            self._file.write("\n---\n\n")
+        self._file.write(entry)
+        self._count += 1
+
+    def close(self) -> None:
+        """Move the finished pages into place and remove archive pages no longer produced.
+
+        Pages are written to ``.tmp`` siblings until now, so a run that fails
+        part-way leaves the previous changelog untouched.
+        """
+        self._close_page()
+        for path in self.written:
+            os.replace(self._tmp(path), path)
+        archive_dir = self._docs_dir / "changelog"
+        if archive_dir.is_dir():
+            for stale in archive_dir.glob("*.md"):
+                if stale not in self.written:
+                    stale.unlink()
+            if not any(archive_dir.iterdir()):
+                archive_dir.rmdir()
+
+    def discard(self) -> None:
+        """Drop the partially written pages, leaving the previous ones in place."""
+        self._close_page()
+        for path in self.written:
+            self._tmp(path).unlink(missing_ok=True)
+        self.written = []
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def build_version(tag: str, old_tag: str | None) -> tuple[str, list[FileDiff]]:
+    """Render the entry for *tag* against *old_tag* (None for the first release).
+
+    Returns ``(markdown, diffs)``.
+    """
+    date = get_tag_date(tag)
+
+    if old_tag is None:
+        # Initial release — list all workflows/actions as "added"
+        diffs = []
+        for p, oid in tracked_blobs(tag).items():
+            key = _workflow_key(p)
+            if key is None:
                 continue
+            api = load_api("workflow", oid)
+            diffs.append(FileDiff(
+                key=key, kind="workflow", status="added",
+                name=api.name if api else key,
+            ))
+        contributors = get_contributors(None, tag)
+        return render_version(tag, date, diffs, contributors, is_initial=True), diffs
+
+    # Skip if tags point to the same commit
+    if commit_sha(old_tag) == commit_sha(tag):
+        return f"## {tag}\n\n_{date}_\n\nSame as {old_tag} (re-tagged).\n", []
+
+    with phase("diff"):
+        diffs = diff_tags(old_tag, tag)
+        contributors = get_contributors(old_tag, tag)
+    return render_version(tag, date, diffs, contributors), diffs
+
+
+def _init_worker(
+    backend: GitBackend,
+    store: SnapshotStore | None,
+    tag_snapshot: TagSnapshot,
+    merge_index: MergeIndex,
+    release_graph: ReleaseGraph,
+    contributor_index: ContributorIndex,
+) -> None:
+    """Install the parent's backend copy, snapshot store and history indexes."""
+    global _backend, _snapshot_store, _tag_snapshot
+    global _merge_index, _release_graph, _contributor_index
+    _backend = backend
+    _snapshot_store = store
+    _tag_snapshot = tag_snapshot
+    _merge_index = merge_index
+    _release_graph = release_graph
+    _contributor_index = contributor_index
+
+
+def iter_versions(
+    pairs: list[tuple[str, str | None]], jobs: int = 1
+) -> Iterator[tuple[str, list[FileDiff]]]:
+    """Yield :func:`build_version` results for each ``(tag, old_tag)`` pair.
+
+    With *jobs* > 1 the pairs are spread over a process pool.  Results are
+    yielded in the order of *pairs* either way — as soon as each one (and
+    everything before it) is done — so output is identical to a serial run.
+    """
+    if jobs <= 1 or len(pairs) < 2:
+        for tag, old_tag in pairs:
+            yield build_version(tag, old_tag)
+        return
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # The tag snapshot and history indexes are built once here and handed
+    # to every worker.  Forked workers get them for free; elsewhere (no
+    # fork on the platform) they are pickled into each worker once.
+    # Fork is asked for explicitly, as it's no longer the default from
+    # Python 3.14 on.
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork") if "fork" in methods else None
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(pairs)),
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(
+            get_backend().for_worker(),
+            _snapshot_store,
+            get_tag_snapshot(),
+            get_merge_index(),
+            get_release_graph(),
+            get_contributor_index(),
+        ),
+    ) as pool:
+        tags, old_tags = zip(*pairs)
+        yield from pool.map(build_version, tags, old_tags)
+
+
+def build_versions(
+    pairs: list[tuple[str, str | None]], jobs: int = 1
+) -> list[tuple[str, list[FileDiff]]]:
+    """Return :func:`iter_versions` results as a list."""
+    return list(iter_versions(pairs, jobs))
 
-            diffs = diff_tags(old_tag, tag)
-            contributors = get_contributors(old_tag, tag)
-            entries.append(render_version(tag, date, diffs, contributors))
 
-        print(f"  Generated: {tag}")
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate docs/changelog.md")
+    parser.add_argument(
+        "--no-batch",
+        action="store_true",
+        help="Spawn one git process per lookup instead of a persistent cat-file reader",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=CACHE_PATH,
+        help=f"Per-version result cache (default: {CACHE_PATH.relative_to(ROOT_DIR)})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Regenerate every version without reading or writing the cache",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for diffing tag pairs (0 = all CPUs)",
+    )
+    parser.add_argument(
+        "--split",
+        type=int,
+        default=0,
+        help="Keep only the latest N versions on changelog.md and archive "
+             "older ones per major version (0 = single page)",
+    )
+    parser.add_argument(
+        "--timeline",
+        type=Path,
+        default=TIMELINE_PATH,
+        help=f"API timeline index (default: {TIMELINE_PATH.relative_to(ROOT_DIR)})",
+    )
+    parser.add_argument(
+        "--no-timeline",
+        action="store_true",
+        help="Don't update the API timeline index",
+    )
+    parser.add_argument(
+        "--snapshots",
+        type=Path,
+        help="Directory of per-release API snapshots: releases found there are "
+             "rendered without their git history, missing ones are added",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Write a JSON phase/git profile to PATH and a Chrome trace next to it",
+    )
+    args = parser.parse_args()
+    if args.profile:
+        profiler.track_memory()
+    if args.no_batch:
+        set_backend(SubprocessBackend(REPO_ROOT))
+    if args.snapshots:
+        set_snapshot_store(SnapshotStore(args.snapshots))
 
-    # Combine entries (newest first)
-    header = "# Changelog\n\nAll notable changes to Futured CI/CD Workflows.\n\n"
+    tags = get_sorted_tags()
+    if not tags:
+        print("No version tags found.", file=sys.stderr)
+        sys.exit(1)
 
-    output = header + "\n---\n\n".join(reversed(entries))
+    print(f"Found {len(tags)} tags: {', '.join(tags)}")
 
-    output_path = ROOT_DIR / "docs" / "changelog.md"
-    output_path.write_text(output)
-    print(f"\nWritten: {output_path.relative_to(ROOT_DIR)}")
+    cache = ChangelogCache(None if args.no_cache else args.cache)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    # Entries are written newest first, so build them in that order too.
+    newest_first = tags[::-1]
+    with phase("releases"):
+        previous = {tag: get_previous_tag(tag) for tag in tags}
+    keys = {tag: cache.key(previous[tag], tag) for tag in tags}
+    pending = [(tag, previous[tag]) for tag in newest_first if not cache.has(tag, keys[tag])]
+    built = iter_versions(pending, jobs)
+
+    with phase("changelog"):
+        writer = ChangelogWriter(DOCS_DIR, newest_first, args.split)
+        try:
+            for tag in newest_first:
+                cached = cache.get(tag, keys[tag])
+                if cached is not None:
+                    writer.write(tag, cached[0])
+                    print(f"  Cached: {tag}")
+                    continue
+                entry, diffs = next(built)
+                cache.put(tag, keys[tag], entry, diffs)
+                writer.write(tag, entry)
+                print(f"  Generated: {tag}")
+        except BaseException:
+            writer.discard()
+            raise
+        writer.close()
+
+        cache.save()
+
+    print()
+    for path in writer.written:
+        print(f"Written: {path.relative_to(ROOT_DIR)}")
+    if not args.no_timeline:
+        with phase("timeline"):
+            timeline = ApiTimeline(args.timeline, _generator_stamp())
+            updated = update_timeline(timeline, tags)
+            timeline.close()
+        print(f"Indexed: {updated} release(s) in {args.timeline}")
+    if _snapshot_store is not None:
+        for tag in tags:
+            if get_snapshot(tag) is None:
+                with phase("snapshots"):
+                    path = _snapshot_store.put(snapshot_release(tag))
+                print(f"Snapshot: {path}")
+    if args.profile:
+        summary_path, trace_path = profiler.write(args.profile)
+        print(f"Profile: {summary_path} (trace: {trace_path})")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,137 @@
+"""Abstract interface for the git access used by the changelog generator."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Iterator
+
+
+@dataclass
+class TagInfo:
+    name: str
+    sha: str  # peeled commit SHA
+    date: str  # commit author date, YYYY-MM-DD
+
+
+@dataclass
+class CommitInfo:
+    """A commit as seen by a history walk."""
+
+    sha: str
+    parents: list[str]
+    author: str
+    subject: str
+    # Files changed against the first parent; only filled in for merges.
+    files: list[str] = field(default_factory=list)
+
+
+@dataclass
+class PathChange:
+    """A file-level change between two trees, as reported by ``diff-tree``."""
+
+    status: str  # "A" (added), "D" (deleted), "M" (modified) or "R" (renamed)
+    old_path: str  # empty for additions
+    new_path: str  # empty for deletions
+    old_oid: str = ""
+    new_oid: str = ""
+
+
+def diff_trees(old_tree: dict[str, str], new_tree: dict[str, str]) -> list[PathChange]:
+    """Diff two ``{path: blob_oid}`` maps the way ``diff-tree`` reports them.
+
+    Only exact-content renames are detected.
+    """
+    paths = sorted(
+        path for path in set(old_tree) | set(new_tree)
+        if old_tree.get(path) != new_tree.get(path)
+    )
+    changes = []
+    added = {new_tree[p]: p for p in paths if p not in old_tree}
+    for path in paths:
+        if path in old_tree and path in new_tree:
+            changes.append(PathChange("M", path, path, old_tree[path], new_tree[path]))
+        elif path in old_tree:
+            target = added.pop(old_tree[path], None)
+            if target:
+                changes.append(PathChange("R", path, target, old_tree[path], new_tree[target]))
+            else:
+                changes.append(PathChange("D", path, "", old_tree[path], ""))
+    for oid, path in added.items():
+        changes.append(PathChange("A", "", path, "", oid))
+    return changes
+
+
+class GitBackend(ABC):
+    """Interface for reading repository state.
+
+    The changelog generator only ever needs a handful of read operations:
+    listing a tree, reading blobs, resolving refs, listing tags and walking
+    history.  Implementations decide how those map onto git (one process
+    per call, long-lived pipes, or no git at all).
+    """
+
+    @abstractmethod
+    def list_tree(self, rev: str, prefix: str) -> list[tuple[str, str]]:
+        """Recursively list ``(path, blob_oid)`` for files under *prefix* at *rev*."""
+        ...
+
+    @abstractmethod
+    def read_blob(self, oid: str) -> str:
+        """Return the content of blob *oid*, or empty string if missing.
+
+        The content is returned exactly as stored, trailing newline included.
+        """
+        ...
+
+    @abstractmethod
+    def read_file(self, rev: str, path: str) -> str:
+        """Return the content of *path* at *rev*, or empty string if missing.
+
+        Unlike :meth:`read_blob`, leading and trailing whitespace is stripped.
+        """
+        ...
+
+    @abstractmethod
+    def changed_paths(self, old: str, new: str, prefixes: list[str]) -> list[PathChange]:
+        """Return files under *prefixes* that differ between *old* and *new*.
+
+        Renames are detected and reported as a single ``"R"`` change.
+        """
+        ...
+
+    @abstractmethod
+    def resolve_commit(self, ref: str) -> str:
+        """Return the commit SHA *ref* peels to, or empty string."""
+        ...
+
+    @abstractmethod
+    def commit_date(self, ref: str) -> str:
+        """Return the author date of the commit *ref* peels to, as YYYY-MM-DD."""
+        ...
+
+    @abstractmethod
+    def tags(self) -> list[TagInfo]:
+        """Return all tags in semver order (ascending)."""
+        ...
+
+    @abstractmethod
+    def authors(self, old: str | None, new: str) -> list[str]:
+        """Return raw author names of commits in ``old..new`` (or all of *new*)."""
+        ...
+
+    @abstractmethod
+    def history(self, revs: list[str]) -> Iterator[CommitInfo]:
+        """Yield every commit reachable from *revs*.
+
+        Merge commits carry the files they changed against their first
+        parent, which is what a merged PR brought in.
+        """
+        ...
+
+    def for_worker(self) -> GitBackend:
+        """Return an instance that is safe to hand to another process."""
+        return self
+
+    def close(self) -> None:
+        """Release any resources (processes, pipes) held by the backend."""
@@ -0,0 +1,202 @@
+"""Git backend that streams objects through long-lived ``git cat-file`` pipes."""
+
+from __future__ import annotations
+
+import subprocess
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, TypeVar
+
+from scripts.profiling import span
+
+from .subprocess_backend import SubprocessBackend
+
+_T = TypeVar("_T")
+
+
+class GitObjectReader:
+    """Long-lived ``git cat-file`` reader that streams objects over pipes.
+
+    Keeps one ``--batch`` and one ``--batch-check`` process open for the
+    whole run, so reading a blob, listing a tree or resolving a ref costs
+    a pipe round-trip instead of a fresh ``git`` process.
+    """
+
+    def __init__(self, cwd: str | Path) -> None:
+        self._batch = self._spawn("--batch", cwd)
+        self._check = self._spawn("--batch-check", cwd)
+
+    @staticmethod
+    def _spawn(mode: str, cwd: str | Path) -> subprocess.Popen:
+        with span("git", f"cat-file {mode}"):
+            return subprocess.Popen(
+                ["git", "cat-file", mode],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=cwd,
+            )
+
+    @staticmethod
+    def _request(proc: subprocess.Popen, spec: str) -> tuple[str, str, int] | None:
+        """Send *spec* and parse the ``<oid> <type> <size>`` header line."""
+        with span("git-batch", proc.args[-1]):
+            proc.stdin.write(spec.encode() + b"\n")
+            proc.stdin.flush()
+            header = proc.stdout.readline().decode().split()
+        if not header:
+            raise OSError("git cat-file exited unexpectedly")
+        if len(header) != 3:
+            # "<spec> missing" / "<spec> ambiguous"
+            return None
+        oid, obj_type, size = header
+        return oid, obj_type, int(size)
+
+    def info(self, spec: str) -> tuple[str, str, int] | None:
+        """Return ``(oid, type, size)`` for *spec*, or None if it doesn't resolve."""
+        return self._request(self._check, spec)
+
+    def read(self, spec: str) -> tuple[str, str, bytes] | None:
+        """Return ``(oid, type, content)`` for *spec*, or None if missing."""
+        header = self._request(self._batch, spec)
+        if header is None:
+            return None
+        oid, obj_type, size = header
+        data = self._batch.stdout.read(size + 1)
+        if len(data) != size + 1:
+            raise OSError("git cat-file exited unexpectedly")
+        return oid, obj_type, data[:size]  # drop trailing LF
+
+    def rev_parse(self, spec: str) -> str:
+        """Return the object id *spec* resolves to (like ``git rev-parse``)."""
+        header = self.info(spec)
+        return header[0] if header else ""
+
+    def read_text(self, spec: str) -> str:
+        """Return the decoded content of the blob at *spec*, or empty string."""
+        obj = self.read(spec)
+        if obj is None or obj[1] != "blob":
+            return ""
+        return obj[2].decode("utf-8", errors="replace")
+
+    def ls_tree(self, rev: str, prefix: str) -> list[tuple[str, str]]:
+        """Recursively list ``(path, oid)`` under *prefix* at *rev* (like ``ls-tree -r``)."""
+        prefix = prefix.rstrip("/")
+        obj = self.read(f"{rev}:{prefix}")
+        if obj is None or obj[1] != "tree":
+            return []
+        entries: list[tuple[str, str]] = []
+        self._walk_tree(obj[2], len(obj[0]) // 2, prefix + "/", entries)
+        return entries
+
+    def _walk_tree(
+        self, data: bytes, oid_len: int, base: str, entries: list[tuple[str, str]]
+    ) -> None:
+        pos = 0
+        while pos < len(data):
+            space = data.index(b" ", pos)
+            nul = data.index(b"\0", space)
+            mode = data[pos:space]
+            name = data[space + 1 : nul].decode("utf-8", errors="surrogateescape")
+            oid = data[nul + 1 : nul + 1 + oid_len].hex()
+            pos = nul + 1 + oid_len
+            if mode == b"40000":
+                sub = self.read(oid)
+                if sub is not None:
+                    self._walk_tree(sub[2], oid_len, f"{base}{name}/", entries)
+            else:
+                entries.append((base + name, oid))
+
+    def commit_date(self, rev: str) -> str:
+        """Return the author date of the commit *rev* peels to, as YYYY-MM-DD."""
+        obj = self.read(f"{rev}^{{commit}}")
+        if obj is None:
+            return ""
+        for line in obj[2].decode("utf-8", errors="replace").splitlines():
+            if not line:
+                break  # end of headers
+            if line.startswith("author "):
+                # author Name <email> <epoch> <+hhmm>
+                epoch, offset = line.rsplit(" ", 2)[1:]
+                sign = -1 if offset[0] == "-" else 1
+                tz = timezone(sign * timedelta(
+                    hours=int(offset[1:3]), minutes=int(offset[3:5]),
+                ))
+                return datetime.fromtimestamp(int(epoch), tz).strftime("%Y-%m-%d")
+        return ""
+
+    def close(self) -> None:
+        for proc in (self._batch, self._check):
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass  # already gone
+            proc.wait()
+            proc.stdout.close()
+
+
+class BatchBackend(SubprocessBackend):
+    """Reads trees, blobs and commits through a shared :class:`GitObjectReader`.
+
+    The reader is started on first use.  If it can't be started, or
+    ``git cat-file`` dies mid-run (outside a repo, a corrupt object…),
+    every lookup from then on falls back to the per-call subprocess path.
+    Tag listing and history walks are single commands already and are
+    inherited as-is.
+    """
+
+    def __init__(self, cwd: str | Path) -> None:
+        super().__init__(cwd)
+        self._reader: GitObjectReader | None = None
+        self._failed = False
+
+    def _get_reader(self) -> GitObjectReader | None:
+        if self._reader is None and not self._failed:
+            try:
+                self._reader = GitObjectReader(self._cwd)
+            except OSError:
+                self._failed = True
+        return self._reader
+
+    def _read(
+        self, op: Callable[[GitObjectReader], _T], fallback: Callable[..., _T], *args: str
+    ) -> _T:
+        """Return ``op(reader)``, or ``fallback(*args)`` without a working reader."""
+        reader = self._get_reader()
+        if reader is not None:
+            try:
+                return op(reader)
+            except OSError:
+                # cat-file died; don't trust the pipes again.
+                self._failed = True
+                self.close()
+        return fallback(*args)
+
+    def list_tree(self, rev: str, prefix: str) -> list[tuple[str, str]]:
+        return self._read(lambda r: r.ls_tree(rev, prefix), super().list_tree, rev, prefix)
+
+    def read_blob(self, oid: str) -> str:
+        return self._read(lambda r: r.read_text(oid), super().read_blob, oid)
+
+    def read_file(self, rev: str, path: str) -> str:
+        # Match the stripped output of the subprocess path.
+        return self._read(
+            lambda r: r.read_text(f"{rev}:{path}").strip(), super().read_file, rev, path,
+        )
+
+    def resolve_commit(self, ref: str) -> str:
+        return self._read(
+            lambda r: r.rev_parse(f"{ref}^{{commit}}"), super().resolve_commit, ref,
+        )
+
+    def commit_date(self, ref: str) -> str:
+        return self._read(lambda r: r.commit_date(ref), super().commit_date, ref)
+
+    def for_worker(self) -> BatchBackend:
+        # Pipes can't be shared across processes; the copy starts its own.
+        return BatchBackend(self._cwd)
+
+    def close(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
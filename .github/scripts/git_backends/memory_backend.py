@@ -0,0 +1,158 @@
+"""In-memory git backend for benchmarks and tests.
+
+Holds a synthetic repository (commits, trees, blobs, tags) in plain dicts,
+so the diff engine can be exercised at scale without spawning ``git``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Iterator
+
+from .base import CommitInfo, GitBackend, PathChange, TagInfo, diff_trees
+
+
+@dataclass
+class _Commit:
+    parents: list[str]
+    subject: str
+    author: str
+    date: str
+    tree: dict[str, str]  # path -> blob oid
+
+
+def _version_key(name: str) -> list[tuple[int, int, str]]:
+    """Sort key approximating ``git tag --sort=v:refname``."""
+    return [
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in re.split(r"(\d+)", name)
+        if part
+    ]
+
+
+class MemoryBackend(GitBackend):
+    """A synthetic repository built through :meth:`commit` and :meth:`tag`.
+
+    Blob OIDs are real git blob hashes of the content, so identical files
+    share an OID exactly like they would in git.  Only lightweight tags
+    are modelled.
+    """
+
+    def __init__(self) -> None:
+        self._blobs: dict[str, str] = {}
+        self._commits: dict[str, _Commit] = {}
+        self._tags: dict[str, str] = {}
+        self._head = ""
+
+    # -- building ---------------------------------------------------------
+
+    def commit(
+        self,
+        files: dict[str, str | None],
+        subject: str,
+        author: str = "Synthetic Author",
+        date: str = "2024-01-01",
+        parents: list[str] | None = None,
+    ) -> str:
+        """Create a commit and move HEAD to it.
+
+        *files* maps paths to new content (``None`` deletes the path) and is
+        applied on top of the first parent's tree.  *parents* defaults to
+        the current HEAD.
+        """
+        if parents is None:
+            parents = [self._head] if self._head else []
+        tree = dict(self._commits[parents[0]].tree) if parents else {}
+        for path, content in files.items():
+            if content is None:
+                tree.pop(path, None)
+                continue
+            data = content.encode()
+            oid = hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+            self._blobs[oid] = content
+            tree[path] = oid
+
+        seed = f"{len(self._commits)}\0{subject}\0{' '.join(parents)}"
+        sha = hashlib.sha1(seed.encode()).hexdigest()
+        self._commits[sha] = _Commit(parents, subject, author, date, tree)
+        self._head = sha
+        return sha
+
+    def tag(self, name: str, ref: str = "HEAD") -> None:
+        self._tags[name] = self.resolve_commit(ref)
+
+    # -- GitBackend -------------------------------------------------------
+
+    def resolve_commit(self, ref: str) -> str:
+        if ref == "HEAD":
+            return self._head
+        if ref in self._tags:
+            return self._tags[ref]
+        return ref if ref in self._commits else ""
+
+    def _tree(self, rev: str) -> dict[str, str]:
+        commit = self._commits.get(self.resolve_commit(rev))
+        return commit.tree if commit else {}
+
+    def list_tree(self, rev: str, prefix: str) -> list[tuple[str, str]]:
+        return sorted(
+            (path, oid) for path, oid in self._tree(rev).items()
+            if path.startswith(prefix)
+        )
+
+    def changed_paths(self, old: str, new: str, prefixes: list[str]) -> list[PathChange]:
+        old_tree, new_tree = self._tree(old), self._tree(new)
+        return diff_trees(
+            {p: oid for p, oid in old_tree.items() if p.startswith(tuple(prefixes))},
+            {p: oid for p, oid in new_tree.items() if p.startswith(tuple(prefixes))},
+        )
+
+    def read_blob(self, oid: str) -> str:
+        return self._blobs.get(oid, "")
+
+    def read_file(self, rev: str, path: str) -> str:
+        oid = self._tree(rev).get(path)
+        return self._blobs[oid].strip() if oid else ""
+
+    def commit_date(self, ref: str) -> str:
+        commit = self._commits.get(self.resolve_commit(ref))
+        return commit.date if commit else ""
+
+    def tags(self) -> list[TagInfo]:
+        return [
+            TagInfo(name, sha, self._commits[sha].date)
+            for name, sha in sorted(self._tags.items(), key=lambda t: _version_key(t[0]))
+        ]
+
+    def _ancestors(self, sha: str) -> set[str]:
+        seen: set[str] = set()
+        stack = [sha] if sha else []
+        while stack:
+            commit = stack.pop()
+            if commit not in seen:
+                seen.add(commit)
+                stack.extend(self._commits[commit].parents)
+        return seen
+
+    def authors(self, old: str | None, new: str) -> list[str]:
+        reachable = self._ancestors(self.resolve_commit(new))
+        if old:
+            reachable -= self._ancestors(self.resolve_commit(old))
+        return [self._commits[sha].author for sha in sorted(reachable)]
+
+    def history(self, revs: list[str]) -> Iterator[CommitInfo]:
+        reachable: set[str] = set()
+        for rev in revs:
+            reachable |= self._ancestors(self.resolve_commit(rev))
+        for sha in sorted(reachable):
+            commit = self._commits[sha]
+            info = CommitInfo(sha, list(commit.parents), commit.author, commit.subject)
+            if len(commit.parents) > 1:
+                base = self._commits[commit.parents[0]].tree
+                info.files = sorted(
+                    path for path in set(base) | set(commit.tree)
+                    if base.get(path) != commit.tree.get(path)
+                )
+            yield info
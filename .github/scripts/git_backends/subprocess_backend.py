@@ -0,0 +1,131 @@
+"""Git backend that starts one ``git`` subprocess per operation."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import Iterator
+
+from scripts.profiling import span
+
+from .base import CommitInfo, GitBackend, PathChange, TagInfo
+
+_NULL_OID = frozenset({"0" * 40, "0" * 64})
+
+
+class SubprocessBackend(GitBackend):
+    """Runs a fresh ``git`` command for every lookup.
+
+    Simple and always available; the other backends fall back to it.
+    """
+
+    def __init__(self, cwd: str | Path) -> None:
+        self._cwd = Path(cwd)
+
+    def _git(self, *args: str, strip: bool = True) -> str:
+        with span("git", args[0]):
+            result = subprocess.run(
+                ["git", *args],
+                capture_output=True,
+                text=True,
+                cwd=self._cwd,
+            )
+        if result.returncode != 0:
+            return ""
+        return result.stdout.strip() if strip else result.stdout
+
+    def list_tree(self, rev: str, prefix: str) -> list[tuple[str, str]]:
+        entries = []
+        for line in self._git("ls-tree", "-r", rev, prefix).splitlines():
+            # <mode> SP <type> SP <oid> TAB <path>
+            meta, path = line.split("\t", 1)
+            entries.append((path, meta.split()[2]))
+        return entries
+
+    def read_blob(self, oid: str) -> str:
+        return self._git("cat-file", "blob", oid, strip=False)
+
+    def read_file(self, rev: str, path: str) -> str:
+        return self._git("show", f"{rev}:{path}")
+
+    def changed_paths(self, old: str, new: str, prefixes: list[str]) -> list[PathChange]:
+        raw = self._git(
+            "diff-tree", "-r", "-M", "-z", "--raw", "--no-abbrev",
+            old, new, "--", *prefixes,
+        )
+        # -z: ":<mode> <mode> <oid> <oid> <status>\0<path>\0[<path>\0]"
+        fields = raw.split("\0")
+        changes = []
+        i = 0
+        while i < len(fields) and fields[i].startswith(":"):
+            _old_mode, _new_mode, old_oid, new_oid, status = fields[i][1:].split()
+            old_oid = "" if old_oid in _NULL_OID else old_oid
+            new_oid = "" if new_oid in _NULL_OID else new_oid
+            kind = status[0]
+            if kind == "R":
+                old_path, new_path = fields[i + 1], fields[i + 2]
+                i += 3
+            else:
+                old_path = new_path = fields[i + 1]
+                i += 2
+            if kind == "A":
+                old_path = ""
+            elif kind == "D":
+                new_path = ""
+            elif kind != "R":
+                kind = "M"  # type changes and the like
+            changes.append(PathChange(kind, old_path, new_path, old_oid, new_oid))
+        return changes
+
+    def resolve_commit(self, ref: str) -> str:
+        return self._git("rev-parse", f"{ref}^{{commit}}")
+
+    def commit_date(self, ref: str) -> str:
+        return self._git("log", "-1", "--format=%ai", ref).split(" ")[0]
+
+    def tags(self) -> list[TagInfo]:
+        # Annotated tags carry the commit in the peeled (*) fields, which
+        # are empty for lightweight tags.
+        raw = self._git(
+            "for-each-ref", "--sort=v:refname",
+            "--format=%(objectname)%09%(*objectname)%09%(authordate:short)"
+            "%09%(*authordate:short)%09%(refname:strip=2)",
+            "refs/tags",
+        )
+        tags = []
+        for line in raw.splitlines():
+            sha, peeled_sha, date, peeled_date, name = line.split("\t")
+            tags.append(TagInfo(name, peeled_sha or sha, peeled_date or date))
+        return tags
+
+    def authors(self, old: str | None, new: str) -> list[str]:
+        raw = self._git("log", "--format=%aN", f"{old}..{new}" if old else new)
+        return raw.splitlines() if raw else []
+
+    def history(self, revs: list[str]) -> Iterator[CommitInfo]:
+        # Timed over the whole stream, so it includes the caller's per-commit work.
+        with span("git", "log --stream"):
+            proc = subprocess.Popen(
+                [
+                    "git", "log", "--diff-merges=first-parent", "--name-only",
+                    "--format=%x1e%H %P%x1f%aN%x1f%s", *revs,
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                cwd=self._cwd,
+            )
+            commit: CommitInfo | None = None
+            for line in proc.stdout:
+                line = line.rstrip("\n")
+                if line.startswith("\x1e"):
+                    if commit is not None:
+                        yield commit
+                    shas, author, subject = line[1:].split("\x1f", 2)
+                    sha, *parents = shas.split()
+                    commit = CommitInfo(sha, parents, author, subject)
+                elif line and commit is not None and len(commit.parents) > 1:
+                    commit.files.append(line)
+            if commit is not None:
+                yield commit
+            proc.wait()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections import Counter
 from pathlib import Path
+from typing import Mapping
 
 
 # Lookup table for category labels that appear differently in YAML titles.
@@ -114,7 +115,7 @@ def _disambiguate_duplicates(entries: list[dict]) -> None:
 
 
 def _build_type_section(
-    registry: dict[str, dict],
+    registry: Mapping[str, dict],
     category_labels: dict[str, str],
     doc_type: str,
 ) -> list:
@@ -153,13 +154,27 @@ def _build_type_section(
     return section
 
 
+def _build_changelog_section(archives: list[str]) -> str | list:
+    """Build the changelog nav entry, with one sub-page per archived major."""
+    if not archives:
+        return "changelog.md"
+    section: list = ["changelog.md"]
+    for label in archives:
+        section.append({label: f"changelog/{label}.md"})
+    return section
+
+
 def build_nav(
-    workflows: dict[str, dict],
-    actions: dict[str, dict],
+    workflows: Mapping[str, dict],
+    actions: Mapping[str, dict],
     category_labels: dict[str, str],
+    changelog_archives: list[str] | None = None,
 ) -> list:
     """Build the full ``nav`` structure as a nested Python list.
 
+    *changelog_archives* lists archived changelog pages (e.g. ``"1.x"``)
+    written by ``generate_changelog.py --split``, newest first.
+
     The returned list mirrors mkdocs' nav format and can be rendered to
     YAML with :func:`render_nav_yaml`.
     """
@@ -167,7 +182,7 @@ def build_nav(
         {"Home": "index.md"},
         {"Workflows": _build_type_section(workflows, category_labels, "workflows")},
         {"Actions": _build_type_section(actions, category_labels, "actions")},
-        {"Changelog": "changelog.md"},
+        {"Changelog": _build_changelog_section(changelog_archives or [])},
     ]
 
 
@@ -206,14 +221,16 @@ def render_nav_yaml(nav: list) -> str:
 # ---------------------------------------------------------------------------
 
 
-def inject_nav(mkdocs_path: str | Path, nav_yaml: str) -> None:
+def inject_nav(mkdocs_path: str | Path, nav_yaml: str) -> bool:
     """Replace the ``nav:`` section in *mkdocs_path* with *nav_yaml*.
 
     Finds the ``nav:`` line at column 0, then the next top-level key,
-    and replaces everything in between.
+    and replaces everything in between.  The file is only rewritten if
+    that changes it; returns whether it was.
     """
     path = Path(mkdocs_path)
-    lines = path.read_text().splitlines(keepends=True)
+    text = path.read_text()
+    lines = text.splitlines(keepends=True)
 
     nav_start: int | None = None
     nav_end: int | None = None
@@ -234,4 +251,8 @@ def inject_nav(mkdocs_path: str | Path, nav_yaml: str) -> None:
     before = "".join(lines[:nav_start])
     after = "".join(lines[nav_end:])
 
-    path.write_text(before + nav_yaml + "\n" + after)
+    content = before + nav_yaml + "\n" + after
+    if content == text:
+        return False
+    path.write_text(content)
+    return True
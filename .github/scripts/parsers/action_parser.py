@@ -4,19 +4,17 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import yaml
-
+from .documents import load_document
 from .types import ActionSpec, parse_inputs, parse_outputs
 
 
 def parse_action(path: str | Path) -> ActionSpec:
     """Parse a composite action YAML file into an ActionSpec."""
     path = Path(path)
-    with open(path) as f:
-        data = yaml.safe_load(f)
-    data = data or {}
+    doc = load_document(path, "action")
+    data = doc.tree
 
-    name = data.get("name", path.parent.name)
+    name = doc.name
     description = data.get("description", "")
 
     inputs = parse_inputs(data.get("inputs") or {})
@@ -0,0 +1,86 @@
+"""Read-once, parse-once cache of the workflow and action files on disk.
+
+Registry discovery (``scripts.config``) and the spec parsers all need the
+same files: discovery wants each one's name, runner and reusability, the
+parsers its inputs, secrets, outputs and jobs.  :func:`load_document`
+reads a file once and parses it once (with the fields both sides use),
+and hands every caller the same :class:`Document` until the file's
+mtime or size changes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class Document:
+    """One workflow (``workflows/*.yml``) or action (``actions/*/action.yml``) file.
+
+    The parsed tree is shared by every consumer and must not be modified.
+    """
+
+    path: Path
+    kind: str                   # "workflow" or "action"
+    signature: tuple[int, int]  # (mtime_ns, size) when it was read
+    text: str
+
+    @cached_property
+    def tree(self) -> dict:
+        """The YAML document, cut down to the fields the generators use."""
+        # PyYAML is the bulk of this package's import time; load it on first parse.
+        from .yaml_extract import ACTION_FIELDS, WORKFLOW_FIELDS, extract
+
+        fields = WORKFLOW_FIELDS if self.kind == "workflow" else ACTION_FIELDS
+        data = extract(self.text, fields)
+        return data if isinstance(data, dict) else {}
+
+    @property
+    def key(self) -> str:
+        """Registry key: the file stem for workflows, the directory for actions."""
+        return self.path.stem if self.kind == "workflow" else self.path.parent.name
+
+    @property
+    def name(self) -> Any:
+        """The top-level ``name``, or the registry key if there is none."""
+        return self.tree.get("name", self.key)
+
+    @cached_property
+    def trigger(self) -> Any:
+        """The ``on:`` block (``on`` loads as the boolean key True)."""
+        return self.tree.get("on") or self.tree.get(True) or {}
+
+    @property
+    def reusable(self) -> bool:
+        """Whether the workflow declares a ``workflow_call`` trigger."""
+        trigger = self.trigger
+        if isinstance(trigger, (dict, list)):
+            return "workflow_call" in trigger
+        return trigger == "workflow_call"
+
+    @cached_property
+    def runs_on(self) -> str | None:
+        """The first ``runs-on:`` value as written in the file, if any."""
+        for line in self.text.splitlines():
+            stripped = line.strip()
+            if stripped.startswith("runs-on:"):
+                return stripped.split(":", 1)[1].strip()
+        return None
+
+
+_documents: dict[Path, Document] = {}
+
+
+def load_document(path: str | Path, kind: str) -> Document:
+    """Return the :class:`Document` for *path*, re-reading it only if it changed."""
+    path = Path(path)
+    st = path.stat()
+    signature = (st.st_mtime_ns, st.st_size)
+    doc = _documents.get(path)
+    if doc is None or doc.signature != signature or doc.kind != kind:
+        doc = Document(path, kind, signature, path.read_text(encoding="utf-8"))
+        _documents[path] = doc
+    return doc
@@ -76,3 +76,26 @@ def parse_outputs(raw: dict) -> list[OutputSpec]:
             )
         )
     return outputs
+
+
+def workflow_spec_from_dict(data: dict) -> WorkflowSpec:
+    """Rebuild a :class:`WorkflowSpec` from its ``dataclasses.asdict`` form."""
+    return WorkflowSpec(
+        name=data["name"],
+        source_path=data["source_path"],
+        inputs=[InputSpec(**i) for i in data["inputs"]],
+        secrets=[SecretSpec(**s) for s in data["secrets"]],
+        outputs=[OutputSpec(**o) for o in data["outputs"]],
+        jobs=data["jobs"],
+    )
+
+
+def action_spec_from_dict(data: dict) -> ActionSpec:
+    """Rebuild an :class:`ActionSpec` from its ``dataclasses.asdict`` form."""
+    return ActionSpec(
+        name=data["name"],
+        description=data["description"],
+        source_path=data["source_path"],
+        inputs=[InputSpec(**i) for i in data["inputs"]],
+        outputs=[OutputSpec(**o) for o in data["outputs"]],
+    )
@@ -4,22 +4,20 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import yaml
-
+from .documents import load_document
 from .types import InputSpec, OutputSpec, SecretSpec, WorkflowSpec, parse_inputs, parse_outputs
 
 
 def parse_workflow(path: str | Path) -> WorkflowSpec:
     """Parse a reusable workflow YAML file into a WorkflowSpec."""
     path = Path(path)
-    with open(path) as f:
-        data = yaml.safe_load(f)
-    data = data or {}
+    doc = load_document(path, "workflow")
+    data = doc.tree
 
-    name = data.get("name", path.stem)
+    name = doc.name
 
     # Extract workflow_call trigger definition
-    on_block = data.get("on") or data.get(True) or {}
+    on_block = doc.trigger
     workflow_call = {}
     if isinstance(on_block, dict):
         workflow_call = on_block.get("workflow_call", {}) or {}
@@ -0,0 +1,219 @@
+"""Event-based extraction of the few YAML fields the generators read.
+
+``yaml.safe_load`` builds the complete object graph of a file, including
+every job's ``steps:`` and their (often long) ``run:`` scripts.  The
+parsers only need the name, the ``workflow_call`` / action API and the
+``uses:`` references, so :func:`extract` walks the parser's event stream
+and composes only the subtrees selected by a *fields* spec, skipping the
+rest without resolving or constructing it.  The libyaml C parser is used
+when PyYAML was built with it.
+
+A fields spec is a dict mapping keys to either ``True`` (keep the whole
+value) or a nested spec; ``"*"`` matches any key, and a one-element list
+applies its spec to every item of a sequence.  Values that aren't the
+expected collection are kept whole.  Skipped values are still parsed to
+the end of the stream, so a file safe_load rejects (a syntax error after
+the selected fields, a second document) raises here too.
+"""
+
+from __future__ import annotations
+
+from typing import IO, Any
+
+import yaml
+from yaml.events import (
+    AliasEvent,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+)
+from yaml.nodes import MappingNode, ScalarNode, SequenceNode
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_STARTS = (MappingStartEvent, SequenceStartEvent)
+_ENDS = (MappingEndEvent, SequenceEndEvent)
+_STR_TAG = "tag:yaml.org,2002:str"
+_MERGE_TAG = "tag:yaml.org,2002:merge"
+
+_API = {
+    "inputs": True,
+    "secrets": True,
+    "outputs": True,
+}
+
+# ``on`` is a YAML 1.1 boolean, so safe_load keys it as True; a quoted
+# "on" is matched by the same spec entry.
+_KEY_ALIASES = {"on": True}
+
+WORKFLOW_API_FIELDS: dict = {
+    "name": True,
+    True: {"workflow_call": _API},
+}
+
+WORKFLOW_FIELDS: dict = {
+    **WORKFLOW_API_FIELDS,
+    "jobs": {"*": {"runs-on": True, "uses": True, "steps": [{"uses": True}]}},
+}
+
+ACTION_FIELDS: dict = {
+    "name": True,
+    "description": True,
+    "inputs": True,
+    "outputs": True,
+}
+
+NAME_FIELDS: dict = {"name": True}
+
+
+class _Unsupported(Exception):
+    """Raised for constructs the walker can't reproduce (aliases into skipped
+    subtrees, merge keys, multi-document streams); :func:`extract` then falls
+    back to a full load, which also raises wherever safe_load would."""
+
+
+class _Walker:
+    def __init__(self, stream: str | IO) -> None:
+        self.loader = Loader(stream)
+        self.anchors: dict[str, Any] = {}
+
+    def close(self) -> None:
+        self.loader.dispose()
+
+    def document(self, fields: dict) -> Any:
+        loader = self.loader
+        loader.get_event()  # StreamStart
+        if loader.check_event(yaml.StreamEndEvent):
+            return None
+        loader.get_event()  # DocumentStart
+        node = self.select(fields)
+        loader.get_event()  # DocumentEnd
+        if not loader.check_event(yaml.StreamEndEvent):
+            raise _Unsupported("multiple documents")
+        return loader.construct_document(node) if node is not None else None
+
+    def skip(self) -> None:
+        """Consume the events of one node without building it."""
+        get_event = self.loader.get_event
+        depth = 0
+        while True:
+            cls = get_event().__class__
+            if cls in _STARTS:
+                depth += 1
+            elif cls in _ENDS:
+                depth -= 1
+            if depth == 0:
+                return
+
+    def key(self) -> tuple[Any, Any]:
+        """Compose the next mapping key; return ``(node, python_value)``."""
+        loader = self.loader
+        event = loader.peek_event()
+        if isinstance(event, ScalarEvent) and event.anchor is None:
+            tag = self._tag(ScalarNode, event, event.value, event.implicit)
+            if tag == _STR_TAG:
+                loader.get_event()
+                node = ScalarNode(tag, event.value, event.start_mark, event.end_mark,
+                                  style=event.style)
+                return node, event.value
+        node = self.compose()
+        if node.tag == _MERGE_TAG:
+            raise _Unsupported("<<")
+        try:
+            value = loader.construct_object(node)
+            hash(value)
+        except TypeError:  # unhashable (complex) key
+            value = None
+        return node, value
+
+    def _tag(self, kind: type, event: Any, value: str | None, implicit: Any) -> str:
+        if event.tag is None or event.tag == "!":
+            return self.loader.resolve(kind, value, implicit)
+        return event.tag
+
+    def _anchor(self, event: Any, node: Any) -> Any:
+        if event.anchor is not None:
+            self.anchors[event.anchor] = node
+        return node
+
+    def compose(self) -> Any:
+        """Build the node tree for one value from the event stream."""
+        event = self.loader.get_event()
+        if isinstance(event, AliasEvent):
+            if event.anchor not in self.anchors:
+                raise _Unsupported(event.anchor)
+            return self.anchors[event.anchor]
+        if isinstance(event, ScalarEvent):
+            tag = self._tag(ScalarNode, event, event.value, event.implicit)
+            return self._anchor(event, ScalarNode(
+                tag, event.value, event.start_mark, event.end_mark, style=event.style,
+            ))
+        if isinstance(event, SequenceStartEvent):
+            tag = self._tag(SequenceNode, event, None, event.implicit)
+            node = self._anchor(event, SequenceNode(
+                tag, [], event.start_mark, None, flow_style=event.flow_style,
+            ))
+            while not self.loader.check_event(SequenceEndEvent):
+                node.value.append(self.compose())
+            node.end_mark = self.loader.get_event().end_mark
+            return node
+        tag = self._tag(MappingNode, event, None, event.implicit)
+        node = self._anchor(event, MappingNode(
+            tag, [], event.start_mark, None, flow_style=event.flow_style,
+        ))
+        while not self.loader.check_event(MappingEndEvent):
+            node.value.append((self.compose(), self.compose()))
+        node.end_mark = self.loader.get_event().end_mark
+        return node
+
+    def select(self, fields: dict | list | bool) -> Any:
+        """Compose the next value, pruned to *fields*."""
+        loader = self.loader
+        if isinstance(fields, dict) and loader.check_event(MappingStartEvent):
+            event = loader.get_event()
+            tag = self._tag(MappingNode, event, None, event.implicit)
+            node = self._anchor(event, MappingNode(
+                tag, [], event.start_mark, None, flow_style=event.flow_style,
+            ))
+            wildcard = fields.get("*")
+            while not loader.check_event(MappingEndEvent):
+                key, value = self.key()
+                if value is not None:
+                    value = _KEY_ALIASES.get(value, value)
+                sub = fields.get(value, wildcard) if value is not None else None
+                if sub is None:
+                    self.skip()
+                    continue
+                node.value.append((key, self.select(sub)))
+            node.end_mark = loader.get_event().end_mark
+            return node
+        if isinstance(fields, list) and loader.check_event(SequenceStartEvent):
+            event = loader.get_event()
+            tag = self._tag(SequenceNode, event, None, event.implicit)
+            node = self._anchor(event, SequenceNode(
+                tag, [], event.start_mark, None, flow_style=event.flow_style,
+            ))
+            while not loader.check_event(SequenceEndEvent):
+                node.value.append(self.select(fields[0]))
+            node.end_mark = loader.get_event().end_mark
+            return node
+        return self.compose()
+
+
+def extract(stream: str | IO, fields: dict) -> Any:
+    """Load the single YAML document of *stream*, keeping only *fields*.
+
+    Returns what ``yaml.safe_load`` would, minus every mapping entry not
+    selected by *fields*.  Raises ``yaml.YAMLError`` on invalid YAML.
+    """
+    if not isinstance(stream, str):
+        stream = stream.read()
+    walker = _Walker(stream)
+    try:
+        return walker.document(fields)
+    except _Unsupported:
+        return yaml.load(stream, Loader=Loader)
+    finally:
+        walker.close()
@@ -0,0 +1,161 @@
+"""Phase timings, git call counts and trace export for the docs pipelines.
+
+A process-wide :data:`profiler` is always collecting: :func:`phase` marks a
+pipeline phase (discover, parse, enrich, render, index, nav, changelog…)
+and :func:`span` times an individual operation such as a git subprocess.
+Both only take a ``perf_counter`` reading and append an event, so they
+are cheap enough to leave in place; peak memory is tracked only after
+:meth:`Profiler.track_memory` (it slows everything down noticeably).
+
+``--profile PATH`` in generate-docs.py and generate_changelog.py writes a
+JSON summary to PATH and a Chrome trace-event file next to it
+(``PATH.trace.json``, for chrome://tracing or https://ui.perfetto.dev).
+Work done inside process-pool workers isn't recorded.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator
+
+
+@dataclass
+class PhaseStats:
+    calls: int = 0
+    wall_ms: float = 0.0
+    peak_kib: float = 0.0
+
+
+@dataclass
+class SpanStats:
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+class Profiler:
+    """Collects phase and span timings for one process; see the module docstring."""
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._events: list[dict] = []
+        self.phases: dict[str, PhaseStats] = {}
+        self.spans: dict[str, dict[str, SpanStats]] = {}
+        # Peak traced memory seen so far by each open phase, innermost last.
+        self._peaks: list[int] = []
+        self._memory = False
+
+    def track_memory(self) -> None:
+        """Start recording peak memory per phase (via ``tracemalloc``)."""
+        import tracemalloc  # pulls in pickle & co.; only needed with --profile
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._memory = True
+
+    def _event(self, name: str, category: str, start: float, end: float, args: dict) -> None:
+        self._events.append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start - self._origin) * 1e6, 1),
+            "dur": round((end - start) * 1e6, 1),
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+            "args": args,
+        })
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a pipeline phase (and its peak memory, if tracked)."""
+        memory = self._memory
+        if memory:
+            import tracemalloc
+
+            if self._peaks:
+                # Fold the enclosing phase's peak so far before resetting it.
+                self._peaks[-1] = max(self._peaks[-1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            self._peaks.append(0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            stats = self.phases.setdefault(name, PhaseStats())
+            stats.calls += 1
+            stats.wall_ms += (end - start) * 1000
+            args = {}
+            if memory:
+                peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+                stats.peak_kib = max(stats.peak_kib, peak / 1024)
+                args["peak_kib"] = round(peak / 1024, 1)
+            self._event(name, "phase", start, end, args)
+
+    @contextmanager
+    def span(self, category: str, name: str) -> Iterator[None]:
+        """Time one operation, counted under *category* / *name*."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            ms = (end - start) * 1000
+            stats = self.spans.setdefault(category, {}).setdefault(name, SpanStats())
+            stats.calls += 1
+            stats.total_ms += ms
+            stats.max_ms = max(stats.max_ms, ms)
+            self._event(name, category, start, end, {})
+
+    def summary(self) -> dict:
+        """Return the JSON-serializable summary of everything recorded."""
+        spans = {}
+        for category, by_name in self.spans.items():
+            spans[category] = {
+                "calls": sum(s.calls for s in by_name.values()),
+                "total_ms": round(sum(s.total_ms for s in by_name.values()), 3),
+                "by_name": {
+                    name: {k: round(v, 3) for k, v in asdict(s).items()}
+                    for name, s in sorted(by_name.items(), key=lambda i: -i[1].total_ms)
+                },
+            }
+        return {
+            "wall_ms": round((time.perf_counter() - self._origin) * 1000, 3),
+            "peak_memory_tracked": self._memory,
+            "phases": {
+                name: {k: round(v, 3) for k, v in asdict(s).items()}
+                for name, s in self.phases.items()
+            },
+            "spans": spans,
+        }
+
+    def write(self, path: Path) -> tuple[Path, Path]:
+        """Write the summary to *path* and the trace next to it; return both paths."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.summary(), indent=2) + "\n", encoding="utf-8")
+        trace_path = path.with_name(path.stem + ".trace.json")
+        trace = {"traceEvents": self._events, "displayTimeUnit": "ms"}
+        trace_path.write_text(json.dumps(trace), encoding="utf-8")
+        return path, trace_path
+
+
+profiler = Profiler()
+
+
+def phase(name: str):
+    """Shorthand for :meth:`Profiler.phase` on the process-wide profiler."""
+    return profiler.phase(name)
+
+
+def span(category: str, name: str):
+    """Shorthand for :meth:`Profiler.span` on the process-wide profiler."""
+    return profiler.span(category, name)
@@ -0,0 +1,204 @@
+"""Warm-start snapshot of the discovered registries and parsed specs.
+
+Without it, every generate-docs.py run discovers WORKFLOWS/ACTIONS
+(scripts.config) and parses each workflow and action (scripts.parsers)
+from scratch.  :class:`RegistrySnapshot` keeps both results in
+.cache/registry-snapshot.json, along with the ``(mtime_ns, size)`` of
+every file they came from:
+
+* a registry is loaded as-is while the listing fingerprint (every
+  workflows/*.yml, workflows/*.md, actions/*/action.yml and
+  actions/*/README.md, with its stats) is unchanged;
+* otherwise discovery runs again, but only files whose stats changed are
+  read and parsed; entry fields and specs of the others come from the
+  snapshot.
+
+generate-docs.py reads the :meth:`RegistrySnapshot.stale_sources` up
+front (on a process pool with --jobs) and stores them with
+:meth:`RegistrySnapshot.put_source`, so discovery and the parse loop
+then find everything in the snapshot.
+
+The snapshot is tied to a stamp of config.py, the parsers and the
+checkout's location, so editing OVERRIDES or a parser discards it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable
+
+from scripts.config import EXCLUDE, ROOT_DIR
+from scripts.parsers.types import (
+    ActionSpec,
+    WorkflowSpec,
+    action_spec_from_dict,
+    workflow_spec_from_dict,
+)
+
+SNAPSHOT_PATH = ROOT_DIR / ".cache" / "registry-snapshot.json"
+SNAPSHOT_VERSION = 1
+
+# What discovery looks at: adding, removing or touching any of these
+# changes the listing fingerprint.
+_SOURCE_GLOBS = (
+    "workflows/*.yml",
+    "workflows/*.md",
+    "actions/*/action.yml",
+    "actions/*/README.md",
+)
+
+
+def _stamp(root: Path) -> str:
+    """Hash of the code that builds registry entries and specs, plus *root*."""
+    scripts_dir = Path(__file__).resolve().parent
+    digest = hashlib.sha256(str(root).encode())
+    for path in (
+        scripts_dir / "config.py",
+        scripts_dir / "registry_snapshot.py",
+        *sorted((scripts_dir / "parsers").glob("*.py")),
+    ):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _signature(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _round_trips(value: Any) -> bool:
+    """Whether *value* survives JSON unchanged (YAML can also yield dates, int keys…)."""
+    try:
+        return json.loads(json.dumps(value)) == value
+    except (TypeError, ValueError):
+        return False
+
+
+class RegistrySnapshot:
+    """Registries and specs from the last run; see the module docstring.
+
+    With *path* None nothing is read or written, but results are still
+    memoized for the life of the process (``--watch`` rebuilds).
+    """
+
+    def __init__(self, path: Path | None, root: Path = ROOT_DIR) -> None:
+        self.path = path
+        self._root = root
+        self._stamp = _stamp(root) if path is not None else ""
+        # name -> {"listing": fingerprint, "entries": {key: config entry}}
+        self._registries: dict[str, dict] = {}
+        # relative path -> {"signature": [mtime_ns, size], "entry": {...}, "spec": {...}}
+        self._files: dict[str, dict] = {}
+        self._dirty = False
+        if path is None:
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") == SNAPSHOT_VERSION and data.get("stamp") == self._stamp:
+            self._registries = data["registries"]
+            self._files = data["files"]
+
+    def _listing(self) -> str:
+        """Fingerprint of every file discovery looks at, with its stats."""
+        digest = hashlib.sha256()
+        for path in sorted(p for pattern in _SOURCE_GLOBS for p in self._root.glob(pattern)):
+            digest.update(f"{path.relative_to(self._root)}\0{_signature(path)}\n".encode())
+        return digest.hexdigest()
+
+    def _record(self, path: Path, signature: list[int] | None) -> dict:
+        """Return the record for *path*, emptied if its stats no longer match."""
+        rel = path.relative_to(self._root).as_posix()
+        record = self._files.get(rel)
+        if record is None or record["signature"] != signature:
+            record = self._files[rel] = {"signature": signature}
+            self._dirty = True
+        return record
+
+    def registry(self, name: str, discover: Callable[[], dict[str, dict]]) -> dict[str, dict]:
+        """Return registry *name*, calling *discover* unless the listing is unchanged."""
+        listing = self._listing()
+        stored = self._registries.get(name)
+        if stored is not None and stored["listing"] == listing:
+            return stored["entries"]
+        entries = discover()
+        if _round_trips(entries):
+            self._registries[name] = {"listing": listing, "entries": entries}
+            self._dirty = True
+        return entries
+
+    def stale_sources(self) -> list[tuple[str, Path]]:
+        """``(kind, path)`` of each workflow/action whose entry fields or spec aren't stored."""
+        sources = [
+            *(
+                ("workflow", path) for path in sorted(self._root.glob("workflows/*.yml"))
+                if path.stem not in EXCLUDE
+            ),
+            *(("action", path) for path in sorted(self._root.glob("actions/*/action.yml"))),
+        ]
+        return [
+            (kind, path) for kind, path in sources
+            if not {"entry", "spec"} <= self._record(path, _signature(path)).keys()
+        ]
+
+    def entry(self, path: Path, read: Callable[[], dict]) -> dict:
+        """Return the entry fields *read* takes from *path*, calling it only if *path* changed."""
+        record = self._record(path, _signature(path))
+        if "entry" not in record:
+            fields = read()
+            if not self._put(path, "entry", fields):
+                return fields
+        return dict(record["entry"])
+
+    def spec(self, kind: str, path: Path) -> WorkflowSpec | ActionSpec | None:
+        """Return the stored spec of *path* if the file hasn't changed since."""
+        data = self._record(path, _signature(path)).get("spec")
+        if data is None:
+            return None
+        return workflow_spec_from_dict(data) if kind == "workflow" else action_spec_from_dict(data)
+
+    def put_spec(self, path: Path, spec: WorkflowSpec | ActionSpec) -> None:
+        """Store *spec*, parsed from *path*, under the stats :meth:`spec` saw."""
+        self._put(path, "spec", asdict(spec))
+
+    def put_source(self, path: Path, fields: dict, spec: dict) -> None:
+        """Store the entry fields and spec (``asdict`` form) read from a stale source."""
+        self._put(path, "entry", fields)
+        self._put(path, "spec", spec)
+
+    def _put(self, path: Path, section: str, data: Any) -> bool:
+        """Store *data* in *path*'s record under the stats last seen; False if it can't be."""
+        rel = path.relative_to(self._root).as_posix()
+        record = self._files.get(rel) or self._record(path, _signature(path))
+        if record.get(section) == data:
+            return True
+        if not _round_trips(data):
+            return False
+        record[section] = data
+        self._dirty = True
+        return True
+
+    def save(self) -> None:
+        """Write the snapshot if anything changed (no-op without a path)."""
+        if self.path is None or not self._dirty:
+            return
+        files = {
+            rel: record for rel, record in self._files.items()
+            if record["signature"] is not None and (self._root / rel).exists()
+        }
+        data = {
+            "version": SNAPSHOT_VERSION,
+            "stamp": self._stamp,
+            "registries": self._registries,
+            "files": files,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        self._dirty = False
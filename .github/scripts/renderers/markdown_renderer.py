@@ -5,21 +5,55 @@ from __future__ import annotations
 import os
 import re
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from jinja2 import Environment, FileSystemLoader
-
-from scripts.config import ACTIONS, CATEGORY_LABELS, WORKFLOWS
+from scripts.config import ACTIONS, CATEGORY_LABELS, ROOT_DIR, WORKFLOWS
 from scripts.enrichers.base import EnrichmentResult
 from scripts.parsers.types import ActionSpec, InputSpec, WorkflowSpec
+from scripts.profiling import span
 
+if TYPE_CHECKING:
+    from .templates import TemplateRenderer
 
-def _build_env(templates_dir: str | Path) -> Environment:
-    return Environment(
-        loader=FileSystemLoader(str(templates_dir)),
-        keep_trailing_newline=True,
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
+
+TEMPLATE_CACHE_DIR = ROOT_DIR / ".cache" / "jinja"
+
+_renderers: dict[Path, TemplateRenderer] = {}
+_template_cache_dir: Path | None = TEMPLATE_CACHE_DIR
+
+
+def set_template_cache(cache_dir: Path | None) -> None:
+    """Store compiled templates in *cache_dir* (None: compile in memory only)."""
+    global _template_cache_dir
+    _template_cache_dir = cache_dir
+    _renderers.clear()
+
+
+def get_renderer(templates_dir: str | Path) -> TemplateRenderer:
+    """Return the shared :class:`TemplateRenderer` for *templates_dir*."""
+    path = Path(templates_dir).resolve()
+    renderer = _renderers.get(path)
+    if renderer is None:
+        from .templates import TemplateRenderer  # loads Jinja2
+
+        renderer = _renderers[path] = TemplateRenderer(path, _template_cache_dir)
+    return renderer
+
+
+def _write_page(output_path: Path, rendered: str) -> None:
+    """Write *rendered* to *output_path* unless it already holds exactly that.
+
+    Unchanged pages keep their mtime, so ``mkdocs serve`` only rebuilds
+    the pages that really changed.
+    """
+    data = rendered.encode("utf-8")
+    with span("io", "write"):
+        try:
+            if output_path.read_bytes() == data:
+                return
+        except OSError:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(data)
 
 
 def _usage_placeholder(inp: InputSpec) -> str:
@@ -62,6 +96,19 @@ def _resolve_action_link(uses_ref: str, from_output_path: str) -> dict | None:
     return None
 
 
+def internal_links(spec: WorkflowSpec, config: dict) -> list[dict]:
+    """Return the ``{name, link}`` cross-links to internal actions/workflows *spec* uses."""
+    links: list[dict] = []
+    seen: set[str] = set()
+    for _job_name, job_info in spec.jobs.items():
+        for uses_ref in job_info.get("uses", []):
+            link = _resolve_action_link(uses_ref, config["output"])
+            if link and link["name"] not in seen:
+                links.append(link)
+                seen.add(link["name"])
+    return links
+
+
 def render_workflow(
     spec: WorkflowSpec,
     config: dict,
@@ -69,11 +116,13 @@ def render_workflow(
     templates_dir: str | Path,
     output_base: str | Path,
     ref: str = "main",
+    since: dict[tuple[str, str], str] | None = None,
 ) -> Path:
-    """Render a workflow spec to a markdown file."""
-    env = _build_env(templates_dir)
-    template = env.get_template("workflow.md.j2")
+    """Render a workflow spec to a markdown file.
 
+    *since* maps ``(section, name)`` (section being "input", "secret" or
+    "output") to the release it was added in, shown as a "Since" column.
+    """
     # Prepare inputs with usage placeholders
     inputs = []
     required_inputs = []
@@ -92,15 +141,7 @@ def render_workflow(
 
     required_secrets = [s for s in spec.secrets if s.required]
 
-    # Resolve internal action cross-links
-    internal_actions: list[dict] = []
-    seen_actions: set[str] = set()
-    for _job_name, job_info in spec.jobs.items():
-        for uses_ref in job_info.get("uses", []):
-            link = _resolve_action_link(uses_ref, config["output"])
-            if link and link["name"] not in seen_actions:
-                internal_actions.append(link)
-                seen_actions.add(link["name"])
+    internal_actions = internal_links(spec, config)
 
     # Merge enrichment results
     enrichment_parts: list[str] = []
@@ -115,7 +156,8 @@ def render_workflow(
     usage_job_name = config.get("title", "build").lower().replace(" ", "-")
     usage_job_name = re.sub(r"[^a-z0-9-]", "", usage_job_name)
 
-    rendered = template.render(
+    rendered = get_renderer(templates_dir).render(
+        "workflow.md.j2",
         title=config["title"],
         source_path=config["source"],
         runner=config.get("runner", ""),
@@ -132,11 +174,11 @@ def render_workflow(
         enrichment=enrichment_text,
         usage_job_name=usage_job_name,
         ref=ref,
+        since=since or {},
     )
 
     output_path = Path(output_base) / config["output"]
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(rendered, encoding="utf-8")
+    _write_page(output_path, rendered)
     return output_path
 
 
@@ -147,11 +189,9 @@ def render_action(
     templates_dir: str | Path,
     output_base: str | Path,
     ref: str = "main",
+    since: dict[tuple[str, str], str] | None = None,
 ) -> Path:
-    """Render an action spec to a markdown file."""
-    env = _build_env(templates_dir)
-    template = env.get_template("action.md.j2")
-
+    """Render an action spec to a markdown file (*since* as in render_workflow)."""
     inputs = []
     required_inputs = []
     for inp in spec.inputs:
@@ -179,7 +219,8 @@ def render_action(
     # Action path (e.g. actions/android-setup-environment)
     action_path = str(Path(config["source"]).parent)
 
-    rendered = template.render(
+    rendered = get_renderer(templates_dir).render(
+        "action.md.j2",
         title=config["title"],
         source_path=config["source"],
         spec=spec,
@@ -189,11 +230,11 @@ def render_action(
         enrichment=enrichment_text,
         action_path=action_path,
         ref=ref,
+        since=since or {},
     )
 
     output_path = Path(output_base) / config["output"]
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(rendered, encoding="utf-8")
+    _write_page(output_path, rendered)
     return output_path
 
 
@@ -203,14 +244,10 @@ def render_home(
     output_base: str | Path,
 ) -> Path:
     """Render the home page (index.md) with optional What's New section."""
-    env = _build_env(templates_dir)
-    template = env.get_template("home.md.j2")
-
-    rendered = template.render(whats_new=whats_new)
+    rendered = get_renderer(templates_dir).render("home.md.j2", whats_new=whats_new)
 
     output_path = Path(output_base) / "docs" / "index.md"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(rendered, encoding="utf-8")
+    _write_page(output_path, rendered)
     return output_path
 
 
@@ -222,16 +259,13 @@ def render_index(
     output_path: str | Path,
 ) -> Path:
     """Render a category index page."""
-    env = _build_env(templates_dir)
-    template = env.get_template("index.md.j2")
-
-    rendered = template.render(
+    rendered = get_renderer(templates_dir).render(
+        "index.md.j2",
         title=title,
         description=description,
         items=items,
     )
 
     output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(rendered, encoding="utf-8")
+    _write_page(output_path, rendered)
     return output_path
@@ -0,0 +1,67 @@
+"""Jinja2 environment and compiled-template cache used by the markdown renderer.
+
+Kept apart from :mod:`markdown_renderer` so that importing the renderer
+(for its registry helpers, or to build the docs CLI) doesn't load Jinja2;
+:func:`markdown_renderer.get_renderer` imports this module on first use.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from jinja2.bccache import Bucket
+
+
+_ENV_OPTIONS = {
+    "keep_trailing_newline": True,
+    "trim_blocks": True,
+    "lstrip_blocks": True,
+}
+
+
+class _ContentBytecodeCache(FileSystemBytecodeCache):
+    """Compiled-template cache keyed by template name, source hash and options.
+
+    Jinja's own key is the template's file path, so alternating between
+    two versions of a template (docs for several tags) would recompile
+    every time, and a change to the environment options would reuse code
+    compiled with the old ones.
+    """
+
+    def get_bucket(
+        self, environment: Environment, name: str, filename: str | None, source: str
+    ) -> Bucket:
+        checksum = self.get_source_checksum(source)
+        options = ",".join(f"{k}={v}" for k, v in sorted(_ENV_OPTIONS.items()))
+        key = hashlib.sha1(f"{name}|{checksum}|{options}".encode()).hexdigest()
+        bucket = Bucket(environment, key, checksum)
+        self.load_bytecode(bucket)
+        return bucket
+
+
+class TemplateRenderer:
+    """One Jinja environment per templates directory, shared by every render.
+
+    Each template is loaded and compiled once per process; with a cache
+    directory the compiled code is also stored on disk, so later runs
+    skip compilation entirely.  Use :func:`markdown_renderer.get_renderer`
+    for the shared instance.
+    """
+
+    def __init__(self, templates_dir: str | Path, cache_dir: Path | None = None) -> None:
+        bytecode_cache = None
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            bytecode_cache = _ContentBytecodeCache(str(cache_dir))
+        self.env = Environment(
+            loader=FileSystemLoader(str(templates_dir)),
+            bytecode_cache=bytecode_cache,
+            # Templates don't change during a run; skip the mtime checks.
+            auto_reload=False,
+            **_ENV_OPTIONS,
+        )
+
+    def render(self, name: str, **context: object) -> str:
+        return self.env.get_template(name).render(**context)
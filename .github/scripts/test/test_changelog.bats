@@ -0,0 +1,200 @@
+#!/usr/bin/env bats
+
+# Release history queries in generate_changelog.py
+
+load 'test_helper'
+
+setup() {
+  init_repo
+  mkdir -p .github/workflows
+  echo "name: Build" > .github/workflows/build.yml
+  commit_as alice "Add build"
+  git tag 1.2.0
+
+  # Hotfix cut from 1.2.0, released, then merged back into main
+  git checkout -q -b hotfix
+  echo "name: Build (fixed)" > .github/workflows/build.yml
+  commit_as carol "Fix build"
+  git tag 1.2.1
+  git checkout -q main
+  echo "name: Lint" > .github/workflows/lint.yml
+  commit_as dave "Add lint"
+  git -c user.name=erin -c user.email=erin@example.com merge -q --no-ff -m "Merge hotfix" hotfix
+  git tag 2.0.0
+}
+
+@test "contributors cover everything new reaches that old doesn't" {
+  py "$REPO_DIR" <<'PY'
+import sys
+import scripts.generate_changelog as cl
+from scripts.git_backends.subprocess_backend import SubprocessBackend
+
+cl.set_backend(SubprocessBackend(sys.argv[1]))
+assert cl.get_contributors(None, "1.2.0") == ["alice"]
+assert cl.get_contributors("1.2.0", "1.2.1") == ["carol"]
+# The hotfix change is new relative to 1.2.0, even though 1.2.1 shipped it first
+assert cl.get_contributors("1.2.0", "2.0.0") == ["carol", "dave", "erin"]
+assert cl.get_contributors("1.2.1", "2.0.0") == ["dave", "erin"]
+assert cl.get_contributors(None, "2.0.0") == ["alice", "carol", "dave", "erin"]
+PY
+}
+
+# Write a reusable workflow with boolean inputs: reusable_workflow PATH NAME INPUT...
+reusable_workflow() {
+  local path=$1 name=$2
+  shift 2
+  printf 'name: %s\non:\n  workflow_call:\n    inputs:\n' "$name" > "$path"
+  for input in "$@"; do
+    printf '      %s: {type: boolean}\n' "$input" >> "$path"
+  done
+}
+
+@test "api timeline follows a rename, in since() and the CLI history" {
+  install_scripts
+  reusable_workflow .github/workflows/lint.yml Lint strict fast
+  commit_as dave "Add lint inputs"
+  git tag 2.1.0
+  git mv .github/workflows/lint.yml .github/workflows/check.yml
+  commit_as dave "Rename lint to check"
+  git tag 3.0.0
+  # fast is removed, and a new workflow takes over the old name
+  reusable_workflow .github/workflows/check.yml Lint strict
+  reusable_workflow .github/workflows/lint.yml "New lint" verbose
+  commit_as dave "Drop fast, add a new lint"
+  git tag 3.1.0
+  reusable_workflow .github/workflows/check.yml Lint strict fast
+  commit_as dave "Bring fast back"
+  git tag 3.2.0
+
+  changelog > /dev/null
+  py "$REPO_DIR" <<'PY'
+import sys
+import scripts.generate_changelog as cl
+from scripts.api_timeline import ApiTimeline
+
+cl.set_backend(cl.SubprocessBackend(sys.argv[1]))
+assert cl.tag_renames("2.1.0", "3.0.0") == {("workflow", "check"): "lint"}
+timeline = ApiTimeline(f"{sys.argv[1]}/.github/.cache/api-timeline.sqlite")
+since = timeline.since
+assert since("workflow", "check", "3.0.0") == {
+    ("input", "strict"): "2.1.0", ("input", "fast"): "2.1.0",
+}
+assert since("workflow", "check", "3.1.0") == {("input", "strict"): "2.1.0"}
+assert since("workflow", "check", "3.2.0") == {
+    ("input", "strict"): "2.1.0", ("input", "fast"): "3.2.0",
+}
+assert since("workflow", "lint", "3.2.0") == {("input", "verbose"): "3.1.0"}
+timeline.close()
+PY
+
+  python3 .github/scripts/api_timeline.py check > "$BATS_TEST_TMPDIR/check.txt"
+  diff - "$BATS_TEST_TMPDIR/check.txt" <<'TXT'
+2.1.0  workflow input `fast` added (type: `boolean`)
+2.1.0  workflow input `strict` added (type: `boolean`)
+3.1.0  workflow input `fast` removed
+3.2.0  workflow input `fast` added (type: `boolean`)
+TXT
+  python3 .github/scripts/api_timeline.py lint > "$BATS_TEST_TMPDIR/lint.txt"
+  grep -q "3.1.0  workflow input \`verbose\` added" "$BATS_TEST_TMPDIR/lint.txt"
+  [ "$(grep -c 'fast' "$BATS_TEST_TMPDIR/lint.txt")" -eq 1 ]
+}
+
+@test "cached changelog matches a cold build and follows moved tags" {
+  install_scripts
+  out="$BATS_TEST_TMPDIR"
+  changelog --no-timeline --no-cache > /dev/null
+  cp .github/docs/changelog.md "$out/cold.md"
+
+  # Fill the cache, then build from it alone
+  changelog --no-timeline > /dev/null
+  changelog --no-timeline > "$out/warm.log"
+  [ "$(grep -c 'Generated:' "$out/warm.log")" -eq 0 ]
+  grep -q "Cached: 2.0.0" "$out/warm.log"
+  diff "$out/cold.md" .github/docs/changelog.md
+
+  # Move 2.0.0 onto a commit that changes the API
+  printf 'name: Build\non:\n  workflow_call:\n    inputs:\n      strict: {type: boolean}\n' \
+    > .github/workflows/build.yml
+  commit_as dave "Add strict input"
+  git tag -f 2.0.0 > /dev/null
+  changelog --no-timeline > "$out/moved.log"
+  grep -q "Generated: 2.0.0" "$out/moved.log"
+  grep -q "Cached: 1.2.1" "$out/moved.log"
+  grep -q '`strict`' .github/docs/changelog.md
+  cp .github/docs/changelog.md "$out/moved.md"
+
+  changelog --no-timeline --no-cache > /dev/null
+  diff "$out/moved.md" .github/docs/changelog.md
+}
+
+@test "changelog cache is dropped when the generator, a parser or a backend changes" {
+  install_scripts
+  changelog --no-timeline > /dev/null
+  for module in generate_changelog.py parsers/yaml_extract.py git_backends/batch_backend.py; do
+    changelog --no-timeline > "$BATS_TEST_TMPDIR/before.log"
+    grep -q "Cached: 2.0.0" "$BATS_TEST_TMPDIR/before.log"
+    echo "# edited" >> ".github/scripts/$module"
+    changelog --no-timeline > "$BATS_TEST_TMPDIR/after.log"
+    [ "$(grep -c 'Cached:' "$BATS_TEST_TMPDIR/after.log")" -eq 0 ]
+  done
+}
+
+@test "a shallow clone plus snapshots renders the full changelog" {
+  install_scripts
+  snapshots="$BATS_TEST_TMPDIR/snapshots"
+  changelog --no-timeline --no-cache --snapshots "$snapshots" > /dev/null
+  cp .github/docs/changelog.md "$BATS_TEST_TMPDIR/full.md"
+
+  shallow="$BATS_TEST_TMPDIR/shallow"
+  git clone -q --depth 1 "file://$REPO_DIR" "$shallow"
+  git -C "$shallow" fetch -q --depth 1 origin '+refs/tags/*:refs/tags/*'
+  [ "$(git -C "$shallow" rev-list --count HEAD)" -eq 1 ]
+  install_scripts "$shallow"
+
+  python3 "$shallow/.github/scripts/generate_changelog.py" \
+    --no-timeline --no-cache --snapshots "$snapshots" > /dev/null
+  diff "$BATS_TEST_TMPDIR/full.md" "$shallow/.github/docs/changelog.md"
+
+  [ "$(grep -c 'Initial release' "$BATS_TEST_TMPDIR/full.md")" -eq 1 ]
+
+  # Without them every release of the shallow clone looks like a first one
+  python3 "$shallow/.github/scripts/generate_changelog.py" --no-timeline --no-cache > /dev/null
+  [ "$(grep -c 'Initial release' "$shallow/.github/docs/changelog.md")" -eq 3 ]
+}
+
+@test "changelog pages are replaced on close, and a failed run keeps the old ones" {
+  py "$BATS_TEST_TMPDIR/docs" <<'PY'
+import sys
+from pathlib import Path
+from scripts.generate_changelog import ChangelogWriter
+
+docs = Path(sys.argv[1])
+tags = ["2.0.0", "1.2.1", "1.2.0"]
+
+def build(split, fail=False):
+    writer = ChangelogWriter(docs, tags, split)
+    try:
+        for tag in tags:
+            if fail and tag == "1.2.1":
+                raise RuntimeError("boom")
+            writer.write(tag, f"## {tag}\n")
+    except RuntimeError:
+        writer.discard()
+        return
+    writer.close()
+
+build(1)
+main = (docs / "changelog.md").read_text()
+assert "## 1.2.1" not in main
+assert "## 1.2.1" in (docs / "changelog" / "1.x.md").read_text()
+
+build(0, fail=True)
+assert (docs / "changelog.md").read_text() == main
+assert sorted(p.name for p in docs.rglob("*")) == ["1.x.md", "changelog", "changelog.md"]
+
+# Without --split the archive pages, and then their directory, go away
+build(0)
+assert "## 1.2.1" in (docs / "changelog.md").read_text()
+assert [p.name for p in docs.iterdir()] == ["changelog.md"]
+PY
+}
@@ -0,0 +1,144 @@
+#!/usr/bin/env bats
+
+# Incremental page builds in generate-docs.py
+
+load 'test_helper'
+
+setup() {
+  init_repo
+  install_scripts
+  mkdir -p .github/workflows .github/actions/ios-setup
+  cat > .github/workflows/ios-cloud-test.yml <<'YML'
+name: iOS Test
+on:
+  workflow_call:
+    inputs:
+      scheme: {type: string, description: Scheme}
+jobs:
+  test:
+    runs-on: ubuntu-latest
+    steps:
+      - uses: futuredapp/.github/.github/actions/ios-setup@main
+YML
+  cat > .github/workflows/android-cloud-check.yml <<'YML'
+name: Android Check
+on:
+  workflow_call:
+    inputs:
+      gradle: {type: string, description: Gradle task}
+jobs:
+  check:
+    runs-on: ubuntu-latest
+    steps:
+      - run: ./gradlew check
+YML
+  cat > .github/actions/ios-setup/action.yml <<'YML'
+name: iOS Setup
+description: Sets up Xcode
+inputs:
+  xcode: {description: Xcode version}
+runs:
+  using: composite
+  steps: []
+YML
+  commit_as alice "Add workflows"
+  git tag 1.0.0
+}
+
+# Workflow/action pages a docs run rendered (not skipped as up to date), from its log.
+rendered() {
+  sed -n '/^Rendering workflow pages/,/^Generating index pages/p' "$1" \
+    | grep -E '^  (Written|Unchanged):' | sed 's/^.*: //' | sort | tr '\n' ' '
+}
+
+@test "editing one input re-renders only that page" {
+  docs --ref main > /dev/null
+  sed -i 's/description: Scheme/description: Xcode scheme/' .github/workflows/ios-cloud-test.yml
+  docs --ref main > "$BATS_TEST_TMPDIR/docs.log"
+  [ "$(rendered "$BATS_TEST_TMPDIR/docs.log")" = "docs/workflows/ios/cloud-test.md " ]
+  grep -q "Xcode scheme" .github/docs/workflows/ios/cloud-test.md
+}
+
+@test "renaming a linked action re-renders the pages linking to it" {
+  docs --ref main > /dev/null
+  sed -i 's/^name: iOS Setup/name: iOS Environment/' .github/actions/ios-setup/action.yml
+  docs --ref main > "$BATS_TEST_TMPDIR/docs.log"
+  [ "$(rendered "$BATS_TEST_TMPDIR/docs.log")" = \
+    "docs/actions/ios/setup.md docs/workflows/ios/cloud-test.md " ]
+  grep -q "iOS Environment" .github/docs/workflows/ios/cloud-test.md
+}
+
+@test "changing --ref or a template invalidates pages" {
+  docs --ref main > /dev/null
+  docs --ref main > "$BATS_TEST_TMPDIR/same.log"
+  [ "$(rendered "$BATS_TEST_TMPDIR/same.log")" = "" ]
+
+  docs --ref 1.0.0 > "$BATS_TEST_TMPDIR/ref.log"
+  [ "$(rendered "$BATS_TEST_TMPDIR/ref.log")" = \
+    "docs/actions/ios/setup.md docs/workflows/android/cloud-check.md docs/workflows/ios/cloud-test.md " ]
+
+  echo "{# edited #}" >> .github/scripts/templates/action.md.j2
+  docs --ref 1.0.0 > "$BATS_TEST_TMPDIR/template.log"
+  [ "$(rendered "$BATS_TEST_TMPDIR/template.log")" = "docs/actions/ios/setup.md " ]
+}
+
+# Run docs with the registry snapshot, then with --no-cache, and diff the output.
+docs_match_no_cache() {
+  local out="$BATS_TEST_TMPDIR"
+  rm -rf "$out/cached" "$out/cold"
+  docs --ref main --jobs 2 > "$out/cached.log"
+  mkdir "$out/cached" && cp -r .github/docs .github/mkdocs.yml "$out/cached/"
+  docs --ref main --no-cache > /dev/null
+  mkdir "$out/cold" && cp -r .github/docs .github/mkdocs.yml "$out/cold/"
+  diff -r "$out/cached" "$out/cold"
+}
+
+@test "snapshot-backed discovery matches a --no-cache run as files change" {
+  docs --ref main > /dev/null
+
+  # Edited: title, inputs and runner all come from the file
+  sed -i -e 's/^name: iOS Test/name: iOS Unit Tests/' -e 's/ubuntu-latest/macos-latest/' \
+    .github/workflows/ios-cloud-test.yml
+  docs_match_no_cache
+  grep -q "Cached: android-cloud-check" "$BATS_TEST_TMPDIR/cached.log"
+  grep -q "Parsed: ios-cloud-test" "$BATS_TEST_TMPDIR/cached.log"
+  grep -q "iOS Unit Tests" .github/docs/workflows/ios/index.md
+
+  # Added
+  cat > .github/workflows/kmp-cloud-lint.yml <<'YML'
+name: KMP Lint
+on:
+  workflow_call: {}
+jobs:
+  lint:
+    runs-on: ubuntu-latest
+    steps: []
+YML
+  docs_match_no_cache
+  grep -q "Parsed: kmp-cloud-lint" "$BATS_TEST_TMPDIR/cached.log"
+
+  # Deleted
+  rm .github/workflows/android-cloud-check.yml
+  docs_match_no_cache
+  [ "$(grep -c 'android-cloud-check' "$BATS_TEST_TMPDIR/cached.log")" -eq 0 ]
+  [ "$(grep -c 'android/' .github/docs/workflows/index.md)" -eq 0 ]
+}
+
+@test "what's new caches tag diffs for the changelog but not HEAD's" {
+  sed -i 's/scheme: {type: string, description: Scheme}/configuration: {type: string}/' \
+    .github/workflows/ios-cloud-test.yml
+  commit_as alice "Rename scheme input"
+  git tag 1.1.0
+  docs --ref 1.1.0 > /dev/null
+  cache=.github/.cache/changelog.jsonl
+  grep -q '"tag": "1.1.0"' "$cache"
+  cp "$cache" "$BATS_TEST_TMPDIR/cache.jsonl"
+
+  echo "name: Lint" > .github/workflows/lint.yml
+  commit_as alice "Add lint"
+  docs --ref main > /dev/null
+  cmp "$cache" "$BATS_TEST_TMPDIR/cache.jsonl"
+
+  changelog --no-timeline > "$BATS_TEST_TMPDIR/changelog.log"
+  grep -q "Cached: 1.1.0" "$BATS_TEST_TMPDIR/changelog.log"
+}
@@ -0,0 +1,80 @@
+#!/usr/bin/env bats
+
+# Git backends used by generate_changelog.py
+
+load 'test_helper'
+
+setup() {
+  init_repo
+  mkdir -p .github/workflows
+  echo "name: Build" > .github/workflows/build.yml
+  commit_as alice "Add build"
+  git tag 1.0.0
+}
+
+@test "batch backend reads trees and blobs through cat-file" {
+  py "$REPO_DIR" <<'PY'
+import sys
+from scripts.git_backends.batch_backend import BatchBackend
+
+backend = BatchBackend(sys.argv[1])
+[(path, oid)] = backend.list_tree("1.0.0", ".github/workflows")
+assert path == ".github/workflows/build.yml", path
+assert backend.read_blob(oid) == "name: Build\n"
+assert backend._reader is not None
+backend.close()
+PY
+}
+
+@test "batch backend falls back to subprocesses when cat-file dies" {
+  py "$REPO_DIR" <<'PY'
+import sys
+from scripts.git_backends.batch_backend import BatchBackend
+
+backend = BatchBackend(sys.argv[1])
+sha = backend.resolve_commit("1.0.0")
+assert len(sha) == 40, sha
+
+reader = backend._reader
+for proc in (reader._batch, reader._check):
+    proc.kill()
+    proc.wait()
+
+assert backend.resolve_commit("1.0.0") == sha
+assert backend.read_file("1.0.0", ".github/workflows/build.yml") == "name: Build"
+[(_path, oid)] = backend.list_tree("1.0.0", ".github/workflows")
+assert backend.read_blob(oid) == "name: Build\n"  # raw, like the batch path
+assert backend._reader is None
+backend.close()
+PY
+}
+
+@test "every backend returns blobs raw and files stripped" {
+  py "$REPO_DIR" <<'PY'
+import sys
+from scripts.git_backends.batch_backend import BatchBackend
+from scripts.git_backends.memory_backend import MemoryBackend
+from scripts.git_backends.subprocess_backend import SubprocessBackend
+
+memory = MemoryBackend()
+memory.commit({".github/workflows/build.yml": "name: Build\n"}, "Add build")
+memory.tag("1.0.0")
+for backend in (SubprocessBackend(sys.argv[1]), BatchBackend(sys.argv[1]), memory):
+    [(_path, oid)] = backend.list_tree("1.0.0", ".github/workflows")
+    assert backend.read_blob(oid) == "name: Build\n", backend
+    assert backend.read_file("1.0.0", ".github/workflows/build.yml") == "name: Build", backend
+PY
+}
+
+@test "batch backend outside a repository returns empty results" {
+  py "$(mktemp -d)" <<'PY'
+import sys
+from scripts.git_backends.batch_backend import BatchBackend
+
+backend = BatchBackend(sys.argv[1])
+assert backend.resolve_commit("HEAD") == ""
+assert backend.list_tree("HEAD", ".github/workflows") == []
+assert backend.read_file("HEAD", "x.yml") == ""
+backend.close()
+PY
+}
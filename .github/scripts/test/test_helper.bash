@@ -0,0 +1,55 @@
+#!/usr/bin/env bash
+
+# Test helpers for the docs/changelog generator scripts
+
+SCRIPTS_DIR="$BATS_TEST_DIRNAME/.."
+
+# Run a Python snippet from stdin with the scripts package importable.
+# Failed asserts exit non-zero and fail the test.
+py() {
+  PYTHONPATH="$SCRIPTS_DIR/.." python3 - "$@"
+}
+
+# Create an empty git repository in a fresh temp directory and cd into it.
+init_repo() {
+  REPO_DIR=$(mktemp -d)
+  cd "$REPO_DIR"
+  git init -q -b main
+  git config user.name "Test"
+  git config user.email "test@example.com"
+}
+
+# Commit every change in the work tree as AUTHOR: commit AUTHOR MESSAGE
+commit_as() {
+  git add -A
+  git -c user.name="$1" -c user.email="$1@example.com" commit -q -m "$2"
+}
+
+# Copy the generator scripts into the .github/ of repository DIR (default
+# REPO_DIR), where they expect to live, next to a minimal mkdocs.yml.
+# Neither they nor what they generate is picked up by commit_as.
+install_scripts() {
+  local dir=${1:-$REPO_DIR}
+  mkdir -p "$dir/.github"
+  cp -r "$SCRIPTS_DIR" "$dir/.github/scripts"
+  rm -rf "$dir/.github/scripts/test"
+  find "$dir/.github/scripts" -name __pycache__ -prune -exec rm -rf {} +
+  printf 'site_name: Test\nnav:\n  - Home: index.md\n' > "$dir/.github/mkdocs.yml"
+  printf '%s\n' /.github/scripts/ /.github/.cache/ /.github/docs/ /.github/mkdocs.yml \
+    >> "$dir/.git/info/exclude"
+}
+
+# Run the installed generate_changelog.py / generate-docs.py.
+changelog() {
+  python3 "$REPO_DIR/.github/scripts/generate_changelog.py" "$@"
+}
+
+docs() {
+  python3 "$REPO_DIR/.github/scripts/generate-docs.py" "$@"
+}
+
+teardown() {
+  if [ -n "$REPO_DIR" ]; then
+    rm -rf "$REPO_DIR"
+  fi
+}
@@ -0,0 +1,56 @@
+#!/usr/bin/env bats
+
+# Field extraction in parsers/yaml_extract.py
+
+load 'test_helper'
+
+@test "extract keeps only the selected fields" {
+  py <<'PY'
+from scripts.parsers.yaml_extract import WORKFLOW_API_FIELDS, extract
+
+text = """\
+name: Build
+on:
+  workflow_call:
+    inputs:
+      ref: {type: string}
+jobs:
+  build:
+    steps: [{run: make}]
+"""
+assert extract(text, WORKFLOW_API_FIELDS) == {
+    "name": "Build",
+    True: {"workflow_call": {"inputs": {"ref": {"type": "string"}}}},
+}
+PY
+}
+
+@test "extract raises on a syntax error after the selected fields" {
+  py <<'PY'
+import yaml
+from scripts.parsers.yaml_extract import NAME_FIELDS, extract
+
+text = "name: Build\njobs:\n  build: [unclosed\n"
+try:
+    extract(text, NAME_FIELDS)
+except yaml.YAMLError:
+    pass
+else:
+    raise AssertionError("late syntax error not reported")
+PY
+}
+
+@test "extract raises on multiple documents like safe_load" {
+  py <<'PY'
+import yaml
+from scripts.parsers.yaml_extract import NAME_FIELDS, extract
+
+text = "name: Build\n---\nname: Other\n"
+try:
+    extract(text, NAME_FIELDS)
+except yaml.YAMLError:
+    pass
+else:
+    raise AssertionError("second document not reported")
+PY
+}